@@ -0,0 +1,118 @@
+"""
+Async facade for Database
+Runs queries off the event loop: writes on one dedicated thread (SQLite has a
+single writer anyway, so they queue here instead of on the file lock), reads
+on a small pool using the read-only connections
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from logger_config import get_logger
+
+logger = get_logger('async_database')
+
+# Database methods that only read (they use Database.read() and see buffered
+# write-behind rows without flushing them); everything else goes to the writer thread
+READ_METHODS = frozenset({
+    'get_guild_config', 'get_rss_feeds', 'get_all_rss_feeds', 'get_all_guild_configs',
+    'is_article_posted', 'filter_unposted', 'filter_unposted_many', 'count_posted_keys',
+    'get_posted_articles', 'get_cache_stats', 'get_feed_validators', 'get_feed_conditional_stats',
+    'get_body_digest', 'get_body_digest_stats', 'get_circuit_breaker', 'get_circuit_breakers',
+    'get_source_cursor', 'get_api_usage', 'get_pending_posts', 'get_outbox_stats',
+    'get_runtime_stats', 'get_statistics',
+})
+
+# Reads only while write-behind buffers their side effect (get_translation
+# counts the hit); written through, they must run on the writer thread
+BUFFERED_READ_METHODS = frozenset({'get_translation'})
+
+# Not awaitable: generators and hooks that must run on the caller's thread
+SYNC_ONLY = frozenset({'connect', 'read', 'close', 'init_db', 'iter_posted_keys', 'add_posted_listener'})
+
+
+class AsyncDatabase:
+    """
+    Awaitable versions of every Database method
+
+        db = get_database()
+        await db.aio.mark_article_posted(guild_id, article_id, source)
+
+    Writes run in submission order on a single thread, so a coroutine that
+    awaited a write sees it in its next read. Use run()/run_read() for
+    ad-hoc blocks of SQL.
+    """
+
+    def __init__(self, db, read_threads: Optional[int] = None):
+        self.db = db
+        self.read_threads = read_threads or db.pool_size
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._readers: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()  # submit() may come from other threads
+
+        # Statistics
+        self.reads = 0
+        self.writes = 0
+
+    def _executor(self, read: bool) -> ThreadPoolExecutor:
+        with self._lock:
+            if read:
+                if self._readers is None:
+                    self._readers = ThreadPoolExecutor(self.read_threads, thread_name_prefix='db-reader')
+                return self._readers
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(1, thread_name_prefix='db-writer')
+            return self._writer
+
+    async def _submit(self, read: bool, func: Callable, *args, **kwargs) -> Any:
+        if read:
+            self.reads += 1
+        else:
+            self.writes += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(read), functools.partial(func, *args, **kwargs))
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a callable on the writer thread (e.g. a `with db.connect()` block)"""
+        return await self._submit(False, func, *args, **kwargs)
+
+    async def run_read(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a read-only callable on the read pool"""
+        return await self._submit(True, func, *args, **kwargs)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Queue a callable on the writer thread from any thread, without waiting"""
+        self.writes += 1
+        return self._executor(False).submit(func, *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        if name.startswith('_') or name in SYNC_ONLY:
+            raise AttributeError(f"Database.{name} has no async version")
+        method = getattr(self.db, name)
+        if not callable(method):
+            raise AttributeError(f"Database.{name} is not a method")
+        read = name in READ_METHODS
+        buffered = name in BUFFERED_READ_METHODS
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            on_reader = read or (buffered and self.db.write_behind is not None)
+            return await self._submit(on_reader, method, *args, **kwargs)
+
+        setattr(self, name, call)  # build each wrapper once
+        return call
+
+    def close(self, wait: bool = True):
+        """Finish queued queries and stop the threads (they restart on next use)"""
+        with self._lock:
+            executors = (self._writer, self._readers)
+            self._writer = self._readers = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=wait)
+
+    def get_stats(self):
+        return {'reads': self.reads, 'writes': self.writes, 'read_threads': self.read_threads}
@@ -8,11 +8,15 @@ from discord.ext import commands, tasks
 import aiohttp
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List
-import feedparser
+from typing import Dict, List, Optional
 
 from logger_config import get_logger
 from database import get_database
+from utils.http_client import get_http_client
+from utils.response_cache import get_response_cache
+from utils.host_scheduler import get_host_scheduler
+from utils.circuit_breaker import breaker_keys, get_circuit_breakers
+from .news.parsing import get_parse_engine, validate_feed
 
 logger = get_logger('health_checker')
 
@@ -23,6 +27,7 @@ class HealthChecker(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.db = get_database()
+        self.http = get_http_client()
         
         # Health tracking
         self.feed_failures: Dict[int, int] = {}  # feed_id -> failure_count
@@ -47,7 +52,7 @@ class HealthChecker(commands.Cog):
         """Periodic health check for all RSS feeds"""
         logger.info("Starting RSS health check...")
         
-        all_feeds = self.db.get_all_rss_feeds()
+        all_feeds = await self.db.aio.get_all_rss_feeds()
         results = []
         
         for feed in all_feeds:
@@ -61,6 +66,12 @@ class HealthChecker(commands.Cog):
             # Check feed health
             is_healthy, error_msg = await self.check_feed_health(url)
             
+            if is_healthy is None:
+                # Open circuit: nothing was probed, so the failure count stays
+                results.append(f"⏸️ {source_name}: {error_msg}")
+                logger.info(f"Feed '{source_name}' skipped: {error_msg}")
+                continue
+            
             self.feed_last_check[feed_id] = datetime.now()
             
             if is_healthy:
@@ -88,35 +99,57 @@ class HealthChecker(commands.Cog):
         
         logger.info(f"Health check completed: {len(results)} feeds checked")
     
-    async def check_feed_health(self, url: str) -> tuple[bool, str]:
+    async def check_feed_health(self, url: str) -> tuple[Optional[bool], str]:
         """
         Check if RSS feed is accessible and valid
         Returns: (is_healthy, error_message)
+        
+        Shares circuit breakers with the news loop: a feed or host whose
+        circuit is open is not requested and is_healthy is None (not a
+        failure of this check); every other check counts as a probe result.
         """
+        breakers = get_circuit_breakers()
+        keys = breaker_keys(url, url)
+        if not breakers.acquire(keys):
+            return None, f"Circuit open (next probe in {breakers.retry_after(keys) / 60:.0f} min)"
+        
+        try:
+            is_healthy, error_msg, error = await self._probe_feed(url)
+        except BaseException:
+            breakers.release(keys)
+            raise
+        
+        breakers.record(keys, error)
+        return is_healthy, error_msg
+    
+    async def _probe_feed(self, url: str) -> tuple[bool, str, Optional[Exception]]:
+        """Download and validate a feed; returns (is_healthy, error_message, error)"""
+        async def download() -> bytes:
+            timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
+            # Same per-host limits as the news loop
+            async with get_host_scheduler().slot(url), self.http.session.get(url, timeout=timeout) as response:
+                response.raise_for_status()
+                return await response.read()
+        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)) as response:
-                    if response.status != 200:
-                        return False, f"HTTP {response.status}"
-                    
-                    # Check if content is valid RSS/Atom
-                    content = await response.text()
-                    feed = feedparser.parse(content)
-                    
-                    if feed.bozo:  # feedparser's way of saying "this isn't valid XML"
-                        return False, f"Invalid XML: {feed.bozo_exception}"
-                    
-                    if not feed.entries:
-                        return False, "No entries found in feed"
-                    
-                    return True, ""
+            # Shares recent/in-flight downloads with the news loop and other commands
+            content = await get_response_cache().get_or_fetch(url, download)
+            if content is None:
+                # The news loop's conditional GET was answered 304: the feed is up and unchanged
+                return True, "", None
+            
+            # Check if content is valid RSS/Atom (parsed off the event loop)
+            is_valid, error_msg = await get_parse_engine().run(validate_feed, content)
+            return is_valid, error_msg, None if is_valid else ValueError(error_msg)
         
-        except asyncio.TimeoutError:
-            return False, f"Timeout after {self.timeout_seconds}s"
+        except aiohttp.ClientResponseError as e:
+            return False, f"HTTP {e.status}", e
+        except asyncio.TimeoutError as e:
+            return False, f"Timeout after {self.timeout_seconds}s", e
         except aiohttp.ClientError as e:
-            return False, f"Connection error: {str(e)[:50]}"
+            return False, f"Connection error: {str(e)[:50]}", e
         except Exception as e:
-            return False, f"Unknown error: {str(e)[:50]}"
+            return False, f"Unknown error: {str(e)[:50]}", e
     
     async def alert_admin(self, guild_id: int, source_name: str, error: str, failure_count: int):
         """Send alert to admin channel about feed failure"""
@@ -157,18 +190,21 @@ class HealthChecker(commands.Cog):
     async def disable_feed(self, feed_id: int, source_name: str, error: str):
         """Disable feed after too many failures"""
         try:
-            with self.db.connect() as conn:
-                conn.execute('UPDATE rss_feeds SET enabled = 0 WHERE id = ?', (feed_id,))
+            await self.db.aio.set_rss_feed_enabled(feed_id, False)
             
             logger.warning(f"Auto-disabled feed '{source_name}' after {self.max_failures_before_disable} failures")
             
             # Send notification to all guilds using this feed
             feed_info = None
-            for feed in self.db.get_all_rss_feeds():
+            for feed in await self.db.aio.get_all_rss_feeds():
                 if feed['feed_id'] == feed_id:
                     feed_info = feed
                     break
             
+            news_cog = self.bot.get_cog('NewsCog')
+            if feed_info and news_cog:
+                news_cog.invalidate_news_config(feed_info['guild_id'])
+            
             if feed_info:
                 guild = self.bot.get_guild(feed_info['guild_id'])
                 if guild:
@@ -208,6 +244,7 @@ class HealthChecker(commands.Cog):
     async def before_health_check(self):
         """Wait for bot to be ready before starting health checks"""
         await self.bot.wait_until_ready()
+        await get_circuit_breakers().preload()  # breaker lookups then stay off SQLite
         logger.info("Bot ready, health checker starting...")
     
     @commands.command(name='checkfeeds')
@@ -216,7 +253,7 @@ class HealthChecker(commands.Cog):
         """Manually trigger RSS health check (Admin only)"""
         await ctx.send("🔍 Running RSS health check...")
         
-        all_feeds = self.db.get_all_rss_feeds()
+        all_feeds = await self.db.aio.get_all_rss_feeds()
         
         if not all_feeds:
             await ctx.send("No RSS feeds configured.")
@@ -231,6 +268,8 @@ class HealthChecker(commands.Cog):
             
             if is_healthy:
                 results.append(f"✅ **{feed['source_name']}**: Healthy")
+            elif is_healthy is None:
+                results.append(f"⏸️ **{feed['source_name']}**: {error}")
             else:
                 results.append(f"❌ **{feed['source_name']}**: {error}")
         
@@ -252,7 +291,7 @@ class HealthChecker(commands.Cog):
             timestamp=datetime.now()
         )
         
-        all_feeds = self.db.get_all_rss_feeds()
+        all_feeds = await self.db.aio.get_all_rss_feeds()
         
         for feed in all_feeds[:10]:  # Limit to first 10 feeds
             feed_id = feed['feed_id']
@@ -3,7 +3,7 @@ News module for Discord Bot
 Modularized structure for better maintainability
 """
 
-from .models import Article, NewsSource
+from .models import Article, NewsSource, PostPayload
 from .sources import (
     GlassnodeSource,
     SantimentSource,
@@ -20,10 +20,18 @@ from .views import (
     NewsMenuView
 )
 from .formatters import EmbedFormatter
+from .metrics import CycleMetrics
+from .feed_registry import FeedRegistry, normalize_feed_url
+from .engine import CycleEngine, Delivery, FetchJob
+from .parsing import ParseEngine, FeedEntry, get_parse_engine
+from .poll_scheduler import PollScheduler
+from .pipeline import NewsPipeline
+from .text import html_to_text
 
 __all__ = [
     'Article',
     'NewsSource',
+    'PostPayload',
     'GlassnodeSource',
     'SantimentSource',
     'TheBlockSource',
@@ -36,4 +44,16 @@ __all__ = [
     'PresetRSSSelectView',
     'NewsMenuView',
     'EmbedFormatter',
+    'CycleMetrics',
+    'FeedRegistry',
+    'normalize_feed_url',
+    'CycleEngine',
+    'Delivery',
+    'FetchJob',
+    'ParseEngine',
+    'FeedEntry',
+    'get_parse_engine',
+    'PollScheduler',
+    'NewsPipeline',
+    'html_to_text',
 ]
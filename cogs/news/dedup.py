@@ -0,0 +1,118 @@
+"""
+Batched posted-article lookups
+Deliveries that run together (every channel of a fetched feed, feeds that
+finish at once) share one database round trip for their dedup check
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+
+from logger_config import get_logger
+
+logger = get_logger('news_dedup')
+
+PairKey = Tuple[int, str]  # (guild_id, source_key)
+
+
+class PostedFilter:
+    """
+    Coalesce unseen-article checks made in the same loop iteration
+
+    The first check schedules a flush task, so every delivery task started
+    alongside it has queued its candidates by the time the single
+    filter_unposted_many query runs (off the event loop). With a ready PostedIndex only the IDs
+    it cannot answer go to the database.
+    """
+
+    def __init__(self, db, include_queued: bool = False, index=None):
+        self.db = db
+        self.include_queued = include_queued
+        self.index = index
+        self._pending: Dict[PairKey, Set[str]] = {}
+        self._waiters: List[Tuple[PairKey, List[str], asyncio.Future]] = []
+        self._scheduled = False
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        # Statistics
+        self.lookups = 0  # (guild, source) checks requested
+        self.candidates = 0  # article IDs checked
+        self.queries = 0  # filter_unposted_many round trips
+
+    async def unseen(self, guild_id: int, source: str, article_ids: List[str]) -> List[str]:
+        """Candidate IDs not yet posted (or queued) for a guild/source, in order"""
+        if not article_ids:
+            return []
+
+        loop = asyncio.get_running_loop()
+        key = (guild_id, source)
+        future = loop.create_future()
+        self._pending.setdefault(key, set()).update(article_ids)
+        self._waiters.append((key, list(article_ids), future))
+        self.lookups += 1
+        self.candidates += len(article_ids)
+
+        if not self._scheduled:
+            self._scheduled = True
+            task = loop.create_task(self._flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+        return await future
+
+    async def _flush(self):
+        pending, waiters = self._pending, self._waiters
+        self._pending, self._waiters, self._scheduled = {}, [], False
+
+        try:
+            unseen = await self._lookup(pending)
+        except asyncio.CancelledError:
+            for _, _, future in waiters:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Dedup lookup for {len(pending)} guild/source pairs failed: {e}")
+            for _, _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, ids, future in waiters:
+            if not future.done():
+                fresh = set(unseen[key])
+                future.set_result([article_id for article_id in ids if article_id in fresh])
+
+    async def _lookup(self, pending: Dict[PairKey, Set[str]]) -> Dict[PairKey, List[str]]:
+        index = self.index
+        if index is None or not index.ready:
+            self.queries += 1
+            return await self.db.aio.filter_unposted_many(pending, include_queued=self.include_queued)
+
+        unseen: Dict[PairKey, List[str]] = {}
+        unknown: Dict[PairKey, List[str]] = {}
+        for key, ids in pending.items():
+            new, _, maybe = index.classify(key[0], key[1], ids)
+            unseen[key] = new
+            if maybe:
+                unknown[key] = maybe
+        if not unknown:
+            return unseen
+
+        self.queries += 1
+        checked = await self.db.aio.filter_unposted_many(unknown, include_queued=self.include_queued)
+        false_positives = 0
+        for key, ids in unknown.items():
+            fresh = checked[key]
+            false_positives += len(fresh)
+            unseen[key].extend(fresh)
+            fresh = set(fresh)
+            index.remember(key[0], key[1], [article_id for article_id in ids if article_id not in fresh])
+        index.record_false_positives(false_positives)
+        return unseen
+
+    def get_stats(self) -> Dict[str, Optional[float]]:
+        return {
+            'lookups': self.lookups,
+            'candidates': self.candidates,
+            'queries': self.queries,
+            'lookups_per_query': round(self.lookups / self.queries, 1) if self.queries else None,
+        }
@@ -0,0 +1,206 @@
+"""
+Concurrent news cycle engine
+Runs fetch jobs in parallel (bounded) and fans results out to deliveries
+"""
+
+import asyncio
+import hashlib
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from logger_config import get_logger
+from utils.retry import retry_deadline
+from .metrics import CycleMetrics
+from .models import Article
+from .sources import BaseFetcher
+
+logger = get_logger('news_engine')
+
+
+@dataclass
+class Delivery:
+    """One guild channel that should receive a job's articles"""
+
+    guild_id: int
+    channel_id: int
+    source_key: str  # key for posted-article tracking
+    is_vietnamese: bool = False
+    display_name: Optional[str] = None  # overrides Article.source when set
+
+
+@dataclass
+class FetchJob:
+    """One upstream fetch and every delivery that shares its result"""
+
+    key: str  # metrics key ('glassnode', 'rss:<canonical url>', ...)
+    fetcher: BaseFetcher
+    deliveries: List[Delivery] = field(default_factory=list)
+
+    @property
+    def scope(self) -> str:
+        """Short digest of the delivery set (changes when a channel subscribes or leaves)"""
+        keys = sorted(f'{d.guild_id}/{d.channel_id}/{d.source_key}' for d in self.deliveries)
+        return hashlib.blake2b('\n'.join(keys).encode(), digest_size=8).hexdigest()
+
+
+DeliverHandler = Callable[[Delivery, List[Article]], Awaitable[None]]
+FetchedHandler = Callable[[str, List[Article]], None]
+
+
+class CycleEngine:
+    """
+    Run one news cycle concurrently
+
+    Every job is fetched at most once, with at most `fetch_concurrency`
+    fetches in flight. As soon as a job's fetch finishes its deliveries run
+    concurrently, so cycle time follows the slowest feed rather than the sum
+    of all feeds. Translation and posting limits are applied by the deliver
+    handler. Once every delivery of a fetch succeeded the fetcher's body
+    digest is committed; otherwise the next fetch parses the body again so
+    failed posts are retried. The optional on_fetched hook sees every fetch
+    result (an empty list when the fetch failed), e.g. to feed the poll
+    scheduler.
+
+    With a deadline, fetches still running when it passes are left out of the
+    cycle but keep running in the background; their articles are delivered by
+    the next run. A straggler's feed is never fetched twice at the same time,
+    and runs never overlap.
+    """
+
+    def __init__(self, deliver: DeliverHandler, fetch_concurrency: int, on_fetched: Optional[FetchedHandler] = None):
+        self.deliver = deliver
+        self.on_fetched = on_fetched
+        self.fetch_semaphore = asyncio.Semaphore(fetch_concurrency)
+        self._cycle_lock = asyncio.Lock()
+
+        # key -> (job, fetch task) for fetches that missed a cycle deadline
+        self._stragglers: Dict[str, Tuple[FetchJob, asyncio.Task]] = {}
+
+    @property
+    def stragglers(self) -> List[str]:
+        """Keys of fetches carried over from an earlier cycle"""
+        return list(self._stragglers)
+
+    def has_ready_stragglers(self) -> bool:
+        """Whether a carried-over fetch has finished and awaits delivery"""
+        return any(task.done() for _, task in self._stragglers.values())
+
+    async def run(self, jobs: List[FetchJob], metrics: CycleMetrics, deadline: Optional[float] = None):
+        """
+        Run all jobs and wait for every delivery to finish
+
+        Args:
+            jobs: Fetch jobs of this cycle
+            metrics: Cycle metrics to fill in
+            deadline: Fetch time budget in seconds (None waits for every fetch)
+        """
+        async with self._cycle_lock:
+            metrics.budget = deadline
+            loop = asyncio.get_running_loop()
+            until = loop.time() + deadline if deadline is not None else None
+
+            # Finished stragglers are delivered now; running ones are awaited
+            # instead of starting a second fetch of the same feed
+            runs: Dict[str, Tuple[FetchJob, Optional[asyncio.Task]]] = {
+                job.key: (job, None) for job in jobs
+            }
+            for key, (old_job, task) in self._stragglers.items():
+                if key in runs:
+                    runs[key] = (runs[key][0], task)  # due again: reuse the running fetch
+                elif task.done():
+                    runs[key] = (old_job, task)  # finished since the last run: deliver now
+                else:
+                    continue
+                metrics.carried_over += 1
+
+            async with asyncio.TaskGroup() as group:
+                for job, task in runs.values():
+                    group.create_task(self._run_job(job, task, metrics, until))
+
+    async def push(self, job: FetchJob, articles: List[Article]):
+        """
+        Deliver articles that arrived outside a cycle (e.g. a WebSub push)
+
+        Waits for a running cycle to finish so the same article is never
+        posted by a cycle and a push at once.
+        """
+        if not articles:
+            return
+
+        async with self._cycle_lock:
+            async with asyncio.TaskGroup() as group:
+                for delivery in job.deliveries:
+                    group.create_task(self._deliver(job, delivery, articles))
+
+    async def _run_job(self, job: FetchJob, task: Optional[asyncio.Task], metrics: CycleMetrics,
+                       until: Optional[float]):
+        """Fetch one job (or reuse a straggler's fetch) and deliver its articles"""
+        loop = asyncio.get_running_loop()
+        if task is None:
+            task = asyncio.create_task(self._fetch(job, until))
+
+        started = loop.time()
+        try:
+            timeout = None if until is None else max(until - loop.time(), 0)
+            articles, fetch_time = await asyncio.wait_for(asyncio.shield(task), timeout)
+        except TimeoutError:
+            # Keep fetching in the background; the next run picks the result up
+            self._stragglers[job.key] = (job, task)
+            metrics.record_deadline_miss(job.key, loop.time() - started)
+            logger.warning(f"Fetch job {job.key} missed the cycle deadline; continuing in background")
+            return
+        except Exception as e:
+            self._stragglers.pop(job.key, None)
+            logger.error(f"Fetch job {job.key} failed: {e}", exc_info=True)
+            return
+
+        self._stragglers.pop(job.key, None)
+        metrics.record_fetch(job.key, len(articles), unchanged=getattr(job.fetcher, 'last_unchanged', False))
+        metrics.record_fetch_time(job.key, fetch_time)
+
+        delivered = []
+        if articles:
+            async with asyncio.TaskGroup() as group:
+                for delivery in job.deliveries:
+                    metrics.record_served(job.key)
+                    delivered.append(group.create_task(self._deliver(job, delivery, articles)))
+
+        commit = getattr(job.fetcher, 'commit_digest', None)
+        if commit and all(done.result() for done in delivered):
+            try:
+                await commit()
+            except Exception as e:
+                logger.error(f"Error saving body digest of {job.key}: {e}")
+
+    async def _fetch(self, job: FetchJob, until: Optional[float] = None) -> Tuple[List[Article], float]:
+        """Fetch one job, report the result to the on_fetched hook and time it"""
+        loop = asyncio.get_running_loop()
+        articles: List[Article] = []
+        try:
+            # Retries stop once they would end past the cycle deadline
+            with retry_deadline(until):
+                async with self.fetch_semaphore:
+                    started = loop.time()
+                    articles = await job.fetcher.fetch_with_retry(job.scope)
+            return articles, loop.time() - started
+        finally:
+            if self.on_fetched:
+                self.on_fetched(job.key, articles)
+
+    def cancel_stragglers(self):
+        """Cancel background fetches (called when the cog unloads)"""
+        for _, task in self._stragglers.values():
+            task.cancel()
+        self._stragglers.clear()
+
+    async def _deliver(self, job: FetchJob, delivery: Delivery, articles: List[Article]) -> bool:
+        """Deliver articles to one channel; errors never cancel sibling tasks"""
+        try:
+            await self.deliver(delivery, articles)
+        except Exception as e:
+            logger.error(
+                f"Error delivering {job.key} to guild {delivery.guild_id}: {e}",
+                exc_info=True
+            )
+            return False
+        return True
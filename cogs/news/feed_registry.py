@@ -0,0 +1,145 @@
+"""
+Shared RSS feed registry
+Groups identical feed URLs across guilds so each feed is fetched once per cycle
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Any
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .sources import RSSSource
+
+# Query parameters that only track the click and never change feed content
+TRACKING_PARAMS = {
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'utm_id', 'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src',
+}
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_feed_url(url: str) -> str:
+    """
+    Build the canonical key for a feed URL
+
+    http/https are treated as the same feed, the host is lowercased, default
+    ports, fragments, tracking parameters and trailing slashes are dropped and
+    the remaining query parameters are sorted.
+
+    Example:
+        normalize_feed_url('HTTPS://CoinTelegraph.com/rss/?utm_source=x')
+        # -> 'cointelegraph.com/rss'
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f'{host}:{parts.port}'
+
+    path = parts.path.rstrip('/')
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+    )
+
+    return urlunsplit(('', host, path, urlencode(query), '')).lstrip('/')
+
+
+@dataclass
+class FeedSubscriber:
+    """One guild channel subscribed to a feed"""
+
+    guild_id: int
+    channel_id: int
+    name: str
+    url: str  # URL exactly as configured by the guild
+
+    @property
+    def source_key(self) -> str:
+        """Key used for posted-article tracking (unchanged per-guild URL)"""
+        return f'rss:{self.url}'
+
+    @property
+    def is_vietnamese(self) -> bool:
+        """Whether the feed is Vietnamese and needs no translation"""
+        return 'vnexpress' in self.url.lower() or 'vn' in self.name.lower()
+
+
+@dataclass
+class SharedFeed:
+    """A unique feed and every subscriber that receives its entries"""
+
+    key: str
+    source: RSSSource
+    subscribers: List[FeedSubscriber] = field(default_factory=list)
+
+
+class FeedRegistry:
+    """Canonical registry of RSS feeds shared by all guilds"""
+
+    def __init__(self):
+        # canonical key -> fetcher, kept across cycles so per-feed state survives
+        self._sources: Dict[str, RSSSource] = {}
+
+    def build(self, configs: Dict[int, Dict]) -> List[SharedFeed]:
+        """
+        Group every guild's RSS subscriptions by canonical feed URL
+
+        Args:
+            configs: guild_id -> news config (as returned by load_news_config)
+
+        Returns:
+            One SharedFeed per unique feed
+        """
+        feeds: Dict[str, SharedFeed] = {}
+
+        for guild_id, config in configs.items():
+            for feed_config in config.get('rss_feeds', []):
+                subscriber = FeedSubscriber(
+                    guild_id=guild_id,
+                    channel_id=feed_config['channel_id'],
+                    name=feed_config['name'],
+                    url=feed_config['url'],
+                )
+                key = normalize_feed_url(subscriber.url)
+
+                if key not in feeds:
+                    feeds[key] = SharedFeed(key=key, source=self._get_source(key, subscriber))
+                feeds[key].subscribers.append(subscriber)
+
+        # Drop fetchers for feeds nobody subscribes to anymore
+        for key in list(self._sources):
+            if key not in feeds:
+                del self._sources[key]
+
+        return list(feeds.values())
+
+    def _get_source(self, key: str, subscriber: FeedSubscriber) -> RSSSource:
+        """Get (or create) the shared fetcher for a canonical feed"""
+        source = self._sources.get(key)
+
+        # Prefer https when any subscriber configured it
+        if source and source.url.startswith('http://') and subscriber.url.startswith('https://'):
+            source = None
+
+        if source is None:
+            source = RSSSource(subscriber.name, subscriber.url)
+            self._sources[key] = source
+
+        return source
+
+    @staticmethod
+    def dedup_report(feeds: List[SharedFeed]) -> Dict[str, Any]:
+        """Summarize how many fetches were saved by sharing feeds"""
+        subscriptions = sum(len(feed.subscribers) for feed in feeds)
+        unique = len(feeds)
+
+        return {
+            'subscriptions': subscriptions,
+            'unique_feeds': unique,
+            'fetches_saved': subscriptions - unique,
+            'dedup_ratio': round(subscriptions / unique, 2) if unique else 0.0,
+        }
@@ -0,0 +1,121 @@
+"""
+Per-cycle metrics for the news checker
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+
+
+@dataclass
+class CycleMetrics:
+    """Counters collected during one news_checker cycle"""
+
+    started_at: datetime = field(default_factory=datetime.now)
+    finished_at: Optional[datetime] = None
+    guilds: int = 0
+    fetches: Dict[str, int] = field(default_factory=dict)  # source_key -> upstream fetches
+    articles: Dict[str, int] = field(default_factory=dict)  # source_key -> articles fetched
+    served: Dict[str, int] = field(default_factory=dict)  # source_key -> guild deliveries
+    unchanged: Dict[str, int] = field(default_factory=dict)  # source_key -> bodies skipped as unchanged
+    feed_dedup: Dict[str, Any] = field(default_factory=dict)  # FeedRegistry.dedup_report()
+    budget: Optional[float] = None  # fetch deadline in seconds
+    fetch_seconds: Dict[str, float] = field(default_factory=dict)  # source_key -> fetch time
+    deadline_missed: Dict[str, float] = field(default_factory=dict)  # source_key -> seconds waited
+    carried_over: int = 0  # straggler fetches from earlier cycles handled in this one
+
+    def record_fetch(self, source_key: str, article_count: int, unchanged: bool = False):
+        """Record one upstream fetch for a source"""
+        self.fetches[source_key] = self.fetches.get(source_key, 0) + 1
+        self.articles[source_key] = self.articles.get(source_key, 0) + article_count
+        if unchanged:
+            self.unchanged[source_key] = self.unchanged.get(source_key, 0) + 1
+
+    def record_fetch_time(self, source_key: str, seconds: float):
+        """Record how long one fetch took"""
+        self.fetch_seconds[source_key] = seconds
+
+    def record_deadline_miss(self, source_key: str, waited: float):
+        """Record a fetch that was still running when the cycle deadline passed"""
+        self.deadline_missed[source_key] = waited
+
+    def record_served(self, source_key: str):
+        """Record that a fetched source was handed to one guild"""
+        self.served[source_key] = self.served.get(source_key, 0) + 1
+
+    def finish(self):
+        """Mark cycle as finished"""
+        self.finished_at = datetime.now()
+
+    @property
+    def duration(self) -> float:
+        """Cycle wall time in seconds"""
+        end = self.finished_at or datetime.now()
+        return (end - self.started_at).total_seconds()
+
+    @property
+    def overrun(self) -> float:
+        """Seconds the cycle ran past its budget (0 when on time or unbudgeted)"""
+        if self.budget is None:
+            return 0.0
+        return max(self.duration - self.budget, 0.0)
+
+    def slowest(self, n: int = 5) -> List[Tuple[str, float]]:
+        """Top-n slowest fetches; deadline misses count with the time waited so far"""
+        times = {**self.fetch_seconds, **self.deadline_missed}
+        return sorted(times.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def guilds_per_fetch(self, source_key: str) -> float:
+        """How many guilds were served by each upstream fetch of a source"""
+        fetches = self.fetches.get(source_key, 0)
+        if not fetches:
+            return 0.0
+        return self.served.get(source_key, 0) / fetches
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'started_at': self.started_at.isoformat(),
+            'duration': round(self.duration, 2),
+            'guilds': self.guilds,
+            'feed_dedup': self.feed_dedup,
+            'budget': self.budget,
+            'overrun': round(self.overrun, 2),
+            'deadline_missed': sorted(self.deadline_missed),
+            'carried_over': self.carried_over,
+            'sources': {
+                key: {
+                    'fetches': self.fetches.get(key, 0),
+                    'articles': self.articles.get(key, 0),
+                    'unchanged': self.unchanged.get(key, 0),
+                    'guilds_served': self.served.get(key, 0),
+                    'guilds_per_fetch': round(self.guilds_per_fetch(key), 2),
+                }
+                for key in sorted(set(self.fetches) | set(self.served))
+            },
+        }
+
+    def log(self, logger: logging.Logger, slowest: int = 5):
+        """Log a per-source summary of this cycle"""
+        logger.info(f"Cycle finished in {self.duration:.1f}s for {self.guilds} guilds")
+        if self.overrun or self.deadline_missed or self.carried_over:
+            logger.warning(
+                f"  Deadline {self.budget}s: overrun {self.overrun:.1f}s, "
+                f"{len(self.deadline_missed)} fetches missed it, {self.carried_over} carried over"
+            )
+        if self.fetch_seconds or self.deadline_missed:
+            logger.info("  Slowest fetches: " + ", ".join(
+                f"{key} {seconds:.1f}s{' (missed deadline)' if key in self.deadline_missed else ''}"
+                for key, seconds in self.slowest(slowest)
+            ))
+        if self.feed_dedup:
+            logger.info(
+                f"  RSS feeds: {self.feed_dedup['subscriptions']} subscriptions -> "
+                f"{self.feed_dedup['unique_feeds']} unique feeds (dedup ratio {self.feed_dedup['dedup_ratio']})"
+            )
+        for key, stats in self.to_dict()['sources'].items():
+            logger.info(
+                f"  {key}: fetches={stats['fetches']} articles={stats['articles']} unchanged={stats['unchanged']} "
+                f"guilds_served={stats['guilds_served']} guilds/fetch={stats['guilds_per_fetch']}"
+            )
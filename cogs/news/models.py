@@ -50,6 +50,36 @@ class Article:
         }
 
 
+@dataclass
+class PostPayload:
+    """A translated article ready to be posted to one channel"""
+    
+    guild_id: int
+    channel_id: int
+    source_key: str  # key for posted-article tracking
+    article: Article
+    title: str  # translated title
+    description: str  # translated description
+    is_vietnamese: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return {
+            'guild_id': self.guild_id,
+            'channel_id': self.channel_id,
+            'source_key': self.source_key,
+            'article': self.article.to_dict(),
+            'title': self.title,
+            'description': self.description,
+            'is_vietnamese': self.is_vietnamese,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PostPayload':
+        """Rebuild a payload from to_dict() output"""
+        return cls(**{**data, 'article': Article(**data['article'])})
+
+
 @dataclass
 class NewsSource:
     """Represents a news source configuration"""
@@ -0,0 +1,387 @@
+"""
+Feed parsing stage
+CPU-heavy parsing (feedparser, BeautifulSoup) runs through a ParseEngine that
+is switchable between inline, thread-pool and process-pool modes.
+
+Worker functions take raw bytes/strings and return compact, picklable tuples
+so they can run in another process without dragging parser objects across.
+"""
+
+import asyncio
+import multiprocessing
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+import feedparser
+from bs4 import BeautifulSoup
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+from .text import html_to_text, html_to_text_batch  # noqa: F401 (re-exported for parse workers)
+
+logger = get_logger('news_parsing')
+
+PARSE_MODES = ('inline', 'thread', 'process')
+
+STREAM_CHUNK_SIZE = 16 * 1024  # bytes fed to the incremental parser at a time
+MEDIA_NS = '{http://search.yahoo.com/mrss/}'
+RDF_ABOUT = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about'
+
+FEED_HEAD_LIMIT = 64 * 1024  # bytes searched for channel-level <link> tags
+LINK_TAG_RE = re.compile(rb'<(?:[\w-]+:)?link\b[^>]*>', re.IGNORECASE)
+ATTR_RE = re.compile(rb'([\w:-]+)\s*=\s*["\']([^"\']*)["\']')
+
+PHUTCRYPTO_PREFIX = 'https://5phutcrypto.io/'
+PHUTCRYPTO_SKIP = ('/tag/', '/author/', '/goc-nhin/', '/chuyen-sau/')
+H3_RE = re.compile(rb'<h3\b.*?</h3\s*>', re.IGNORECASE | re.DOTALL)
+HREF_RE = re.compile(rb'<a\b[^>]*?\bhref\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+BODY_TAG_RE = re.compile(rb'<body\b', re.IGNORECASE)
+
+
+def _resolve_html_parser(name: str) -> str:
+    """BeautifulSoup tree builder for scraping: lxml (C) when installed, else html.parser"""
+    if name != 'auto':
+        return name
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return 'html.parser'
+    return 'lxml'
+
+
+HTML_PARSER = _resolve_html_parser(bot_config.HTML_PARSER)
+
+
+class FeedEntry(NamedTuple):
+    """Compact, picklable RSS/Atom entry"""
+
+    id: str
+    link: str
+    title: str
+    summary: str
+    published: str
+    image_url: Optional[str] = None
+
+
+class ScrapedLink(NamedTuple):
+    """Compact, picklable article link scraped from an HTML page"""
+
+    url: str
+    title: str
+    image_url: Optional[str] = None
+
+
+# ==================== Worker Functions ====================
+
+def _entry_image(entry) -> Optional[str]:
+    """Extract image URL from media_content or image enclosures"""
+    try:
+        media = entry.get('media_content')
+        if media and 'url' in media[0]:
+            return media[0]['url']
+    except (IndexError, KeyError, TypeError):
+        pass
+
+    try:
+        for enclosure in entry.get('enclosures') or []:
+            if 'image' in enclosure.get('type', '').lower():
+                return enclosure.get('href', '')
+    except (AttributeError, TypeError):
+        pass
+
+    return None
+
+
+def parse_feed_entries(body: bytes, limit: int, strip_html: bool = False) -> List[FeedEntry]:
+    """
+    Parse an RSS/Atom body into at most `limit` FeedEntry tuples
+
+    With strip_html the summary is reduced to plain text in the worker.
+    """
+    feed = feedparser.parse(body)
+
+    entries = []
+    for entry in feed.entries[:limit]:
+        summary = entry.get('summary', entry.get('description', ''))
+        if strip_html:
+            summary = html_to_text(summary)
+
+        entries.append(FeedEntry(
+            id=entry.get('id', ''),
+            link=entry.get('link', ''),
+            title=entry.get('title', ''),
+            summary=summary,
+            published=entry.get('published', ''),
+            image_url=_entry_image(entry),
+        ))
+
+    return entries
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _stream_entry(elem: ET.Element, strip_html: bool) -> FeedEntry:
+    """Build a FeedEntry from an RSS <item> or Atom <entry> element"""
+    fields = {}
+    link = ''
+    image_url = None
+
+    for child in elem:
+        name = _local_name(child.tag)
+        text = (child.text or '').strip()
+
+        if name == 'link':
+            # Atom: <link rel="alternate" href="..."/>, RSS: <link>url</link>
+            href = child.get('href')
+            if href is not None:
+                if child.get('rel', 'alternate') == 'alternate' and not link:
+                    link = href
+            elif text and not link:
+                link = text
+        elif name in ('guid', 'id'):
+            fields.setdefault('id', text)
+        elif name in ('description', 'summary'):
+            fields.setdefault('summary', child.text or '')
+        elif name == 'content' and child.tag.startswith('{http://www.w3.org/2005/Atom}'):
+            fields.setdefault('content', child.text or '')
+        elif name in ('pubDate', 'published', 'date'):
+            fields.setdefault('published', text)
+        elif name == 'updated':
+            fields.setdefault('updated', text)
+        elif name == 'title':
+            fields.setdefault('title', text)
+        elif not image_url and child.tag == f'{MEDIA_NS}content' and child.get('url'):
+            image_url = child.get('url')
+        elif not image_url and name == 'enclosure' and 'image' in child.get('type', '').lower():
+            image_url = child.get('url', '')
+
+    summary = fields.get('summary', fields.get('content', ''))
+    if strip_html:
+        summary = html_to_text(summary)
+
+    return FeedEntry(
+        id=fields.get('id') or elem.get(RDF_ABOUT, ''),
+        link=link,
+        title=fields.get('title', ''),
+        summary=summary,
+        published=fields.get('published') or fields.get('updated', ''),
+        image_url=image_url,
+    )
+
+
+def stream_feed_entries(body: bytes, limit: int, strip_html: bool = False) -> List[FeedEntry]:
+    """
+    Incrementally parse an RSS/Atom body, stopping after `limit` entries
+
+    Bytes after the last needed entry are never parsed and finished elements
+    are cleared, so large feeds cost only what is used. Already-posted
+    entries still count toward the limit: the poll scheduler needs the whole
+    window, and the posted filter drops them downstream. Malformed feeds fall
+    back to feedparser.
+    """
+    parser = ET.XMLPullParser(events=('end',))
+    entries: List[FeedEntry] = []
+
+    try:
+        for offset in range(0, len(body), STREAM_CHUNK_SIZE):
+            parser.feed(body[offset:offset + STREAM_CHUNK_SIZE])
+
+            for _, elem in parser.read_events():
+                if _local_name(elem.tag) not in ('item', 'entry'):
+                    continue
+
+                entries.append(_stream_entry(elem, strip_html))
+                elem.clear()
+                if len(entries) >= limit:
+                    return entries
+
+        parser.close()
+    except ET.ParseError as e:
+        logger.debug(f"Streaming parse failed ({e}); falling back to feedparser")
+        return parse_feed_entries(body, limit, strip_html)
+
+    return entries
+
+
+def find_websub_links(body: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the WebSub hub and self (topic) URLs advertised by a feed
+
+    Only the feed head (before the first item/entry) is scanned, so this is
+    cheap enough to run on the event loop for every download.
+
+    Returns:
+        (hub_url, self_url); either may be None
+    """
+    head = body[:FEED_HEAD_LIMIT]
+    for marker in (b'<item', b'<entry'):
+        end = head.find(marker)
+        if end != -1:
+            head = head[:end]
+
+    hub = self_url = None
+    for tag in LINK_TAG_RE.findall(head):
+        attrs = {key.lower(): value for key, value in ATTR_RE.findall(tag)}
+        rels = attrs.get(b'rel', b'').lower().split()
+        href = attrs.get(b'href')
+        if not href:
+            continue
+        if b'hub' in rels and hub is None:
+            hub = href.decode('utf-8', 'replace')
+        elif b'self' in rels and self_url is None:
+            self_url = href.decode('utf-8', 'replace')
+
+    return hub, self_url
+
+
+def validate_feed(body: bytes) -> Tuple[bool, str]:
+    """Check that a body is a well-formed feed with entries"""
+    feed = feedparser.parse(body)
+
+    if feed.bozo:  # feedparser's way of saying "this isn't valid XML"
+        return False, f"Invalid XML: {feed.bozo_exception}"
+
+    if not feed.entries:
+        return False, "No entries found in feed"
+
+    return True, ""
+
+
+def _is_phutcrypto_article(href: str) -> bool:
+    return href.startswith(PHUTCRYPTO_PREFIX) and not any(skip in href for skip in PHUTCRYPTO_SKIP)
+
+
+def phutcrypto_region(body: bytes, limit: int) -> bytes:
+    """
+    Cut the homepage down to the part holding the first `limit` article cards
+
+    A raw-bytes scan finds the <h3> headings that link to articles; the region
+    runs from <body> (the head's scripts and styles are never parsed) up to
+    the heading after the last one needed, so the trailing cards, sidebar
+    and footer are skipped too.
+    """
+    body_tag = BODY_TAG_RE.search(body)
+    start = body_tag.start() if body_tag else 0
+
+    found = 0
+    for match in H3_RE.finditer(body, start):
+        href = HREF_RE.search(match.group())
+        if href and _is_phutcrypto_article(href.group(1).decode('utf-8', 'replace')):
+            found += 1
+            if found >= limit:
+                # Keep the rest of this card (an image may follow the heading)
+                end = body.find(b'<h3', match.end())
+                return body[start:end if end != -1 else len(body)]
+
+    return body[start:]
+
+
+def extract_phutcrypto_links(body: bytes, limit: int, parser: str = HTML_PARSER) -> List[ScrapedLink]:
+    """Extract article links (title, url, image) from the 5phutcrypto homepage"""
+    soup = BeautifulSoup(phutcrypto_region(body, limit), parser)
+    return links_from_soup(soup, limit)
+
+
+def links_from_soup(soup: BeautifulSoup, limit: int) -> List[ScrapedLink]:
+    """Walk the <h3> article headings of a parsed 5phutcrypto page"""
+    links = []
+    for h3 in soup.find_all('h3'):
+        link_tag = h3.find('a', href=True)
+        if not link_tag or not _is_phutcrypto_article(link_tag['href']):
+            continue
+
+        # Find image
+        image_url = None
+        parent = h3.find_parent()
+        if parent:
+            img = parent.find('img')
+            if img and 'data-src' in img.attrs:
+                image_url = img['data-src']
+            elif img and 'src' in img.attrs and not img['src'].startswith('data:'):
+                image_url = img['src']
+
+        links.append(ScrapedLink(url=link_tag['href'], title=link_tag.get_text(strip=True), image_url=image_url))
+        if len(links) >= limit:
+            break
+
+    return links
+
+
+def _warm_up_worker():
+    """Process initializer: import and exercise the parsers once per worker"""
+    feedparser.parse(b'<rss version="2.0"><channel></channel></rss>')
+    html_to_text('<p>warm</p>')
+    BeautifulSoup('<p>warm</p>', HTML_PARSER).get_text()
+
+
+# ==================== Parse Engine ====================
+
+class ParseEngine:
+    """
+    Run parse worker functions inline, in a thread pool or in a process pool
+
+    - inline: on the event loop (lowest overhead, blocks the loop)
+    - thread: dedicated thread pool (frees the loop from waiting, still holds the GIL)
+    - process: process pool (parsing no longer competes for the bot's GIL)
+    """
+
+    def __init__(self, mode: str = bot_config.PARSE_MODE, workers: int = bot_config.PARSE_POOL_WORKERS):
+        if mode not in PARSE_MODES:
+            raise ValueError(f"Invalid parse mode: {mode} (expected one of {PARSE_MODES})")
+
+        self.mode = mode
+        self.workers = workers
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == 'process':
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_warm_up_worker
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='feed-parse')
+            logger.info(f"Parse engine started: mode={self.mode}, workers={self.workers}")
+
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """Run a worker function according to the configured mode"""
+        if self.mode == 'inline':
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def shutdown(self):
+        """Stop pool workers"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info(f"Parse engine stopped (mode={self.mode})")
+
+
+_parse_engine: Optional[ParseEngine] = None
+
+
+def get_parse_engine() -> ParseEngine:
+    """Get global parse engine instance (singleton)"""
+    global _parse_engine
+
+    if _parse_engine is None:
+        _parse_engine = ParseEngine()
+
+    return _parse_engine
+
+
+def shutdown_parse_pool():
+    """Stop the global parse engine's workers (called on bot shutdown)"""
+    if _parse_engine is not None:
+        _parse_engine.shutdown()
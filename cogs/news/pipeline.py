@@ -0,0 +1,528 @@
+"""
+News ingestion pipeline
+Fetching, dedup and translation of every source, independent of the Discord
+gateway: the bot runs it in-process (INGEST_MODE=inline) or news_worker.py
+runs it in its own process and hands posts over the SQLite outbox
+"""
+
+import asyncio
+from dataclasses import replace
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from deep_translator import GoogleTranslator
+import pytz
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+from database import get_database
+from translation_cache import get_translation_cache
+from utils.rate_limiter import get_rate_limiter
+from utils.http_client import get_http_client
+from utils.response_cache import get_response_cache
+from utils.host_scheduler import get_host_scheduler
+from utils.circuit_breaker import get_circuit_breakers
+from utils.retry import get_retry_policy, get_retry_stats
+from .models import Article, PostPayload
+from .dedup import PostedFilter
+from .posted_index import PostedIndex
+from .sources import (
+    GlassnodeSource,
+    SantimentSource,
+    TheBlockSource,
+    PhutcryptoSource
+)
+from .metrics import CycleMetrics
+from .feed_registry import FeedRegistry
+from .engine import CycleEngine, Delivery, FetchJob
+from .poll_scheduler import PollScheduler
+from .websub import WebSubSubscriber
+
+logger = get_logger('news_pipeline')
+VN_TZ = pytz.timezone('Asia/Ho_Chi_Minh')
+
+PublishHandler = Callable[[Delivery, List[PostPayload]], Awaitable[None]]
+ChannelCheck = Callable[[int], bool]
+
+EMPTY_NEWS_CONFIG = {
+    "glassnode_channel": None,
+    "santiment_channel": None,
+    "5phutcrypto_channel": None,
+    "theblock_channel": None,
+    "rss_feeds": []
+}
+
+
+async def load_news_config(db, guild_id: Optional[int] = None) -> Dict:
+    """Load news configuration for specific guild from database"""
+    if not guild_id:
+        return dict(EMPTY_NEWS_CONFIG)
+
+    try:
+        config = await db.aio.get_guild_config(guild_id)
+
+        # Map database column names to expected keys
+        return {
+            "glassnode_channel": config.get('glassnode_channel'),
+            "santiment_channel": config.get('santiment_channel'),
+            "5phutcrypto_channel": config.get('phutcrypto_channel'),
+            "theblock_channel": config.get('theblock_channel'),
+            "rss_feeds": config.get('rss_feeds', [])
+        }
+    except Exception as e:
+        logger.error(f"Error loading config for guild {guild_id}: {e}")
+        return dict(EMPTY_NEWS_CONFIG)
+
+
+class NewsPipeline:
+    """
+    Poll due sources, drop already-posted articles and translate the rest
+
+    Ready-to-post payloads go to the `publish` handler: the news cog posts
+    them directly, the ingestion worker queues them in the outbox. With
+    `outbox=True` articles already queued (but maybe not yet posted) count
+    as handled too.
+    """
+
+    def __init__(self, publish: PublishHandler, outbox: bool = False):
+        self.publish = publish
+        self.outbox = outbox
+        self.db = get_database()
+        # In-memory posted index answers most dedup checks; kept write-through by the database
+        self.posted_index: Optional[PostedIndex] = PostedIndex() if bot_config.POSTED_INDEX_ENABLED else None
+        if self.posted_index:
+            self.db.add_posted_listener(self.posted_index.add)
+        # One posted-article query for all deliveries that run together
+        self.posted_filter = PostedFilter(self.db, include_queued=outbox, index=self.posted_index)
+        self.cache = get_translation_cache()
+        self.rate_limiter = get_rate_limiter()
+        self.translator = GoogleTranslator(source='auto', target='vi')
+
+        # Initialize news sources
+        self.sources = {
+            'glassnode': GlassnodeSource(),
+            'santiment': SantimentSource(),
+            'theblock': TheBlockSource(),
+            '5phutcrypto': PhutcryptoSource(),
+        }
+
+        # Custom RSS feeds shared across guilds by canonical URL
+        self.feed_registry = FeedRegistry()
+
+        # Adaptive per-feed polling: busy feeds are polled often, quiet ones back off
+        self.poll_scheduler = PollScheduler()
+
+        # Concurrent cycle engine with bounded fetch/translate concurrency
+        self.engine = CycleEngine(
+            self.deliver_articles,
+            bot_config.FETCH_CONCURRENCY,
+            on_fetched=self.record_poll
+        )
+        self.translate_semaphore = asyncio.Semaphore(bot_config.TRANSLATE_CONCURRENCY)
+        self._translations_in_flight: Dict[str, asyncio.Future] = {}
+
+        # Optional WebSub push ingestion for feeds that advertise a hub
+        self.websub: Optional[WebSubSubscriber] = (
+            WebSubSubscriber(self.handle_push) if bot_config.WEBSUB_CALLBACK_URL else None
+        )
+        self._push_jobs: Dict[str, FetchJob] = {}  # topic URL -> job receiving its pushes
+
+        # Metrics of the most recent cycle
+        self.last_cycle_metrics: Optional[CycleMetrics] = None
+        self._commits_before_cycle = self.db.commits
+
+    async def start(self):
+        """Load circuit breakers, warm the posted index and start the WebSub callback server when push ingestion is enabled"""
+        await get_circuit_breakers().preload()
+        if self.posted_index:
+            try:
+                await self.rebuild_posted_index()
+            except Exception as e:
+                logger.error(f"Error warming posted index, dedup falls back to the database: {e}")
+        if self.websub:
+            await self.websub.start()
+
+    async def stop(self):
+        """Cancel background fetches and stop the WebSub server"""
+        self.engine.cancel_stragglers()
+        if self.websub:
+            await self.websub.stop()
+
+    async def rebuild_posted_index(self) -> Dict:
+        """Reload the posted index from the database off the event loop; returns its stats"""
+        if not self.posted_index:
+            raise RuntimeError("Posted index is disabled")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.posted_index.rebuild, self.db, self.outbox)
+
+    # ==================== Translation ====================
+
+    async def translate_to_vietnamese(self, text: str, max_length: Optional[int] = None) -> str:
+        """Translate text to Vietnamese with caching and rate limiting"""
+        if not text:
+            return ""
+
+        try:
+            # Truncate if needed
+            if max_length and len(text) > max_length:
+                text = text[:max_length]
+
+            # Google Translate max 5000 chars
+            if len(text) > 4500:
+                text = text[:4500]
+
+            # Check cache first (skip rate limiting if cached)
+            cached = await self.cache.get_async(text)
+            if cached:
+                return cached
+
+            # Share one API call between guilds translating the same text
+            in_flight = self._translations_in_flight.get(text)
+            if in_flight:
+                return await asyncio.shield(in_flight)
+
+            future = asyncio.get_running_loop().create_future()
+            self._translations_in_flight[text] = future
+            try:
+                translated = await self._translate_uncached(text)
+                future.set_result(translated)
+                return translated
+            except BaseException as e:
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # Mark retrieved; waiters re-raise it themselves
+                raise
+            finally:
+                del self._translations_in_flight[text]
+        except Exception as e:
+            logger.error(f"Translation error: {e}")
+            return text
+
+    async def _translate_uncached(self, text: str) -> str:
+        """Call Google Translate (bounded concurrency, retried) and cache the result"""
+        async def attempt() -> str:
+            async with self.translate_semaphore:
+                # Apply rate limiting before API call
+                await self.rate_limiter.acquire('google_translate')
+
+                # Translate in executor
+                loop = asyncio.get_event_loop()
+                return await loop.run_in_executor(None, self.translator.translate, text)
+
+        # Backoff sleeps happen outside the semaphore
+        translated = await get_retry_policy('translate').call(attempt)
+
+        # Cache the result
+        await self.cache.set_async(text, translated)
+
+        logger.debug(f"Translated: {len(text)} -> {len(translated)} chars")
+        return translated
+
+    # ==================== News Processing ====================
+
+    async def prepare(self, delivery: Delivery, articles: List[Article]) -> List[PostPayload]:
+        """Translate a delivery's new articles into ready-to-post payloads"""
+        unseen = set(await self.posted_filter.unseen(
+            delivery.guild_id, delivery.source_key, [article.id for article in articles]
+        ))
+        articles = [article for article in articles if article.id in unseen]
+        if delivery.display_name:
+            articles = [replace(article, source=delivery.display_name) for article in articles]
+
+        payloads = []
+        for article in articles:
+            # Translate if needed
+            if delivery.is_vietnamese:
+                title = article.title
+                description = article.description or "Không có mô tả"
+            else:
+                title = await self.translate_to_vietnamese(article.title, 250)
+                if article.description:
+                    description = await self.translate_to_vietnamese(article.description, 400)
+                else:
+                    description = "Đọc thêm tại nguồn"
+
+            payloads.append(PostPayload(
+                guild_id=delivery.guild_id,
+                channel_id=delivery.channel_id,
+                source_key=delivery.source_key,
+                article=article,
+                title=title,
+                description=description,
+                is_vietnamese=delivery.is_vietnamese
+            ))
+        return payloads
+
+    async def deliver_articles(self, delivery: Delivery, articles: List[Article]):
+        """Prepare a job's articles for one subscribed channel and publish them"""
+        payloads = await self.prepare(delivery, articles)
+        if payloads:
+            await self.publish(delivery, payloads)
+
+    # ==================== Cycle ====================
+
+    async def run_cycle(self, configs: Dict[int, Dict], channel_exists: ChannelCheck):
+        """
+        Poll every source/feed whose adaptive schedule is due
+
+        Args:
+            configs: News config per guild ID
+            channel_exists: Whether a channel ID can receive posts
+        """
+        metrics = CycleMetrics(guilds=len(configs))
+
+        # Each built-in source and unique RSS feed is fetched once, concurrently,
+        # and its articles are fanned out to every subscribed guild channel
+        jobs = self.plan_cycle(configs, metrics, channel_exists)
+        self.poll_scheduler.sync(job.key for job in jobs)
+        await self.sync_websub(jobs)
+        due = set(self.poll_scheduler.due())
+        jobs = [job for job in jobs if job.key in due]
+        if not jobs and not self.engine.has_ready_stragglers():
+            return
+
+        logger.info(
+            f"NEWS_CHECKER STARTED at {datetime.now(VN_TZ)}: "
+            f"{len(jobs)}/{len(self.poll_scheduler)} sources due for {len(configs)} guilds"
+        )
+        # Feeds still fetching at the deadline are delivered by a later cycle
+        await self.engine.run(jobs, metrics, deadline=bot_config.CYCLE_DEADLINE)
+
+        metrics.finish()
+        metrics.log(logger, slowest=bot_config.CYCLE_SLOWEST_LOGGED)
+        self.last_cycle_metrics = metrics
+
+        # Log cache and connection pool stats every check cycle
+        await self.db.aio.run_read(self.cache.print_stats)
+        http_stats = get_http_client().get_stats()
+        logger.info(
+            f"HTTP pool: {http_stats['total_requests']} requests, "
+            f"{http_stats['reused_connections']} reused / {http_stats['new_connections']} new connections "
+            f"({http_stats['reuse_rate']}% reuse), {http_stats['tls_handshakes']} TLS handshakes"
+        )
+        await self.log_conditional_get_stats()
+        await self.log_response_cache_stats()
+        await self.log_host_stats()
+        self.log_open_circuits()
+        await self.log_retry_stats()
+        await self.log_dedup_stats()
+        await self.log_write_stats()
+
+        next_poll = self.poll_scheduler.seconds_until_next()
+        if next_poll is not None:
+            logger.info(f"Next poll due in {next_poll:.0f}s")
+
+    def plan_cycle(self, configs: Dict[int, Dict], metrics: CycleMetrics,
+                   channel_exists: ChannelCheck) -> List[FetchJob]:
+        """
+        Build this cycle's fetch jobs from all guild configs
+
+        Sources and feeds without a reachable subscribed channel are not fetched.
+        """
+        jobs: List[FetchJob] = []
+
+        # Built-in sources: one job per source
+        for source_name, source in self.sources.items():
+            job = FetchJob(key=source_name, fetcher=source)
+            for guild_id, config in configs.items():
+                channel_id = config.get(f'{source_name}_channel')
+                if channel_id and channel_exists(channel_id):
+                    job.deliveries.append(Delivery(
+                        guild_id=guild_id,
+                        channel_id=channel_id,
+                        source_key=source_name,
+                        is_vietnamese=(source_name == '5phutcrypto')
+                    ))
+            if job.deliveries:
+                jobs.append(job)
+
+        # Custom RSS feeds: one job per unique feed
+        feeds = self.feed_registry.build(configs)
+        report = FeedRegistry.dedup_report(feeds)
+        metrics.feed_dedup = report
+        logger.debug(
+            f"RSS feeds: {report['subscriptions']} subscriptions -> "
+            f"{report['unique_feeds']} unique feeds (dedup ratio {report['dedup_ratio']})"
+        )
+
+        for feed in feeds:
+            job = FetchJob(key=f'rss:{feed.key}', fetcher=feed.source)
+            for subscriber in feed.subscribers:
+                if channel_exists(subscriber.channel_id):
+                    job.deliveries.append(Delivery(
+                        guild_id=subscriber.guild_id,
+                        channel_id=subscriber.channel_id,
+                        source_key=subscriber.source_key,
+                        is_vietnamese=subscriber.is_vietnamese,
+                        # Keep each guild's own feed name on the embed
+                        display_name=subscriber.name
+                    ))
+            if job.deliveries:
+                jobs.append(job)
+
+        return jobs
+
+    def record_poll(self, key: str, articles: List[Article]):
+        """Feed a fetch result to the poll scheduler to schedule the next poll"""
+        new_items = self.poll_scheduler.record(key, [article.id for article in articles])
+        schedule = self.poll_scheduler.get(key)
+        if schedule:
+            logger.debug(
+                f"  {key}: {new_items} new, ~{schedule.rate * 3600:.2f}/h, "
+                f"next poll in {schedule.interval:.0f}s"
+            )
+
+    # ==================== WebSub ====================
+
+    async def sync_websub(self, jobs: List[FetchJob]):
+        """
+        Subscribe to WebSub hubs advertised by polled feeds
+
+        Feeds with an active subscription are only polled every
+        WEBSUB_POLL_INTERVAL as a safety net; pushes are posted as they arrive.
+        """
+        if not self.websub:
+            return
+
+        self._push_jobs = {
+            job.fetcher.topic_url: job
+            for job in jobs
+            if getattr(job.fetcher, 'hub_url', None)
+        }
+
+        for topic, job in self._push_jobs.items():
+            if self.websub.needs_subscribe(topic, job.fetcher.hub_url):
+                await self.websub.subscribe(topic, job.fetcher.hub_url)
+
+            active = self.websub.is_active(topic)
+            self.poll_scheduler.set_min_interval(job.key, bot_config.WEBSUB_POLL_INTERVAL if active else None)
+
+        for topic in self.websub.topics - set(self._push_jobs):
+            await self.websub.unsubscribe(topic)
+
+    async def handle_push(self, topic: str, body: bytes):
+        """Post entries pushed by a WebSub hub to every subscribed channel"""
+        job = self._push_jobs.get(topic)
+        if job is None:
+            logger.warning(f"WebSub push for unknown topic {topic}")
+            return
+
+        articles = await job.fetcher.parse(body)
+        logger.info(f"WebSub push for {job.key}: {len(articles)} entries")
+        await self.engine.push(job, articles)
+
+    # ==================== Stats ====================
+
+    async def log_response_cache_stats(self):
+        """Log feed response cache stats and publish them for the dashboard"""
+        stats = get_response_cache().get_stats()
+        logger.info(
+            f"Response cache: {stats['hits']} hits, {stats['coalesced']} coalesced, "
+            f"{stats['misses']} misses, {stats['evictions']} evictions "
+            f"({stats['entries']} entries, {stats['bytes'] / 1024:.1f} KB)"
+        )
+        try:
+            await self.db.aio.save_runtime_stats('response_cache', stats)
+        except Exception as e:
+            logger.error(f"Error saving response cache stats: {e}")
+
+    async def log_host_stats(self):
+        """Log hosts whose requests had to queue and publish per-host stats for the dashboard"""
+        hosts = get_host_scheduler().get_stats()
+        for host, stats in hosts.items():
+            if stats['waited']:
+                logger.info(
+                    f"Host {host}: {stats['waited']}/{stats['requests']} requests waited "
+                    f"(avg {stats['avg_wait']:.2f}s, max {stats['max_wait']:.2f}s, "
+                    f"queue depth max {stats['max_queued']}, {stats['queued']} queued now)"
+                )
+        try:
+            await self.db.aio.save_runtime_stats('host_scheduler', {'hosts': hosts})
+        except Exception as e:
+            logger.error(f"Error saving host scheduler stats: {e}")
+
+    def log_open_circuits(self):
+        """Log feeds and hosts currently skipped by an open circuit"""
+        circuits = get_circuit_breakers().get_stats()
+        for key, stats in circuits.items():
+            logger.info(
+                f"Circuit {stats['state']} for {key} (probe in {stats['retry_in']}s, "
+                f"{stats['trips']} trips): {stats['last_error']}"
+            )
+
+    async def log_retry_stats(self):
+        """Log retry policy outcomes and publish them for the dashboard"""
+        stats = get_retry_stats()
+        for name, policy in stats.items():
+            if name != 'budget' and policy['retries']:
+                logger.info(
+                    f"Retries ({name}): {policy['retries']} retries over {policy['calls']} calls, "
+                    f"{policy['recovered']} recovered, {policy['failures']} failed, "
+                    f"{policy['budget_stops']} stopped by budget, {policy['deadline_stops']} by deadline"
+                )
+        try:
+            await self.db.aio.save_runtime_stats('retry', stats)
+        except Exception as e:
+            logger.error(f"Error saving retry stats: {e}")
+
+    async def log_dedup_stats(self):
+        """Log how many posted-article checks each dedup query covered"""
+        stats = self.posted_filter.get_stats()
+        logger.info(
+            f"Dedup: {stats['lookups']} channel checks ({stats['candidates']} articles) "
+            f"in {stats['queries']} queries"
+        )
+        if not self.posted_index:
+            return
+        stats = self.posted_index.get_stats()
+        avg_lookup = f"{stats['avg_lookup_us']:.1f}us" if stats['avg_lookup_us'] is not None else 'n/a'
+        logger.info(
+            f"Posted index: {stats['items']} articles, {stats['memory_bytes'] / 1024:.0f} KB, "
+            f"{stats['definitely_new']} new / {stats['recent_hits']} recent hits / "
+            f"{stats['db_fallbacks']} DB fallbacks ({stats['false_positives']} false positives), "
+            f"avg lookup {avg_lookup}"
+        )
+        try:
+            await self.db.aio.save_runtime_stats('posted_index', stats)
+        except Exception as e:
+            logger.error(f"Error saving posted index stats: {e}")
+
+    async def log_write_stats(self):
+        """Log SQLite commits per cycle and write-behind batching, and publish them for the dashboard"""
+        commits = self.db.commits - self._commits_before_cycle
+        stats = {'commits_per_cycle': commits}
+        if self.db.write_behind is not None:
+            stats.update(self.db.write_behind.get_stats())
+            logger.info(
+                f"Database: {commits} commits since the last cycle; write-behind {stats['buffered']} writes "
+                f"in {stats['flushes']} flushes so far ({stats['pending']} pending)"
+            )
+        else:
+            logger.info(f"Database: {commits} commits since the last cycle")
+        try:
+            await self.db.aio.save_runtime_stats('database', stats)
+        except Exception as e:
+            logger.error(f"Error saving database stats: {e}")
+        self._commits_before_cycle = self.db.commits
+
+    async def log_conditional_get_stats(self):
+        """Log 304 rate and bytes saved by conditional GET per feed"""
+        try:
+            feed_stats = await self.db.aio.get_feed_conditional_stats()
+        except Exception as e:
+            logger.error(f"Error loading conditional GET stats: {e}")
+            return
+
+        requests = sum(row['request_count'] for row in feed_stats)
+        not_modified = sum(row['not_modified_count'] for row in feed_stats)
+        saved_kb = sum(row['bytes_saved'] for row in feed_stats) / 1024
+        rate = (not_modified / requests * 100) if requests else 0
+        logger.info(f"Conditional GET: {not_modified}/{requests} not modified ({rate:.1f}%), {saved_kb:.1f} KB saved")
+
+        for row in feed_stats[:5]:
+            logger.debug(
+                f"  {row['url']}: 304 rate {row['not_modified_rate']}%, "
+                f"{row['bytes_saved'] / 1024:.1f} KB saved"
+            )
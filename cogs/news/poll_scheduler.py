@@ -0,0 +1,202 @@
+"""
+Adaptive per-feed poll scheduler
+Polls busy feeds often and quiet feeds rarely, based on observed new items
+"""
+
+import heapq
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from config import BotConfig as bot_config
+
+SEEN_IDS_LIMIT = 200  # article ids remembered per feed to tell new items from old ones
+
+
+@dataclass
+class FeedSchedule:
+    """Polling state of one feed"""
+
+    key: str
+    interval: float  # current poll interval in seconds
+    next_due: float
+    rate: float  # smoothed new items per second
+    last_poll: Optional[float] = None
+    polls: int = 0
+    new_items: int = 0
+    seen_ids: Set[str] = field(default_factory=set)
+    min_interval: Optional[float] = None  # per-feed floor, e.g. a safety net for pushed feeds
+    version: int = 0  # bumps on reschedule; older heap entries are stale
+
+
+class PollScheduler:
+    """
+    Priority queue of next-due poll times, one entry per feed
+
+    Each poll reports the article ids it saw. Ids not seen before count as
+    new arrivals and update an exponentially smoothed publish rate. The next
+    interval aims for `target_items` new items per poll, clamped to
+    [min_interval, max_interval]; polls without new items decay the rate, so
+    quiet feeds back off gradually. A poll where every item is new may have
+    missed items beyond the feed page, so the interval is at least halved.
+    Every interval gets +/- `jitter` so polls spread out instead of bursting
+    together.
+
+    Times are plain floats from `clock` (time.monotonic by default) so the
+    scheduler can be driven by a simulated clock.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = bot_config.POLL_MIN_INTERVAL,
+        max_interval: float = bot_config.POLL_MAX_INTERVAL,
+        initial_interval: float = bot_config.NEWS_CHECK_INTERVAL,
+        jitter: float = bot_config.POLL_JITTER,
+        smoothing: float = 0.3,
+        target_items: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial_interval = min(max(initial_interval, min_interval), max_interval)
+        self.jitter = jitter
+        self.smoothing = smoothing
+        self.target_items = target_items
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        self._feeds: Dict[str, FeedSchedule] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._feeds)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._feeds
+
+    def get(self, key: str) -> Optional[FeedSchedule]:
+        """Polling state of one feed"""
+        return self._feeds.get(key)
+
+    def sync(self, keys: Iterable[str], now: Optional[float] = None):
+        """
+        Track exactly the given feeds
+
+        New feeds are due within one initial interval (spread by jitter, so a
+        restart does not poll everything at once); removed feeds are dropped.
+        """
+        now = self.clock() if now is None else now
+        keys = set(keys)
+
+        for key in list(self._feeds):
+            if key not in keys:
+                del self._feeds[key]
+
+        for key in keys - set(self._feeds):
+            schedule = FeedSchedule(
+                key=key,
+                interval=self.initial_interval,
+                next_due=now,
+                rate=self.target_items / self.initial_interval,
+            )
+            self._feeds[key] = schedule
+            self._push(schedule, now + self.rng.uniform(0, self.initial_interval * self.jitter))
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Pop every feed whose poll is due; each is rescheduled by record()"""
+        now = self.clock() if now is None else now
+        keys = []
+
+        while self._heap and self._heap[0][0] <= now:
+            _, version, key = heapq.heappop(self._heap)
+            schedule = self._feeds.get(key)
+            if schedule is None or schedule.version != version:
+                continue  # removed or rescheduled since this entry was pushed
+            keys.append(key)
+
+        return keys
+
+    def record(self, key: str, article_ids: Iterable[str], now: Optional[float] = None) -> int:
+        """
+        Record one poll of a feed and schedule its next poll
+
+        Returns:
+            Number of new (previously unseen) articles
+        """
+        now = self.clock() if now is None else now
+        schedule = self._feeds.get(key)
+        if schedule is None:
+            return 0
+
+        ids = set(article_ids)
+
+        # Without known ids (first poll, or bodies skipped as unchanged since a
+        # restart) the current page is only a baseline, not new arrivals
+        new_count = len(ids - schedule.seen_ids) if schedule.seen_ids else 0
+
+        if schedule.last_poll is not None:
+            elapsed = max(now - schedule.last_poll, 1e-6)
+            schedule.rate += self.smoothing * (new_count / elapsed - schedule.rate)
+            interval = self._interval_for(schedule.rate)
+            if new_count and new_count == len(ids):
+                interval = max(min(interval, schedule.interval / 2), self.min_interval)
+            schedule.interval = interval
+
+        if schedule.min_interval is not None:
+            schedule.interval = max(schedule.interval, schedule.min_interval)
+
+        schedule.seen_ids |= ids
+        if len(schedule.seen_ids) > SEEN_IDS_LIMIT:
+            schedule.seen_ids = ids  # the current page is what matters for the next diff
+
+        schedule.last_poll = now
+        schedule.polls += 1
+        schedule.new_items += new_count
+
+        spread = 1 + self.rng.uniform(-self.jitter, self.jitter)
+        self._push(schedule, now + schedule.interval * spread)
+        return new_count
+
+    def set_min_interval(self, key: str, seconds: Optional[float]):
+        """
+        Set (or clear with None) a per-feed interval floor
+
+        Applies from the feed's next recorded poll; the floor may exceed
+        max_interval (feeds that receive WebSub pushes are only polled as a
+        slow safety net).
+        """
+        schedule = self._feeds.get(key)
+        if schedule is not None:
+            schedule.min_interval = seconds
+
+    def _interval_for(self, rate: float) -> float:
+        """Poll interval expected to find target_items new items"""
+        if rate <= 0:
+            return self.max_interval
+        return min(max(self.target_items / rate, self.min_interval), self.max_interval)
+
+    def _push(self, schedule: FeedSchedule, due: float):
+        schedule.version += 1
+        schedule.next_due = due
+        heapq.heappush(self._heap, (due, schedule.version, schedule.key))
+
+    def seconds_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest due poll (None when nothing is scheduled)"""
+        if not self._feeds:
+            return None
+        now = self.clock() if now is None else now
+        return max(min(s.next_due for s in self._feeds.values()) - now, 0.0)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-feed interval, learned rate and poll counts"""
+        return {
+            key: {
+                'interval': round(s.interval, 1),
+                'items_per_hour': round(s.rate * 3600, 2),
+                'polls': s.polls,
+                'new_items': s.new_items,
+            }
+            for key, s in sorted(self._feeds.items())
+        }
@@ -0,0 +1,228 @@
+"""
+In-process posted-article index
+A Bloom filter over every posted (guild, source, article) answers "definitely
+new" without touching SQLite; exact per-(guild, source) recent sets answer
+"already posted" for the IDs feeds keep returning. Only Bloom positives
+missing from the recent sets go to the database.
+"""
+
+import math
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+
+logger = get_logger('posted_index')
+
+PairKey = Tuple[int, str]  # (guild_id, source_key)
+PostedKey = Tuple[int, str, str]  # (guild_id, source_key, article_id)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter with double hashing over one 64-bit hash"""
+
+    def __init__(self, capacity: int, fp_rate: float):
+        capacity = max(capacity, 1)
+        self.bits = max(64, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, key: Tuple) -> List[int]:
+        # Builtin hash: the filter is rebuilt per process, so salted hashes are fine
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+
+    def add(self, key: Tuple) -> bool:
+        """Set the key's bits; returns False if they were all set already"""
+        added = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not self._array[position >> 3] & mask:
+                self._array[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1  # repeated adds do not inflate the FP estimate
+        return added
+
+    def __contains__(self, key: Tuple) -> bool:
+        array = self._array
+        for position in self._positions(key):
+            if not array[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._array)
+
+    def estimated_fp_rate(self) -> float:
+        """False-positive rate expected at the current item count"""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+
+class PostedIndex:
+    """
+    Bloom prefilter plus exact recent-ID sets, kept write-through
+
+    - classify() splits candidates into definitely new (Bloom miss),
+      posted (in the pair's recent set) and unknown (Bloom hit only; the
+      caller asks the database and reports back with remember()).
+    - add() is called for every posted article (see
+      Database.add_posted_listener), so the index never says "new" for an
+      article the database has.
+    - rebuild() reloads everything from the database; writes made while it
+      runs are replayed onto the new index.
+
+    The Bloom filter is sized for twice the rows found at rebuild time
+    (at least `min_capacity`); past that its false-positive rate grows,
+    which only costs extra database lookups. Rows pruned from the database
+    (cleanup_old_articles) stay in the index until the next rebuild.
+    """
+
+    def __init__(
+        self,
+        min_capacity: int = bot_config.POSTED_INDEX_MIN_CAPACITY,
+        fp_rate: float = bot_config.POSTED_INDEX_FP_RATE,
+        recent: int = bot_config.POSTED_INDEX_RECENT
+    ):
+        self.min_capacity = min_capacity
+        self.fp_rate = fp_rate
+        self.recent = recent
+        self.ready = False  # False until the first rebuild finishes
+
+        self._lock = threading.Lock()  # writes may come from DB executor threads
+        self._bloom = BloomFilter(min_capacity, fp_rate)
+        self._recent: Dict[PairKey, Dict[str, None]] = {}
+        self._backlog: Optional[List[PostedKey]] = None  # writes made during a rebuild
+
+        # Statistics
+        self.lookups = 0  # candidate IDs classified
+        self.definitely_new = 0
+        self.recent_hits = 0
+        self.db_fallbacks = 0
+        self.false_positives = 0  # fallbacks the database reported as new
+        self.lookup_seconds = 0.0
+        self.rebuilds = 0
+        self.last_rebuild_seconds = 0.0
+
+    def _add(self, bloom: BloomFilter, recent: Dict[PairKey, Dict[str, None]], row: PostedKey):
+        row = tuple(row)
+        guild_id, source, article_id = row
+        bloom.add(row)
+        ids = recent.setdefault((guild_id, source), {})
+        ids.pop(article_id, None)
+        ids[sys.intern(article_id)] = None  # IDs repeat across guilds; store each once
+        if len(ids) > self.recent:
+            del ids[next(iter(ids))]
+
+    def add(self, rows: Iterable[PostedKey]):
+        """Record posted (or queued) articles"""
+        with self._lock:
+            for row in rows:
+                self._add(self._bloom, self._recent, row)
+                if self._backlog is not None:
+                    self._backlog.append(row)
+
+    def remember(self, guild_id: int, source: str, article_ids: Iterable[str]):
+        """Keep IDs the database reported as posted in the pair's recent set"""
+        self.add((guild_id, source, article_id) for article_id in article_ids)
+
+    def classify(self, guild_id: int, source: str, article_ids: Iterable[str]) -> Tuple[List[str], List[str], List[str]]:
+        """Split candidate IDs into (new, posted, unknown)"""
+        started = time.perf_counter()
+        new, posted, unknown = [], [], []
+        with self._lock:
+            ids = self._recent.get((guild_id, source), {})
+            bloom = self._bloom
+            for article_id in article_ids:
+                if article_id in ids:
+                    posted.append(article_id)  # feeds mostly return what was just posted
+                elif (guild_id, source, article_id) not in bloom:
+                    new.append(article_id)
+                else:
+                    unknown.append(article_id)
+
+            self.lookups += len(new) + len(posted) + len(unknown)
+            self.definitely_new += len(new)
+            self.recent_hits += len(posted)
+            self.db_fallbacks += len(unknown)
+            self.lookup_seconds += time.perf_counter() - started
+        return new, posted, unknown
+
+    def record_false_positives(self, count: int):
+        with self._lock:
+            self.false_positives += count
+
+    def rebuild(self, db, include_queued: bool = False) -> Dict:
+        """Reload the index from posted_articles (and the outbox); returns stats"""
+        started = time.perf_counter()
+        with self._lock:
+            self._backlog = []
+
+        try:
+            total = db.count_posted_keys(include_queued=include_queued)
+            bloom = BloomFilter(max(self.min_capacity, total * 2), self.fp_rate)
+            recent: Dict[PairKey, Dict[str, None]] = {}
+            for row in db.iter_posted_keys(include_queued=include_queued):
+                self._add(bloom, recent, row)
+        except Exception:
+            with self._lock:
+                self._backlog = None
+            raise
+
+        with self._lock:
+            for row in self._backlog:
+                self._add(bloom, recent, row)
+            self._bloom, self._recent, self._backlog = bloom, recent, None
+            self.ready = True
+            self.rebuilds += 1
+            self.last_rebuild_seconds = time.perf_counter() - started
+
+        stats = self.get_stats()
+        logger.info(
+            f"Posted index rebuilt in {self.last_rebuild_seconds:.2f}s: {stats['items']} articles, "
+            f"{stats['pairs']} guild/source pairs, {stats['memory_bytes'] / 1024:.0f} KB"
+        )
+        return stats
+
+    def memory_bytes(self) -> Tuple[int, int]:
+        """Approximate (Bloom, recent sets) footprint in bytes"""
+        with self._lock:
+            recent_bytes = sys.getsizeof(self._recent)
+            strings = {}
+            for ids in self._recent.values():
+                recent_bytes += sys.getsizeof(ids)
+                for article_id in ids:
+                    strings[id(article_id)] = article_id
+            recent_bytes += sum(sys.getsizeof(article_id) for article_id in strings.values())
+            return self._bloom.size_bytes, recent_bytes
+
+    def get_stats(self) -> Dict:
+        bloom_bytes, recent_bytes = self.memory_bytes()
+        with self._lock:
+            return {
+                'ready': self.ready,
+                'items': self._bloom.count,
+                'bloom_bits': self._bloom.bits,
+                'bloom_hashes': self._bloom.hashes,
+                'estimated_fp_rate': round(self._bloom.estimated_fp_rate(), 5),
+                'pairs': len(self._recent),
+                'recent_ids': sum(len(ids) for ids in self._recent.values()),
+                'bloom_bytes': bloom_bytes,
+                'recent_bytes': recent_bytes,
+                'memory_bytes': bloom_bytes + recent_bytes,
+                'lookups': self.lookups,
+                'definitely_new': self.definitely_new,
+                'recent_hits': self.recent_hits,
+                'db_fallbacks': self.db_fallbacks,
+                'false_positives': self.false_positives,
+                'avg_lookup_us': round(self.lookup_seconds / self.lookups * 1e6, 2) if self.lookups else None,
+                'rebuilds': self.rebuilds,
+                'last_rebuild_seconds': round(self.last_rebuild_seconds, 3),
+            }
@@ -3,55 +3,295 @@ News source fetchers - Abstract base and implementations
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import aiohttp
-import feedparser
 import asyncio
+import hashlib
+import json
 import os
-from bs4 import BeautifulSoup
 from datetime import datetime
 import pytz
 
 from logger_config import get_logger
 from config import BotConfig as bot_config
-from utils import retry_with_backoff, rate_limiters
+from database import get_database
+from utils import get_http_client, get_response_cache, get_rate_limiter, get_host_scheduler, get_retry_policy
+from utils.circuit_breaker import breaker_keys, get_circuit_breakers
+from utils.retry import RETRYABLE_STATUS
 from .models import Article, NewsSource
+from .parsing import (
+    FeedEntry,
+    find_websub_links,
+    get_parse_engine,
+    parse_feed_entries,
+    stream_feed_entries,
+    extract_phutcrypto_links
+)
+from .text import html_to_text_batch
 
 logger = get_logger('news_sources')
 VN_TZ = pytz.timezone('Asia/Ho_Chi_Minh')
 
 
 class BaseFetcher(ABC):
-    """Abstract base class for news fetchers"""
+    """
+    Abstract base class for news fetchers
+    
+    A fetch is split into download() and parse(). fetch_with_retry() digests
+    every downloaded body and skips parsing (and with it dedup and
+    translation) when the body is byte-identical to the last one handled for
+    the same feed and delivery set (`scope`). A parsed body only counts as
+    handled once the caller commit_digest()s it after its deliveries
+    succeeded, so failed posts are retried and a new subscriber gets the
+    current entries. Digests are kept in memory and mirrored to SQLite.
+    Every request holds a slot of the shared per-host scheduler, so feeds on
+    the same domain are spaced out however the sources are named. Circuit
+    breakers for the feed and its host make a dead upstream fail fast until
+    its next probe instead of burning retries every cycle.
+    """
     
     def __init__(self, source: NewsSource):
         self.source = source
-        self.limiter = rate_limiters.get(source.name.lower(), None)
+        self.http = get_http_client()
+        
+        # Body digest stage ('<body digest>:<scope>' of the last handled body)
+        self._body_digest: Optional[str] = None
+        self._digest_loaded = False
+        self._pending_digest: Optional[str] = None  # parsed, deliveries not yet confirmed
+        self._scope = ''
+        self.unchanged_hits = 0  # bodies skipped because they matched the last digest
+        self.last_unchanged = False  # whether the latest fetch was skipped as unchanged
+        self.circuit_skips = 0  # fetches skipped because a circuit was open
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared pooled HTTP session"""
+        return self.http.session
+    
+    @property
+    def digest_key(self) -> str:
+        """Key for the stored body digest (feed URL when the source has one)"""
+        return getattr(self, 'url', None) or f'source:{self.source.name.lower()}'
+    
+    @property
+    def endpoint(self) -> Optional[str]:
+        """URL requested by download() (its host gets a shared circuit breaker)"""
+        return getattr(self, 'url', None)
+    
+    @property
+    def breaker_keys(self) -> Tuple[str, ...]:
+        """Circuit breakers guarding this fetcher: the feed/source and its host"""
+        return breaker_keys(self.digest_key, self.endpoint)
     
     @abstractmethod
-    async def fetch(self) -> List[Article]:
-        """Fetch articles from source"""
+    async def download(self) -> Optional[bytes]:
+        """Download the raw body; None when there is nothing new (e.g. 304)"""
         pass
     
-    async def fetch_with_retry(self) -> List[Article]:
-        """Fetch with rate limiting and retry logic"""
-        if self.limiter:
-            await self.limiter.wait_if_needed()
+    @abstractmethod
+    async def parse(self, body: bytes) -> List[Article]:
+        """Build articles from a downloaded body"""
+        pass
+    
+    async def fetch(self) -> List[Article]:
+        """Download and parse articles (no retry, no unchanged-body check)"""
+        body = await self.download()
+        if body is None:
+            return []
+        articles = await self.parse(body)
+        await self._body_handled()
+        return articles
+    
+    async def fetch_with_retry(self, scope: str = '') -> List[Article]:
+        """
+        Fetch with circuit breakers, retry logic and the unchanged-body short-circuit
+        
+        Args:
+            scope: Identifies the deliveries receiving the articles (FetchJob.scope)
+        """
+        breakers = get_circuit_breakers()
+        keys = self.breaker_keys
+        if not breakers.acquire(keys):
+            self.circuit_skips += 1
+            logger.debug(
+                f"Circuit open for {self.source.name}, skipping fetch "
+                f"(probe in {breakers.retry_after(keys):.0f}s)"
+            )
+            return []
+        
+        self._scope = scope
         
-        @retry_with_backoff(max_retries=3, base_delay=2)
         async def _fetch():
-            return await self.fetch()
+            self.last_unchanged = False
+            self._pending_digest = None
+            body = await self.download()
+            if body is None:
+                return []
+            
+            digest = f'{hashlib.blake2b(body, digest_size=16).hexdigest()}:{scope}'
+            if digest == await self._get_body_digest():
+                self.unchanged_hits += 1
+                self.last_unchanged = True
+                await get_database().aio.save_body_digest(self.digest_key, digest, unchanged=True)
+                await self._body_handled()
+                logger.debug(f"Unchanged body for {self.source.name}, skipping parse: {self.digest_key}")
+                return []
+            
+            articles = await self.parse(body)
+            
+            # Remembered by commit_digest() once every delivery got the articles
+            self._pending_digest = digest
+            return articles
         
         try:
-            return await _fetch()
+            if breakers.is_probing(keys):
+                articles = await _fetch()  # a half-open probe gets a single attempt
+            else:
+                articles = await get_retry_policy('fetch').call(_fetch)
         except Exception as e:
+            breakers.record(keys, e)
             logger.error(f"Failed to fetch from {self.source.name}: {e}")
             return []
+        except BaseException:
+            breakers.release(keys)  # cancelled (e.g. a straggler at shutdown)
+            raise
+        
+        breakers.record(keys)
+        return articles
+    
+    async def commit_digest(self):
+        """Mark the last parsed body as handled (every delivery succeeded)"""
+        digest, self._pending_digest = self._pending_digest, None
+        if digest is None:
+            return
+        self._body_digest = digest
+        await get_database().aio.save_body_digest(self.digest_key, digest, unchanged=False)
+        await self._body_handled()
+    
+    async def _body_handled(self):
+        """Hook run when the downloaded body counts as handled"""
+        pass
+    
+    async def _get_body_digest(self) -> Optional[str]:
+        """Last handled body digest, loaded from SQLite on first use"""
+        if not self._digest_loaded:
+            self._body_digest = await get_database().aio.get_body_digest(self.digest_key)
+            self._digest_loaded = True
+        return self._body_digest
+    
+    async def _scope_changed(self) -> bool:
+        """Whether the last handled body went to a different delivery set"""
+        digest = await self._get_body_digest()
+        return digest is not None and digest.partition(':')[2] != self._scope
+
+
+class FeedFetcher(BaseFetcher):
+    """
+    Base class for RSS/Atom sources
+    
+    Downloads the feed with a conditional GET (If-None-Match /
+    If-Modified-Since). Validators are persisted in SQLite so they survive
+    restarts; a 304 response returns no articles without any parsing. Like
+    the body digest, validators only advance once a body is handled, and are
+    not sent when the delivery set changed since.
+    Downloads go through the shared response cache, so a body fetched moments
+    ago by a manual command is reused instead of refetched.
+    """
+    
+    max_entries: int = bot_config.RSS_MAX_ENTRIES
+    strip_html: bool = True  # Reduce summaries to plain text inside the parse worker
+    
+    def __init__(self, source: NewsSource, url: str):
+        super().__init__(source)
+        self.url = url
+        self._validators: Optional[Dict[str, Any]] = None  # of the last handled body
+        self._downloaded_validators: Optional[Dict[str, Any]] = None
+        
+        # WebSub hub advertised by the feed (<link rel="hub">), detected on download
+        self.hub_url: Optional[str] = None
+        self.topic_url: Optional[str] = None
+    
+    @abstractmethod
+    def build_article(self, entry: FeedEntry) -> Article:
+        """Build an article from a parsed feed entry"""
+        pass
+    
+    async def parse(self, body: bytes) -> List[Article]:
+        """Parse feed entries in the parse engine and build articles"""
+        parse_func = stream_feed_entries if bot_config.RSS_STREAMING_PARSER else parse_feed_entries
+        entries = await get_parse_engine().run(parse_func, body, self.max_entries, self.strip_html)
+        articles = [self.build_article(entry) for entry in entries]
+        
+        logger.debug(f"Fetched {len(articles)} entries from {self.source.name}: {self.url}")
+        return articles
+    
+    async def download(self) -> Optional[bytes]:
+        """
+        Download feed body through the shared response cache
+        Returns: body bytes, or None on 304 Not Modified
+        """
+        self._downloaded_validators = None
+        return await get_response_cache().get_or_fetch(
+            self.url, self._conditional_get, max_age=bot_config.RSS_CACHE_LOOP_MAX_AGE
+        )
+    
+    async def _conditional_get(self) -> Optional[bytes]:
+        """Download feed body with a conditional GET (None on 304)"""
+        db = get_database().aio
+        if self._validators is None:
+            self._validators = await db.get_feed_validators(self.url)
+        
+        headers = {}
+        if not await self._scope_changed():
+            if self._validators.get('etag'):
+                headers['If-None-Match'] = self._validators['etag']
+            if self._validators.get('last_modified'):
+                headers['If-Modified-Since'] = self._validators['last_modified']
+        
+        async with get_host_scheduler().slot(self.url), self.session.get(self.url, headers=headers) as response:
+            if response.status == 304:
+                await db.save_feed_response(self.url, None, None, 0, not_modified=True)
+                logger.debug(f"Not modified (304): {self.url}")
+                return None
+            
+            response.raise_for_status()
+            body = await response.read()
+        
+        hub_url, self_url = find_websub_links(body)
+        if hub_url and hub_url != self.hub_url:
+            logger.info(f"WebSub hub advertised by {self.url}: {hub_url}")
+        self.hub_url = hub_url
+        self.topic_url = (self_url or self.url) if hub_url else None
+        
+        self._downloaded_validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_size': len(body),
+        }
+        # Stored validators keep describing the last handled body (see _body_handled)
+        await db.save_feed_response(
+            self.url,
+            self._validators.get('etag'),
+            self._validators.get('last_modified'),
+            len(body),
+            not_modified=False
+        )
+        return body
+    
+    async def _body_handled(self):
+        """Advance the validators to the handled body"""
+        validators, self._downloaded_validators = self._downloaded_validators, None
+        if validators is None:
+            return
+        self._validators = validators
+        await get_database().aio.save_feed_validators(self.url, validators['etag'], validators['last_modified'])
 
 
-class GlassnodeSource(BaseFetcher):
+class GlassnodeSource(FeedFetcher):
     """Glassnode Insights RSS fetcher"""
     
+    max_entries = bot_config.GLASSNODE_MAX_ARTICLES
+    
     def __init__(self):
         source = NewsSource(
             name='Glassnode',
@@ -60,32 +300,50 @@ class GlassnodeSource(BaseFetcher):
             icon_url='https://www.google.com/s2/favicons?domain=glassnode.com&sz=128',
             rate_limit=30
         )
-        super().__init__(source)
-        self.url = 'https://insights.glassnode.com/feed/'
+        super().__init__(source, 'https://insights.glassnode.com/feed/')
     
-    async def fetch(self) -> List[Article]:
-        """Fetch from Glassnode RSS"""
-        loop = asyncio.get_event_loop()
-        feed = await loop.run_in_executor(None, feedparser.parse, self.url)
-        
-        articles = []
-        for entry in feed.entries[:bot_config.GLASSNODE_MAX_ARTICLES]:
-            article = Article(
-                id=entry.get('link', entry.get('id', '')),
-                title=entry.get('title', 'Không có tiêu đề'),
-                url=entry.get('link', ''),
-                source='glassnode',
-                description=entry.get('description', '') or entry.get('summary', ''),
-                published_at=entry.get('published', ''),
-            )
-            articles.append(article)
-        
-        logger.info(f"Fetched {len(articles)} articles from Glassnode")
-        return articles
+    def build_article(self, entry: FeedEntry) -> Article:
+        """Build article from Glassnode RSS entry (summary already stripped of HTML)"""
+        return Article(
+            id=entry.link or entry.id,
+            title=entry.title or 'Không có tiêu đề',
+            url=entry.link,
+            source='glassnode',
+            description=entry.summary,
+            published_at=entry.published,
+        )
 
 
 class SantimentSource(BaseFetcher):
-    """Santiment API fetcher"""
+    """
+    Santiment API fetcher
+    
+    Fetches incrementally: a publishedAt high-water mark is persisted in
+    SQLite and pages (newest first) are requested only until an insight at or
+    below the mark shows up, so a quiet poll costs one small request and a
+    backlog after downtime is paged through. Like FeedFetcher's validators,
+    the mark only advances once the body is handled (every delivery
+    succeeded), and not at all when a page of the backlog was missed. Every
+    request must fit both the hourly 'santiment' budget of get_rate_limiter()
+    and the daily quota.
+    """
+    
+    GRAPHQL_URL = 'https://api.santiment.net/graphql'
+    
+    # Only the fields EmbedFormatter needs
+    QUERY = """
+    query($page: Int!, $pageSize: Int!) {
+      allInsights(page: $page, pageSize: $pageSize) {
+        id
+        title
+        text
+        publishedAt
+        user {
+          username
+        }
+      }
+    }
+    """
     
     def __init__(self):
         source = NewsSource(
@@ -97,77 +355,173 @@ class SantimentSource(BaseFetcher):
         )
         super().__init__(source)
         self.api_key = os.getenv('SANTIMENT_API_KEY')
+        self.page_size = bot_config.SANTIMENT_MAX_ARTICLES
+        self.max_pages = bot_config.SANTIMENT_MAX_PAGES
+        self._high_water: Optional[str] = None
+        self._downloaded_high_water: Optional[str] = None  # newest insight of the last complete download
+        self._cursor_loaded = False
+        
+        # Statistics
+        self.requests = 0
+        self.insights_fetched = 0
     
-    async def fetch(self) -> List[Article]:
-        """Fetch from Santiment API"""
+    @property
+    def endpoint(self) -> Optional[str]:
+        return self.GRAPHQL_URL
+    
+    async def _load_high_water(self) -> Optional[str]:
+        """publishedAt of the newest insight already handed out, loaded from SQLite on first use"""
+        if not self._cursor_loaded:
+            self._high_water = await get_database().aio.get_source_cursor('santiment')
+            self._cursor_loaded = True
+        return self._high_water
+    
+    async def _within_quota(self) -> bool:
+        """Whether one more request fits the hourly budget and the daily quota"""
+        usage = await get_database().aio.get_api_usage('santiment', days=1)
+        today = datetime.utcnow().strftime('%Y-%m-%d')
+        if usage and usage[0]['day'] == today and usage[0]['requests'] >= bot_config.SANTIMENT_DAILY_QUOTA:
+            return False
+        
+        limiter = get_rate_limiter().limiters.get('santiment')
+        return limiter is None or limiter.try_acquire()
+    
+    async def download(self) -> Optional[bytes]:
+        """Page through insights newer than the high-water mark"""
         if not self.api_key:
             logger.warning("SANTIMENT_API_KEY not found")
-            return []
+            return None
+        
+        self._downloaded_high_water = None
+        high_water = await self._load_high_water()
+        new = []
+        requests = 0
+        complete = False  # reached the mark or the end of the list
+        
+        # Without a mark (first run) only the newest page is taken
+        max_pages = self.max_pages if high_water else 1
+        try:
+            for page in range(1, max_pages + 1):
+                if not await self._within_quota():
+                    logger.info(f"Santiment request budget exhausted; stopping at page {page}")
+                    break
+                
+                requests += 1
+                page_insights = await self._request_page(page)
+                if page_insights is None:
+                    break
+                
+                new.extend(
+                    insight for insight in page_insights
+                    # Drafts have no publishedAt
+                    if insight.get('publishedAt') and (not high_water or insight['publishedAt'] > high_water)
+                )
+                reached_mark = high_water and any(
+                    insight.get('publishedAt') and insight['publishedAt'] <= high_water
+                    for insight in page_insights
+                )
+                if reached_mark or len(page_insights) < self.page_size or page == max_pages:
+                    complete = True
+                    break
+        finally:
+            # Failed requests still count against the quota
+            await self._record_usage(requests, len(new))
         
-        query = """
-        {
-          allInsights(page: 1, pageSize: 5) {
-            id
-            title
-            text
-            readyState
-            publishedAt
-            user {
-              username
-            }
-          }
+        if not requests:
+            return None
+        if complete and new:
+            self._downloaded_high_water = max(insight['publishedAt'] for insight in new)
+        elif not complete:
+            logger.info("Santiment backlog only partly fetched; keeping the high-water mark")
+        return json.dumps(new).encode()
+    
+    async def _request_page(self, page: int) -> Optional[List[Dict[str, Any]]]:
+        """Request one page of insights (newest first); None on API errors"""
+        headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Apikey {self.api_key}'
         }
-        """
+        timeout = aiohttp.ClientTimeout(total=bot_config.REQUEST_TIMEOUT)
+        payload = {'query': self.QUERY, 'variables': {'page': page, 'pageSize': self.page_size}}
+        
+        async with get_host_scheduler().slot(self.GRAPHQL_URL), \
+                self.session.post(self.GRAPHQL_URL, json=payload, headers=headers, timeout=timeout) as response:
+            if response.status in RETRYABLE_STATUS:
+                response.raise_for_status()  # retried (honoring Retry-After) by the fetch policy
+            if response.status != 200:
+                logger.warning(f"Santiment API returned HTTP {response.status}")
+                return None
+            data = await response.json()
         
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f'Apikey {self.api_key}'
-            }
-            timeout = aiohttp.ClientTimeout(total=bot_config.REQUEST_TIMEOUT)
+        if 'errors' in data:
+            logger.error(f"Santiment GraphQL errors: {data['errors']}")
+            return None
+        
+        return (data.get('data') or {}).get('allInsights') or []
+    
+    async def _record_usage(self, requests: int, insights: int):
+        """Track insights per request and daily quota use"""
+        if not requests:
+            return
+        
+        self.requests += requests
+        self.insights_fetched += insights
+        
+        db = get_database().aio
+        await db.record_api_usage('santiment', requests=requests, items=insights)
+        today = await db.get_api_usage('santiment', days=1)
+        used = today[0]['requests'] if today else requests
+        logger.info(
+            f"Santiment: {insights} new insights from {requests} request(s) "
+            f"({self.insights_fetched / self.requests:.2f} insights/request overall), "
+            f"quota today {used}/{bot_config.SANTIMENT_DAILY_QUOTA}"
+        )
+    
+    async def parse(self, body: bytes) -> List[Article]:
+        """Build articles from new insights"""
+        insights = json.loads(body)
+        if not insights:
+            return []
+        
+        # Clean HTML from text (one parse-engine call for the whole batch)
+        clean_texts = await get_parse_engine().run(
+            html_to_text_batch, [insight.get('text', '') for insight in insights]
+        )
+        
+        articles = []
+        for insight, clean_text in zip(insights, clean_texts):
+            clean_text = clean_text[:400]
             
-            async with session.post(
-                'https://api.santiment.net/graphql',
-                json={'query': query},
-                headers=headers,
-                timeout=timeout
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if 'errors' in data:
-                        logger.error(f"Santiment GraphQL errors: {data['errors']}")
-                        return []
-                    
-                    insights = data.get('data', {}).get('allInsights', [])
-                    
-                    articles = []
-                    for insight in insights:
-                        if insight.get('readyState') == 'published':
-                            # Clean HTML from text
-                            soup = BeautifulSoup(insight.get('text', ''), 'html.parser')
-                            clean_text = soup.get_text()[:400]
-                            
-                            article = Article(
-                                id=str(insight.get('id')),
-                                title=insight.get('title', 'Không có tiêu đề'),
-                                url=f"https://insights.santiment.net/read/{insight.get('id')}",
-                                source='santiment',
-                                description=clean_text,
-                                published_at=insight.get('publishedAt', ''),
-                                author=insight.get('user', {}).get('username', 'Santiment'),
-                            )
-                            articles.append(article)
-                    
-                    logger.info(f"Fetched {len(articles)} insights from Santiment")
-                    return articles
-        
-        return []
+            article = Article(
+                id=str(insight.get('id')),
+                title=insight.get('title', 'Không có tiêu đề'),
+                url=f"https://insights.santiment.net/read/{insight.get('id')}",
+                source='santiment',
+                description=clean_text,
+                published_at=insight.get('publishedAt', ''),
+                author=(insight.get('user') or {}).get('username', 'Santiment'),
+            )
+            articles.append(article)
+        
+        logger.info(f"Fetched {len(articles)} insights from Santiment")
+        return articles
+    
+    async def _body_handled(self):
+        """Advance the high-water mark to the handled insights"""
+        newest, self._downloaded_high_water = self._downloaded_high_water, None
+        if newest is None:
+            return
+        high_water = await self._load_high_water()
+        if not high_water or newest > high_water:
+            self._high_water = newest
+            await get_database().aio.save_source_cursor('santiment', newest)
 
 
-class TheBlockSource(BaseFetcher):
+class TheBlockSource(FeedFetcher):
     """The Block RSS fetcher"""
     
+    max_entries = bot_config.THEBLOCK_MAX_ARTICLES
+    
     def __init__(self):
         source = NewsSource(
             name='TheBlock',
@@ -176,31 +530,18 @@ class TheBlockSource(BaseFetcher):
             icon_url='https://www.google.com/s2/favicons?domain=theblock.co&sz=128',
             rate_limit=60
         )
-        super().__init__(source)
-        self.url = 'https://www.theblock.co/rss.xml'
+        super().__init__(source, 'https://www.theblock.co/rss.xml')
     
-    async def fetch(self) -> List[Article]:
-        """Fetch from The Block RSS"""
-        loop = asyncio.get_event_loop()
-        feed = await loop.run_in_executor(None, feedparser.parse, self.url)
-        
-        articles = []
-        for entry in feed.entries[:bot_config.THEBLOCK_MAX_ARTICLES]:
-            soup = BeautifulSoup(entry.get('description', ''), 'html.parser')
-            clean_description = soup.get_text()[:400]
-            
-            article = Article(
-                id=entry.get('link', entry.get('id', '')),
-                title=entry.get('title', 'Không có tiêu đề'),
-                url=entry.get('link', ''),
-                source='theblock',
-                description=clean_description,
-                published_at=entry.get('published', ''),
-            )
-            articles.append(article)
-        
-        logger.info(f"Fetched {len(articles)} articles from The Block")
-        return articles
+    def build_article(self, entry: FeedEntry) -> Article:
+        """Build article from The Block RSS entry (summary already stripped of HTML)"""
+        return Article(
+            id=entry.link or entry.id,
+            title=entry.title or 'Không có tiêu đề',
+            url=entry.link,
+            source='theblock',
+            description=entry.summary[:400],
+            published_at=entry.published,
+        )
 
 
 class PhutcryptoSource(BaseFetcher):
@@ -217,54 +558,40 @@ class PhutcryptoSource(BaseFetcher):
         super().__init__(source)
         self.url = 'https://5phutcrypto.io/'
     
-    async def fetch(self) -> List[Article]:
-        """Scrape from 5phutcrypto.io"""
-        async with aiohttp.ClientSession() as session:
-            timeout = aiohttp.ClientTimeout(total=bot_config.REQUEST_TIMEOUT)
-            async with session.get(self.url, timeout=timeout) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    articles = []
-                    for h3 in soup.find_all('h3'):
-                        link_tag = h3.find('a', href=True)
-                        if link_tag and link_tag['href'].startswith('https://5phutcrypto.io/'):
-                            # Skip special links
-                            if any(skip in link_tag['href'] for skip in ['/tag/', '/author/', '/goc-nhin/', '/chuyen-sau/']):
-                                continue
-                            
-                            # Find image
-                            image_url = None
-                            parent = h3.find_parent()
-                            if parent:
-                                img = parent.find('img')
-                                if img and 'data-src' in img.attrs:
-                                    image_url = img['data-src']
-                                elif img and 'src' in img.attrs and not img['src'].startswith('data:'):
-                                    image_url = img['src']
-                            
-                            article = Article(
-                                id=link_tag['href'],
-                                title=link_tag.get_text(strip=True),
-                                url=link_tag['href'],
-                                source='5phutcrypto',
-                                description='',
-                                published_at=datetime.now(VN_TZ).isoformat(),
-                                image_url=image_url,
-                            )
-                            articles.append(article)
-                            
-                            if len(articles) >= bot_config.PHUTCRYPTO_MAX_ARTICLES:
-                                break
-                    
-                    logger.info(f"Fetched {len(articles)} articles from 5phutcrypto")
-                    return articles[:bot_config.PHUTCRYPTO_MAX_ARTICLES]
-        
-        return []
+    async def download(self) -> Optional[bytes]:
+        """Download the 5phutcrypto.io homepage"""
+        timeout = aiohttp.ClientTimeout(total=bot_config.REQUEST_TIMEOUT)
+        async with get_host_scheduler().slot(self.url), self.session.get(self.url, timeout=timeout) as response:
+            if response.status in RETRYABLE_STATUS:
+                response.raise_for_status()
+            if response.status != 200:
+                return None
+            return await response.read()
+    
+    async def parse(self, body: bytes) -> List[Article]:
+        """Scrape article links from the homepage"""
+        links = await get_parse_engine().run(
+            extract_phutcrypto_links, body, bot_config.PHUTCRYPTO_MAX_ARTICLES
+        )
+        
+        articles = [
+            Article(
+                id=link.url,
+                title=link.title,
+                url=link.url,
+                source='5phutcrypto',
+                description='',
+                published_at=datetime.now(VN_TZ).isoformat(),
+                image_url=link.image_url,
+            )
+            for link in links
+        ]
+        
+        logger.info(f"Fetched {len(articles)} articles from 5phutcrypto")
+        return articles
 
 
-class RSSSource(BaseFetcher):
+class RSSSource(FeedFetcher):
     """Generic RSS feed fetcher"""
     
     def __init__(self, name: str, url: str, color: int = 0xFFA500):
@@ -275,8 +602,7 @@ class RSSSource(BaseFetcher):
             icon_url=self._get_feed_icon(url, name),
             rate_limit=100
         )
-        super().__init__(source)
-        self.url = url
+        super().__init__(source, url)
     
     @staticmethod
     def _get_feed_icon(feed_url: str, feed_name: str) -> str:
@@ -308,51 +634,14 @@ class RSSSource(BaseFetcher):
         
         return 'https://cdn-icons-png.flaticon.com/512/888/888846.png'
     
-    async def fetch(self) -> List[Article]:
-        """Fetch from RSS feed"""
-        loop = asyncio.get_event_loop()
-        feed = await loop.run_in_executor(None, feedparser.parse, self.url)
-        
-        articles = []
-        for entry in feed.entries[:bot_config.RSS_MAX_ENTRIES]:
-            # Extract image URL
-            image_url = None
-            if hasattr(entry, 'media_content') and entry.media_content:
-                try:
-                    if len(entry.media_content) > 0 and 'url' in entry.media_content[0]:
-                        image_url = entry.media_content[0]['url']
-                except:
-                    pass
-            
-            if not image_url and hasattr(entry, 'enclosures') and entry.enclosures:
-                try:
-                    for enclosure in entry.enclosures:
-                        if 'image' in enclosure.get('type', '').lower():
-                            image_url = enclosure.get('href', '')
-                            break
-                except:
-                    pass
-            
-            # Clean description
-            description = entry.get('summary', entry.get('description', ''))
-            if description:
-                import html
-                import re
-                description = re.sub(r'#(\d+);', r'&#\1;', description)
-                description = html.unescape(description)
-                description = re.sub(r'<[^>]+>', '', description)
-                description = re.sub(r'\s+', ' ', description).strip()
-            
-            article = Article(
-                id=entry.get('id', entry.get('link', '')),
-                title=entry.get('title', 'Không có tiêu đề'),
-                url=entry.get('link', ''),
-                source=self.source.name,
-                description=description,
-                published_at=entry.get('published', ''),
-                image_url=image_url,
-            )
-            articles.append(article)
-        
-        logger.debug(f"Fetched {len(articles)} entries from RSS: {self.url}")
-        return articles
+    def build_article(self, entry: FeedEntry) -> Article:
+        """Build article from a generic RSS entry (summary already stripped of HTML)"""
+        return Article(
+            id=entry.id or entry.link,
+            title=entry.title or 'Không có tiêu đề',
+            url=entry.link,
+            source=self.source.name,
+            description=entry.summary,
+            published_at=entry.published,
+            image_url=entry.image_url,
+        )
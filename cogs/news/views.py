@@ -93,7 +93,7 @@ class ChannelSelectView(discord.ui.View):
     async def channel_select(self, interaction: discord.Interaction, select: discord.ui.ChannelSelect):
         """Xử lý khi user chọn channel"""
         channel = select.values[0]
-        config = self.cog.load_news_config(interaction.guild_id)
+        config = await self.cog.load_news_config(interaction.guild_id)
         
         if self.source_type == 'glassnode':
             config['glassnode_channel'] = channel.id
@@ -151,7 +151,7 @@ class ChannelSelectView(discord.ui.View):
                 view=None
             )
         
-        self.cog.save_news_config(config, interaction.guild_id)
+        await self.cog.save_news_config(config, interaction.guild_id)
 
 
 class RemoveRSSView(discord.ui.View):
@@ -181,10 +181,10 @@ class RemoveRSSView(discord.ui.View):
     async def select_callback(self, interaction: discord.Interaction):
         """Xử lý khi user chọn RSS để xóa"""
         selected_idx = int(interaction.data['values'][0])
-        config = self.cog.load_news_config(interaction.guild_id)
+        config = await self.cog.load_news_config(interaction.guild_id)
         feed_name = config['rss_feeds'][selected_idx]['name']
         del config['rss_feeds'][selected_idx]
-        self.cog.save_news_config(config, interaction.guild_id)
+        await self.cog.save_news_config(config, interaction.guild_id)
         
         await interaction.response.edit_message(
             content=f"✅ Đã xóa RSS Feed: **{feed_name}**",
@@ -214,7 +214,7 @@ class QuickSetupView(discord.ui.View):
             {"name": "Decrypt", "url": "https://decrypt.co/feed"}
         ]
         
-        config = self.cog.load_news_config(interaction.guild_id)
+        config = await self.cog.load_news_config(interaction.guild_id)
         existing_urls = {feed['url'] for feed in config['rss_feeds']}
         
         added_count = 0
@@ -227,7 +227,7 @@ class QuickSetupView(discord.ui.View):
                 })
                 added_count += 1
         
-        self.cog.save_news_config(config, interaction.guild_id)
+        await self.cog.save_news_config(config, interaction.guild_id)
         
         embed = discord.Embed(
             title="⚡ Quick Setup Hoàn tất!",
@@ -301,7 +301,7 @@ class PresetRSSSelectView(discord.ui.View):
             "https://decrypt.co/feed": "Decrypt"
         }
         
-        config = self.cog.load_news_config(interaction.guild_id)
+        config = await self.cog.load_news_config(interaction.guild_id)
         existing_urls = {feed['url'] for feed in config['rss_feeds']}
         
         added_feeds = []
@@ -314,7 +314,7 @@ class PresetRSSSelectView(discord.ui.View):
                 })
                 added_feeds.append(url_to_name.get(url, 'Unknown'))
         
-        self.cog.save_news_config(config, interaction.guild_id)
+        await self.cog.save_news_config(config, interaction.guild_id)
         
         embed = discord.Embed(
             title="✅ Đã thêm RSS Feeds!",
@@ -393,7 +393,7 @@ class NewsMenuView(discord.ui.View):
             await interaction.response.send_modal(modal)
             
         elif value == "remove_rss":
-            config = cog.load_news_config(interaction.guild_id)
+            config = await cog.load_news_config(interaction.guild_id)
             if not config['rss_feeds']:
                 await interaction.response.edit_message(content="❌ Không có RSS Feed nào để xóa!", embed=None, view=None)
                 return
@@ -0,0 +1,271 @@
+"""
+WebSub (PubSubHubbub) push ingestion
+Subscribes to hubs advertised by feeds and receives pushed updates through a
+small aiohttp callback server
+"""
+
+import asyncio
+import hashlib
+import hmac
+import secrets
+import socket
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+import aiohttp
+from aiohttp import web
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+from utils.http_client import get_http_client
+
+logger = get_logger('websub')
+
+PushHandler = Callable[[str, bytes], Awaitable[None]]
+
+SIGNATURE_METHODS = {'sha1', 'sha256', 'sha384', 'sha512'}
+MAX_PUSH_SIZE = 5 * 1024 * 1024  # bytes
+
+
+@dataclass
+class WebSubSubscription:
+    """One topic subscription at a hub"""
+
+    topic: str
+    hub: str
+    secret: str
+    state: str = 'pending'  # pending | active | denied | failed
+    requested_at: float = 0.0
+    lease_expires: Optional[float] = None  # time.time() when the hub drops us
+    pushes: int = 0
+    rejected: int = 0  # pushes ignored because of a bad signature
+
+
+class WebSubSubscriber:
+    """
+    WebSub subscriber with an aiohttp callback server
+
+    subscribe() asks the hub to push a topic to /websub/<id>. The hub then
+    verifies intent with a GET carrying hub.challenge, which is echoed only
+    for topics we asked for. Pushed bodies must carry a valid X-Hub-Signature
+    (HMAC with the per-subscription secret); others are acknowledged and
+    dropped, as the spec requires. Accepted bodies are handed to on_push in
+    the background so the hub gets its 2xx right away.
+    """
+
+    def __init__(
+        self,
+        on_push: PushHandler,
+        callback_base: Optional[str] = bot_config.WEBSUB_CALLBACK_URL,
+        host: str = bot_config.WEBSUB_HOST,
+        port: int = bot_config.WEBSUB_PORT,
+        lease_seconds: int = bot_config.WEBSUB_LEASE_SECONDS,
+        retry_after: float = 3600
+    ):
+        self.on_push = on_push
+        self.callback_base = callback_base.rstrip('/') if callback_base else None
+        self.host = host
+        self.port = port
+        self.lease_seconds = lease_seconds
+        self.retry_after = retry_after
+
+        self._subscriptions: Dict[str, WebSubSubscription] = {}  # subscription id -> subscription
+        self._runner: Optional[web.AppRunner] = None
+        self._push_tasks: Set[asyncio.Task] = set()
+
+    # ==================== Callback Server ====================
+
+    async def start(self):
+        """Start the callback server"""
+        app = web.Application(client_max_size=MAX_PUSH_SIZE)
+        app.router.add_get('/websub/{sub_id}', self._handle_verify)
+        app.router.add_post('/websub/{sub_id}', self._handle_push)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        # Bound here so the port is known; port 0 picks a free one (tests)
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        sock = socket.create_server((self.host, self.port), family=family)
+        site = web.SockSite(self._runner, sock)
+        await site.start()
+        self.port = sock.getsockname()[1]
+        if not self.callback_base:
+            self.callback_base = f'http://{self.host}:{self.port}'
+
+        logger.info(f"WebSub callback server listening on {self.host}:{self.port} ({self.callback_base})")
+
+    async def stop(self):
+        """Stop the callback server and pending push handlers"""
+        for task in list(self._push_tasks):
+            task.cancel()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            logger.info("WebSub callback server stopped")
+
+    # ==================== Subscriptions ====================
+
+    @staticmethod
+    def subscription_id(topic: str) -> str:
+        """Stable callback path component for a topic"""
+        return hashlib.sha256(topic.encode()).hexdigest()[:24]
+
+    def callback_url(self, topic: str) -> str:
+        return f'{self.callback_base}/websub/{self.subscription_id(topic)}'
+
+    def get(self, topic: str) -> Optional[WebSubSubscription]:
+        return self._subscriptions.get(self.subscription_id(topic))
+
+    @property
+    def topics(self) -> Set[str]:
+        return {sub.topic for sub in self._subscriptions.values()}
+
+    def is_active(self, topic: str) -> bool:
+        """Whether the hub verified the subscription and the lease is still valid"""
+        sub = self.get(topic)
+        return bool(
+            sub and sub.state == 'active'
+            and (sub.lease_expires is None or sub.lease_expires > time.time())
+        )
+
+    def needs_subscribe(self, topic: str, hub: str) -> bool:
+        """Whether to (re)send a subscription request for a topic"""
+        sub = self.get(topic)
+        if sub is None or sub.hub != hub:
+            return True
+        if sub.state == 'active':
+            # Renew during the last tenth of the lease
+            return sub.lease_expires is not None and sub.lease_expires - time.time() < self.lease_seconds / 10
+        # pending (verification never came), denied or failed: retry later
+        return time.time() - sub.requested_at > self.retry_after
+
+    async def subscribe(self, topic: str, hub: str) -> bool:
+        """
+        Ask a hub to push a topic to us
+
+        Returns:
+            True if the hub accepted the request (verification follows)
+        """
+        sub_id = self.subscription_id(topic)
+        previous = self._subscriptions.get(sub_id)
+        sub = WebSubSubscription(
+            topic=topic,
+            hub=hub,
+            secret=previous.secret if previous and previous.hub == hub else secrets.token_hex(32),
+            requested_at=time.time(),
+        )
+        if previous:
+            sub.pushes, sub.rejected = previous.pushes, previous.rejected
+            if previous.state == 'active':
+                # Renewal: keep receiving pushes until the hub verifies again
+                sub.state, sub.lease_expires = 'active', previous.lease_expires
+        self._subscriptions[sub_id] = sub
+
+        accepted = await self._send_request(hub, 'subscribe', topic, sub.secret)
+        if not accepted and sub.state != 'active':
+            sub.state = 'failed'
+        return accepted
+
+    async def unsubscribe(self, topic: str):
+        """Stop receiving a topic"""
+        sub = self._subscriptions.pop(self.subscription_id(topic), None)
+        if sub is not None:
+            await self._send_request(sub.hub, 'unsubscribe', topic, None)
+
+    async def _send_request(self, hub: str, mode: str, topic: str, secret: Optional[str]) -> bool:
+        data = {
+            'hub.mode': mode,
+            'hub.topic': topic,
+            'hub.callback': self.callback_url(topic),
+        }
+        if mode == 'subscribe':
+            data['hub.lease_seconds'] = str(self.lease_seconds)
+            data['hub.secret'] = secret
+
+        try:
+            timeout = aiohttp.ClientTimeout(total=bot_config.REQUEST_TIMEOUT)
+            async with get_http_client().session.post(hub, data=data, timeout=timeout) as response:
+                if response.status in (202, 204):
+                    logger.info(f"WebSub {mode} request accepted by {hub} for {topic}")
+                    return True
+                logger.warning(f"WebSub {mode} request for {topic} rejected by {hub}: HTTP {response.status}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"WebSub {mode} request for {topic} to {hub} failed: {e}")
+        return False
+
+    # ==================== Handlers ====================
+
+    async def _handle_verify(self, request: web.Request) -> web.Response:
+        """Intent verification (and denial notice) from the hub"""
+        sub = self._subscriptions.get(request.match_info['sub_id'])
+        mode = request.query.get('hub.mode')
+        topic = request.query.get('hub.topic')
+
+        if mode == 'denied':
+            if sub and sub.topic == topic:
+                sub.state = 'denied'
+                logger.warning(f"WebSub subscription denied for {topic}: {request.query.get('hub.reason', '')}")
+            return web.Response(status=200)
+
+        challenge = request.query.get('hub.challenge')
+        if challenge is None or topic is None:
+            return web.Response(status=400)
+
+        if mode == 'subscribe' and sub and sub.topic == topic:
+            lease = request.query.get('hub.lease_seconds')
+            sub.state = 'active'
+            sub.lease_expires = time.time() + int(lease) if lease and lease.isdigit() else None
+            logger.info(f"WebSub subscription verified for {topic} (lease {lease or 'unlimited'}s)")
+            return web.Response(text=challenge)
+
+        if mode == 'unsubscribe' and sub is None:
+            # We dropped the topic ourselves; confirm the unsubscription
+            return web.Response(text=challenge)
+
+        return web.Response(status=404)
+
+    async def _handle_push(self, request: web.Request) -> web.Response:
+        """Content distribution from the hub"""
+        sub = self._subscriptions.get(request.match_info['sub_id'])
+        if sub is None:
+            return web.Response(status=410)  # hub should drop the subscription
+
+        body = await request.read()
+        if not self._valid_signature(sub.secret, body, request.headers.get('X-Hub-Signature', '')):
+            sub.rejected += 1
+            logger.warning(f"WebSub push for {sub.topic} ignored: bad or missing signature")
+            return web.Response(status=202)
+
+        sub.pushes += 1
+        task = asyncio.create_task(self._dispatch(sub.topic, body))
+        self._push_tasks.add(task)
+        task.add_done_callback(self._push_tasks.discard)
+        return web.Response(status=202)
+
+    async def _dispatch(self, topic: str, body: bytes):
+        try:
+            await self.on_push(topic, body)
+        except Exception as e:
+            logger.error(f"Error handling WebSub push for {topic}: {e}", exc_info=True)
+
+    @staticmethod
+    def _valid_signature(secret: str, body: bytes, header: str) -> bool:
+        method, _, signature = header.partition('=')
+        if method not in SIGNATURE_METHODS or not signature:
+            return False
+        expected = hmac.new(secret.encode(), body, method).hexdigest()
+        return hmac.compare_digest(expected, signature.strip().lower())
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-topic subscription state and push counts"""
+        return {
+            sub.topic: {
+                'hub': sub.hub,
+                'state': sub.state,
+                'lease_expires': sub.lease_expires,
+                'pushes': sub.pushes,
+                'rejected': sub.rejected,
+            }
+            for sub in self._subscriptions.values()
+        }
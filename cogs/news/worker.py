@@ -0,0 +1,116 @@
+"""
+News ingestion worker
+Runs the NewsPipeline outside the Discord bot process and hands ready-to-post
+payloads to the bot through the SQLite outbox (INGEST_MODE=worker)
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+from database import get_database
+from utils.http_client import get_http_client
+from .engine import Delivery
+from .models import PostPayload
+from .parsing import shutdown_parse_pool
+from .pipeline import NewsPipeline, load_news_config
+
+logger = get_logger('news_worker')
+
+
+class NewsWorker:
+    """
+    Poll, dedup and translate news without a gateway connection
+
+    The worker cannot see which channels the bot can reach, so every
+    configured channel is planned; the bot drops posts whose channel is gone.
+    """
+
+    def __init__(self):
+        self.db = get_database()
+        self.pipeline = NewsPipeline(self.enqueue, outbox=True)
+
+        self._index_rebuilt_at = time.time()  # warmed by pipeline.start()
+
+        # Statistics
+        self.cycles = 0
+        self.queued = 0
+
+    async def load_configs(self) -> Dict[int, Dict]:
+        """News config of every configured guild"""
+        return {
+            row['guild_id']: await load_news_config(self.db, row['guild_id'])
+            for row in await self.db.aio.get_all_guild_configs()
+        }
+
+    async def enqueue(self, delivery: Delivery, payloads: List[PostPayload]):
+        """Hand a delivery's prepared articles to the bot"""
+        queued = await self.db.aio.enqueue_posts([
+            {
+                'guild_id': payload.guild_id,
+                'channel_id': payload.channel_id,
+                'article_id': payload.article.id,
+                'source': payload.source_key,
+                'payload': json.dumps(payload.to_dict()),
+            }
+            for payload in payloads
+        ])
+        self.queued += queued
+        logger.info(f"Queued {queued} articles for channel {delivery.channel_id} ({delivery.source_key})")
+
+    async def rebuild_index_if_requested(self):
+        """Rebuild the posted index when the bot's !rebuildindex asked for it since the last rebuild"""
+        if not self.pipeline.posted_index:
+            return
+        requested_at = (await self.db.aio.get_runtime_stats('posted_index_rebuild')).get('requested_at', 0)
+        if requested_at > self._index_rebuilt_at:
+            self._index_rebuilt_at = time.time()
+            await self.pipeline.rebuild_posted_index()
+
+    async def run_once(self):
+        """Run one pipeline cycle and publish outbox stats"""
+        await self.rebuild_index_if_requested()
+        await self.pipeline.run_cycle(await self.load_configs(), lambda channel_id: True)
+        self.cycles += 1
+        await self.log_outbox_stats()
+
+    async def log_outbox_stats(self):
+        """Log outbox depth and publish it for the dashboard"""
+        stats = await self.db.aio.get_outbox_stats(bot_config.OUTBOX_MAX_ATTEMPTS)
+        if stats['pending'] or stats['dropped']:
+            logger.info(
+                f"Outbox: {stats['pending']} pending (oldest {stats['oldest_pending_age']}s), "
+                f"{stats['posted']} posted, {stats['dropped']} dropped"
+            )
+        try:
+            await self.db.aio.save_runtime_stats('outbox', {**stats, 'cycles': self.cycles, 'queued': self.queued})
+        except Exception as e:
+            logger.error(f"Error saving outbox stats: {e}")
+
+    async def run(self, stop: Optional[asyncio.Event] = None):
+        """Poll every POLL_TICK_SECONDS until `stop` is set"""
+        stop = stop or asyncio.Event()
+        await get_http_client().start()
+        await self.pipeline.start()
+        removed = await self.db.aio.cleanup_outbox()
+        logger.info(f"News worker started (removed {removed} old outbox rows)")
+
+        try:
+            while not stop.is_set():
+                try:
+                    await self.run_once()
+                except Exception as e:
+                    logger.error(f"News worker cycle failed: {e}", exc_info=True)
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=bot_config.POLL_TICK_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.pipeline.stop()
+            await get_http_client().close()
+            shutdown_parse_pool()
+            self.db.close()  # flushes buffered writes too
+            logger.info("News worker stopped")
@@ -6,30 +6,22 @@ Main orchestration for news aggregation and posting
 from discord.ext import commands, tasks
 import discord
 import json
+import time
 import asyncio
-from datetime import datetime
+from collections import defaultdict
 from typing import Dict, List, Optional
-from deep_translator import GoogleTranslator
-import pytz
 
 from logger_config import get_logger
 from config import BotConfig as bot_config
 from database import get_database
-from translation_cache import get_translation_cache
-from utils.rate_limiter import get_rate_limiter
-from .news.models import Article
-from .news.sources import (
-    GlassnodeSource,
-    SantimentSource,
-    TheBlockSource,
-    PhutcryptoSource,
-    RSSSource
-)
+from .news.models import PostPayload
 from .news.views import NewsMenuView
 from .news.formatters import EmbedFormatter
+from .news.metrics import CycleMetrics
+from .news.engine import Delivery
+from .news.pipeline import NewsPipeline, load_news_config
 
 logger = get_logger('news_cog')
-VN_TZ = pytz.timezone('Asia/Ho_Chi_Minh')
 
 
 class NewsCog(commands.Cog):
@@ -38,233 +30,203 @@ class NewsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.db = get_database()
-        self.cache = get_translation_cache()
-        self.rate_limiter = get_rate_limiter()  # Add rate limiter
         self.temp_rss_data: Dict[int, Dict] = {}
-        self.translator = GoogleTranslator(source='auto', target='vi')
+        self.post_semaphore = asyncio.Semaphore(bot_config.POST_CONCURRENCY)
         
-        # Initialize news sources
-        self.sources = {
-            'glassnode': GlassnodeSource(),
-            'santiment': SantimentSource(),
-            'theblock': TheBlockSource(),
-            '5phutcrypto': PhutcryptoSource(),
-        }
+        # News configs per guild for the scheduler tick; dropped on save and
+        # reloaded every NEWS_CHECK_INTERVAL to pick up dashboard edits
+        self._guild_configs: Dict[int, Dict] = {}
+        self._configs_loaded_at = 0.0
         
-        # Migration flag
-        self._migrated = False
-        
-        # Start background task
-        self.news_checker.start()
+        # Fetching, dedup and translation run here (inline) or in news_worker.py,
+        # which queues ready-to-post payloads in the SQLite outbox (worker)
+        self.pipeline: Optional[NewsPipeline] = None
+        if bot_config.INGEST_MODE == 'worker':
+            logger.info("Ingestion runs in news_worker.py; posting from the outbox")
+            self.outbox_poster.start()
+        else:
+            self.pipeline = NewsPipeline(self.post_payloads)
+            self.news_checker.start()
+    
+    @property
+    def last_cycle_metrics(self) -> Optional[CycleMetrics]:
+        """Metrics of the most recent news_checker cycle (inline mode)"""
+        return self.pipeline.last_cycle_metrics if self.pipeline else None
         
-    def cog_unload(self):
+    async def cog_load(self):
+        """Start the WebSub callback server when push ingestion is enabled"""
+        if self.pipeline:
+            await self.pipeline.start()
+    
+    async def cog_unload(self):
         """Stop task when cog unloads"""
         self.news_checker.cancel()
+        self.outbox_poster.cancel()
+        if self.pipeline:
+            await self.pipeline.stop()
     
     # ==================== Config Management ====================
     
-    def load_news_config(self, guild_id: Optional[int] = None) -> Dict:
+    async def load_news_config(self, guild_id: Optional[int] = None) -> Dict:
         """Load news configuration for specific guild from database"""
-        if not guild_id:
-            return {
-                "glassnode_channel": None,
-                "santiment_channel": None,
-                "5phutcrypto_channel": None,
-                "theblock_channel": None,
-                "rss_feeds": []
-            }
-        
-        try:
-            config = self.db.get_guild_config(guild_id)
-            
-            # Map database column names to expected keys
-            return {
-                "glassnode_channel": config.get('glassnode_channel'),
-                "santiment_channel": config.get('santiment_channel'),
-                "5phutcrypto_channel": config.get('phutcrypto_channel'),
-                "theblock_channel": config.get('theblock_channel'),
-                "rss_feeds": config.get('rss_feeds', [])
-            }
-        except Exception as e:
-            logger.error(f"Error loading config for guild {guild_id}: {e}")
-            return {
-                "glassnode_channel": None,
-                "santiment_channel": None,
-                "5phutcrypto_channel": None,
-                "theblock_channel": None,
-                "rss_feeds": []
-            }
+        return await load_news_config(self.db, guild_id)
     
-    def save_news_config(self, config: Dict, guild_id: int):
+    async def save_news_config(self, config: Dict, guild_id: int):
         """Save news configuration for specific guild to database"""
         try:
-            self.db.save_guild_config(guild_id, config)
+            await self.db.aio.save_guild_config(guild_id, config)
             logger.info(f"Saved config for guild {guild_id}")
         except Exception as e:
             logger.error(f"Error saving config for guild {guild_id}: {e}", exc_info=True)
+        finally:
+            self.invalidate_news_config(guild_id)
     
+    def invalidate_news_config(self, guild_id: int):
+        """Reload a guild's config on the next scheduler tick"""
+        self._guild_configs.pop(guild_id, None)
     
-    # ==================== Translation ====================
-    
-    async def translate_to_vietnamese(self, text: str, max_length: Optional[int] = None) -> str:
-        """Translate text to Vietnamese with caching and rate limiting"""
-        if not text:
-            return ""
+    async def guild_news_configs(self) -> Dict[int, Dict]:
+        """News config of every guild the bot is in (cached between ticks)"""
+        if time.monotonic() - self._configs_loaded_at >= bot_config.NEWS_CHECK_INTERVAL:
+            self._guild_configs = {}
+            self._configs_loaded_at = time.monotonic()
         
-        try:
-            # Truncate if needed
-            if max_length and len(text) > max_length:
-                text = text[:max_length]
-            
-            # Google Translate max 5000 chars
-            if len(text) > 4500:
-                text = text[:4500]
-            
-            # Check cache first (skip rate limiting if cached)
-            cached = self.cache.get(text)
-            if cached:
-                return cached
-            
-            # Apply rate limiting before API call
-            await self.rate_limiter.acquire('google_translate')
-            
-            # Translate in executor
-            loop = asyncio.get_event_loop()
-            translated = await loop.run_in_executor(None, self.translator.translate, text)
-            
-            # Cache the result
-            self.cache.set(text, translated)
-            
-            logger.debug(f"Translated: {len(text)} -> {len(translated)} chars")
-            return translated
-        except Exception as e:
-            logger.error(f"Translation error: {e}")
-            return text
-    
-    # ==================== News Processing ====================
-    
-    async def process_and_post_articles(
-        self,
-        articles: List[Article],
-        channel: discord.TextChannel,
-        guild_id: int,
-        source_key: str,
-        is_vietnamese: bool = False
-    ):
-        """Process and post articles to channel"""
-        for article in articles:
-            # Check database instead of in-memory list
-            if not self.db.is_article_posted(guild_id, article.id, source_key):
-                try:
-                    # Translate if needed
-                    if is_vietnamese:
-                        translated_title = article.title
-                        translated_desc = article.description or "Không có mô tả"
-                    else:
-                        translated_title = await self.translate_to_vietnamese(article.title, 250)
-                        if article.description:
-                            translated_desc = await self.translate_to_vietnamese(article.description, 400)
-                        else:
-                            translated_desc = "Đọc thêm tại nguồn"
-                    
-                    # Create embed
-                    embed = EmbedFormatter.create_embed(
-                        article,
-                        translated_title,
-                        translated_desc,
-                        is_vietnamese
-                    )
-                    
-                    # Send to channel
-                    await channel.send(embed=embed)
-                    
-                    # Mark as posted in database
-                    self.db.mark_article_posted(
-                        guild_id,
-                        article.id,
-                        source_key,
-                        article.title,
-                        article.url
-                    )
-                    
-                    logger.info(f"Posted: {article.source} - {article.title[:50]}")
-                    
-                except Exception as e:
-                    logger.error(f"Error posting article {article.id}: {e}", exc_info=True)
-                    continue
+        configs = {}
+        for guild in self.bot.guilds:
+            config = self._guild_configs.get(guild.id)
+            if config is None:
+                config = self._guild_configs[guild.id] = await self.load_news_config(guild.id)
+            configs[guild.id] = config
+        return configs
     
-    # ==================== Background Task ====================
+    # ==================== Posting ====================
     
-    @tasks.loop(minutes=3)
-    async def news_checker(self):
-        """Background task - check for new articles every 3 minutes"""
-        logger.info(f"NEWS_CHECKER STARTED at {datetime.now(VN_TZ)}")
-        logger.info(f"Found {len(self.bot.guilds)} guilds to process")
+    async def post_payload(self, payload: PostPayload):
+        """Send one prepared article and mark it as posted"""
+        channel = self.bot.get_channel(payload.channel_id)
+        if not channel:
+            raise LookupError(f"Channel {payload.channel_id} not found")
         
-        for guild in self.bot.guilds:
-            logger.info(f"Processing guild: {guild.name} (ID: {guild.id})")
-            
+        embed = EmbedFormatter.create_embed(
+            payload.article,
+            payload.title,
+            payload.description,
+            payload.is_vietnamese
+        )
+        
+        async with self.post_semaphore:
+            await channel.send(embed=embed)
+        
+        # Mark as posted in database
+        await self.db.aio.mark_article_posted(
+            payload.guild_id,
+            payload.article.id,
+            payload.source_key,
+            payload.article.title,
+            payload.article.url
+        )
+        
+        logger.info(f"Posted: {payload.article.source} - {payload.article.title[:50]}")
+    
+    async def post_payloads(self, delivery: Delivery, payloads: List[PostPayload]):
+        """Post a delivery's prepared articles in order (inline mode); raises if any failed"""
+        failed = 0
+        for payload in payloads:
             try:
-                config = self.load_news_config(guild.id)
-                
-                # Process each source
-                for source_name, source in self.sources.items():
-                    channel_key = f'{source_name}_channel'
-                    channel_id = config.get(channel_key)
-                    
-                    if channel_id:
-                        channel = self.bot.get_channel(channel_id)
-                        if channel:
-                            articles = await source.fetch_with_retry()
-                            
-                            if articles:
-                                await self.process_and_post_articles(
-                                    articles,
-                                    channel,
-                                    guild.id,
-                                    source_name,
-                                    is_vietnamese=(source_name == '5phutcrypto')
-                                )
-                
-                # Process RSS feeds
-                for feed_config in config.get('rss_feeds', []):
-                    channel = self.bot.get_channel(feed_config['channel_id'])
-                    if channel:
-                        feed_url = feed_config['url']
-                        feed_name = feed_config['name']
-                        
-                        # Fetch RSS
-                        rss_source = RSSSource(feed_name, feed_url)
-                        articles = await rss_source.fetch_with_retry()
-                        
-                        if articles:
-                            is_vietnamese = 'vnexpress' in feed_url.lower() or 'vn' in feed_name.lower()
-                            
-                            await self.process_and_post_articles(
-                                articles,
-                                channel,
-                                guild.id,
-                                f'rss:{feed_url}',
-                                is_vietnamese
-                            )
-                
+                await self.post_payload(payload)
             except Exception as e:
-                logger.error(f"Error processing guild {guild.id}: {e}", exc_info=True)
+                failed += 1
+                logger.error(f"Error posting article {payload.article.id}: {e}", exc_info=True)
                 continue
-        
-        # Log cache stats every check cycle
-        self.cache.print_stats()
+        if failed:
+            # The engine then keeps the feed's body digest so the next poll retries them
+            raise RuntimeError(f"{failed}/{len(payloads)} articles not posted to channel {delivery.channel_id}")
+    
+    async def post_outbox_rows(self, rows: List[Dict]):
+        """Post queued rows of one channel in queue order"""
+        for row in rows:
+            try:
+                await self.post_payload(PostPayload.from_dict(json.loads(row['payload'])))
+            except LookupError as e:
+                await self.db.aio.fail_post(row['id'], str(e), give_up=True)
+                logger.warning(f"Dropped queued article {row['article_id']}: {e}")
+            except Exception as e:
+                await self.db.aio.fail_post(row['id'], str(e))
+                logger.error(f"Error posting queued article {row['article_id']}: {e}", exc_info=True)
+            else:
+                await self.db.aio.complete_post(row['id'])
+    
+    # ==================== Background Tasks ====================
+    
+    @tasks.loop(seconds=bot_config.POLL_TICK_SECONDS)
+    async def news_checker(self):
+        """Background task - poll every source/feed whose adaptive schedule is due"""
+        configs = await self.guild_news_configs()
+        await self.pipeline.run_cycle(configs, lambda channel_id: self.bot.get_channel(channel_id) is not None)
     
     @news_checker.before_loop
     async def before_news_checker(self):
         """Wait for bot to be ready"""
         await self.bot.wait_until_ready()
     
+    @commands.command(name='rebuildindex')
+    @commands.has_permissions(administrator=True)
+    async def rebuild_index_command(self, ctx):
+        """Rebuild the in-memory posted-article index from the database (Admin only)"""
+        if not bot_config.POSTED_INDEX_ENABLED:
+            await ctx.send("Posted index is disabled (POSTED_INDEX_ENABLED=false).")
+            return
+        
+        if not self.pipeline:
+            # The index lives in news_worker.py, which picks the request up before its next cycle
+            await self.db.aio.save_runtime_stats('posted_index_rebuild', {'requested_at': time.time()})
+            await ctx.send("🔁 Rebuild requested; the news worker will reload its index before the next cycle.")
+            return
+        
+        await ctx.send("🔁 Rebuilding posted-article index...")
+        try:
+            stats = await self.pipeline.rebuild_posted_index()
+        except Exception as e:
+            logger.error(f"Posted index rebuild failed: {e}", exc_info=True)
+            await ctx.send(f"❌ Rebuild failed: {e}")
+            return
+        
+        await ctx.send(
+            f"✅ Posted index rebuilt in {stats['last_rebuild_seconds']:.2f}s: {stats['items']} articles, "
+            f"{stats['pairs']} guild/source pairs, {stats['memory_bytes'] / 1024:.0f} KB "
+            f"(estimated false-positive rate {stats['estimated_fp_rate']:.2%})"
+        )
+    
+    @tasks.loop(seconds=bot_config.OUTBOX_POLL_INTERVAL)
+    async def outbox_poster(self):
+        """Background task - post payloads queued by the ingestion worker"""
+        while await self.drain_outbox() == bot_config.OUTBOX_BATCH_SIZE:
+            pass  # full batch: more may be waiting
+    
+    async def drain_outbox(self) -> int:
+        """Post one batch of queued payloads; returns the number of rows handled"""
+        rows = await self.db.aio.get_pending_posts(bot_config.OUTBOX_BATCH_SIZE, bot_config.OUTBOX_MAX_ATTEMPTS)
+        
+        # Channels are posted to concurrently, each channel in queue order
+        by_channel = defaultdict(list)
+        for row in rows:
+            by_channel[row['channel_id']].append(row)
+        
+        async with asyncio.TaskGroup() as group:
+            for channel_rows in by_channel.values():
+                group.create_task(self.post_outbox_rows(channel_rows))
+        return len(rows)
+    
+    @outbox_poster.before_loop
+    async def before_outbox_poster(self):
+        """Wait for bot to be ready"""
+        await self.bot.wait_until_ready()
+    
     # ==================== Commands ====================
     
     async def list_sources_command(self, interaction: discord.Interaction):
         """List all configured news sources"""
-        config = self.load_news_config(interaction.guild_id)
+        config = await self.load_news_config(interaction.guild_id)
         
         embed = discord.Embed(
             title="📋 Danh sách Nguồn Tin",
@@ -10,7 +10,48 @@ class BotConfig:
     """Configuration class chứa tất cả constants và settings"""
     
     # News checking intervals
-    NEWS_CHECK_INTERVAL: int = 180  # seconds (3 minutes)
+    NEWS_CHECK_INTERVAL: int = 180  # seconds (3 minutes), initial poll interval per feed
+    
+    # Adaptive per-feed polling
+    POLL_MIN_INTERVAL: int = 60  # seconds, busiest feeds
+    POLL_MAX_INTERVAL: int = 1800  # seconds (30 minutes), quietest feeds
+    POLL_JITTER: float = 0.1  # +/- fraction added to every interval
+    POLL_TICK_SECONDS: int = 20  # how often the scheduler checks for due feeds
+    CYCLE_DEADLINE: int = 60  # seconds a cycle waits for fetches; stragglers carry over
+    CYCLE_SLOWEST_LOGGED: int = 5  # slowest fetches logged per cycle
+    
+    # WebSub push ingestion (enabled when a public callback URL is set)
+    WEBSUB_CALLBACK_URL: Optional[str] = os.getenv('WEBSUB_CALLBACK_URL') or None  # e.g. https://bot.example.com
+    WEBSUB_HOST: str = '0.0.0.0'  # callback server bind address
+    WEBSUB_PORT: int = int(os.getenv('WEBSUB_PORT', 8081))
+    WEBSUB_LEASE_SECONDS: int = 86400  # requested subscription lease (renewed automatically)
+    WEBSUB_POLL_INTERVAL: int = 3600  # safety-net polling for feeds with an active push subscription
+    
+    # Ingestion process: 'inline' runs fetch/dedup/translate on the bot's event loop,
+    # 'worker' leaves it to news_worker.py, which queues posts in the SQLite outbox
+    INGEST_MODE: str = os.getenv('INGEST_MODE', 'inline')
+    OUTBOX_POLL_INTERVAL: float = 2.0  # seconds between outbox checks by the bot
+    OUTBOX_BATCH_SIZE: int = 20  # queued posts sent per check
+    OUTBOX_MAX_ATTEMPTS: int = 3  # failed sends before a queued post is dropped
+    
+    # In-memory posted-article index (Bloom prefilter + recent IDs per guild/source)
+    POSTED_INDEX_ENABLED: bool = os.getenv('POSTED_INDEX_ENABLED', 'true').lower() == 'true'
+    POSTED_INDEX_MIN_CAPACITY: int = 100_000  # Bloom sizing floor (articles)
+    POSTED_INDEX_FP_RATE: float = 0.01  # Bloom false-positive target (each costs a DB lookup)
+    POSTED_INDEX_RECENT: int = 200  # IDs kept exactly per guild/source
+    
+    # SQLite connection pool and tuning
+    DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', 4))  # idle connections kept per pool (read-write and read-only)
+    DB_BUSY_TIMEOUT_MS: int = int(os.getenv('DB_BUSY_TIMEOUT_MS', 5000))  # wait this long for a lock before "database is locked"
+    DB_CACHE_SIZE_KB: int = 16384  # page cache per connection
+    DB_MMAP_SIZE: int = 64 * 1024 * 1024  # bytes of the file memory-mapped for reads
+    DB_WRITE_BEHIND_INTERVAL: float = float(os.getenv('DB_WRITE_BEHIND_INTERVAL', 2.0))  # seconds posted marks/cache writes may wait in memory (0 = write through)
+    DB_WRITE_BEHIND_MAX_ROWS: int = int(os.getenv('DB_WRITE_BEHIND_MAX_ROWS', 200))  # flush early once this many writes are buffered
+    
+    # Concurrency limits for the news cycle
+    FETCH_CONCURRENCY: int = 10  # Concurrent source/feed fetches
+    TRANSLATE_CONCURRENCY: int = 4  # Concurrent translation calls
+    POST_CONCURRENCY: int = 5  # Concurrent channel.send calls
     
     # Translation settings  
     TRANSLATION_MAX_LENGTH: int = 4096  # Max characters for translation
@@ -20,11 +61,38 @@ class BotConfig:
     MAX_RETRIES: int = 3
     RETRY_BASE_DELAY: int = 1  # seconds
     RETRY_MAX_DELAY: int = 60  # seconds
+    RETRY_BUDGET_RATIO: float = float(os.getenv('RETRY_BUDGET_RATIO', 0.1))  # Retries allowed per request, shared by all retry policies
+    RETRY_BUDGET_MAX_TOKENS: int = 10  # Retry burst allowed after a quiet period
+    RETRY_DEADLINE_MARGIN: float = 2.0  # seconds an attempt needs before the caller's deadline
     
     # HTTP request settings
     REQUEST_TIMEOUT: int = 30  # seconds
     USER_AGENT: str = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     
+    # Shared HTTP connection pool
+    HTTP_POOL_LIMIT: int = 100  # Max open connections overall
+    HTTP_LIMIT_PER_HOST: int = 8  # Max open connections per host
+    HTTP_DNS_CACHE_TTL: int = 300  # seconds
+    HTTP_KEEPALIVE_TIMEOUT: int = 60  # seconds to keep idle connections
+    HTTP_CONNECT_TIMEOUT: int = 10  # seconds to get a connection (incl. DNS/TLS)
+    HTTP_READ_TIMEOUT: int = 20  # seconds between received chunks
+    
+    # Per-host politeness (shared by the news loop and the health checker)
+    HOST_CONCURRENCY: int = int(os.getenv('HOST_CONCURRENCY', 2))  # Requests in flight per host
+    HOST_MIN_INTERVAL: float = float(os.getenv('HOST_MIN_INTERVAL', 1.0))  # Seconds between request starts per host
+    HOST_OVERRIDES: str = os.getenv('HOST_OVERRIDES', '')  # 'host=concurrency:interval,...', e.g. 'cointelegraph.com=1:2'
+    
+    # Circuit breakers per source / feed host
+    BREAKER_FAILURE_THRESHOLD: int = 3  # Failed fetches within the window that open a circuit
+    BREAKER_WINDOW: int = 1800  # seconds
+    BREAKER_OPEN_SECONDS: int = 600  # First open period; doubles after each failed probe
+    BREAKER_MAX_OPEN_SECONDS: int = 21600  # 6 hours
+    
+    # Feed parsing
+    PARSE_MODE: str = 'thread'  # 'inline', 'thread' or 'process'
+    PARSE_POOL_WORKERS: int = 4  # Dedicated parse threads/processes
+    HTML_PARSER: str = 'auto'  # Scraper backend: 'auto' (lxml when installed), 'lxml' or 'html.parser'
+    
     # File paths
     DATA_DIR: str = 'data'
     LOGS_DIR: str = 'logs'
@@ -40,10 +108,16 @@ class BotConfig:
     # RSS Feed settings
     RSS_MAX_ENTRIES: int = 5  # Max entries to fetch per RSS feed
     RSS_CACHE_TTL: int = 300  # seconds (5 minutes)
+    RSS_CACHE_MAX_ENTRIES: int = 256  # Response cache size (LRU beyond this)
+    RSS_CACHE_MAX_BYTES: int = 16 * 1024 * 1024  # Response cache total body size
+    RSS_CACHE_LOOP_MAX_AGE: int = 60  # Oldest cached body the news loop accepts (seconds)
+    RSS_STREAMING_PARSER: bool = True  # Incremental parser that stops at the entry limit
     
     # News source limits
     GLASSNODE_MAX_ARTICLES: int = 5
-    SANTIMENT_MAX_ARTICLES: int = 5
+    SANTIMENT_MAX_ARTICLES: int = 5  # Also the page size of each Santiment request
+    SANTIMENT_MAX_PAGES: int = 4  # Backlog pages fetched per poll after downtime
+    SANTIMENT_DAILY_QUOTA: int = 100  # API requests per UTC day (free tier)
     THEBLOCK_MAX_ARTICLES: int = 5
     PHUTCRYPTO_MAX_ARTICLES: int = 5
     
@@ -63,11 +137,57 @@ class BotConfig:
         if self.NEWS_CHECK_INTERVAL < 60:
             raise ValueError("NEWS_CHECK_INTERVAL must be at least 60 seconds")
         
+        if not self.POLL_TICK_SECONDS <= self.POLL_MIN_INTERVAL <= self.POLL_MAX_INTERVAL:
+            raise ValueError("Poll intervals must satisfy POLL_TICK_SECONDS <= POLL_MIN_INTERVAL <= POLL_MAX_INTERVAL")
+        
+        if self.CYCLE_DEADLINE < 5:
+            raise ValueError("CYCLE_DEADLINE must be at least 5 seconds")
+        
+        if not 0 <= self.POLL_JITTER < 1:
+            raise ValueError("POLL_JITTER must be between 0 and 1")
+        
         if self.MAX_RETRIES < 1:
             raise ValueError("MAX_RETRIES must be at least 1")
         
+        if not 0 <= self.RETRY_BUDGET_RATIO <= 1:
+            raise ValueError("RETRY_BUDGET_RATIO must be between 0 and 1")
+        
         if self.REQUEST_TIMEOUT < 5:
             raise ValueError("REQUEST_TIMEOUT must be at least 5 seconds")
+        
+        if self.INGEST_MODE not in ('inline', 'worker'):
+            raise ValueError("INGEST_MODE must be 'inline' or 'worker'")
+        
+        if self.OUTBOX_POLL_INTERVAL <= 0:
+            raise ValueError("OUTBOX_POLL_INTERVAL must be positive")
+        
+        if self.DB_WRITE_BEHIND_INTERVAL < 0:
+            raise ValueError("DB_WRITE_BEHIND_INTERVAL must not be negative")
+        
+        if not 0 < self.POSTED_INDEX_FP_RATE < 1:
+            raise ValueError("POSTED_INDEX_FP_RATE must be between 0 and 1")
+        
+        if self.PARSE_MODE not in ('inline', 'thread', 'process'):
+            raise ValueError("PARSE_MODE must be 'inline', 'thread' or 'process'")
+        
+        if self.HTML_PARSER not in ('auto', 'lxml', 'html.parser'):
+            raise ValueError("HTML_PARSER must be 'auto', 'lxml' or 'html.parser'")
+        
+        if self.HOST_MIN_INTERVAL < 0:
+            raise ValueError("HOST_MIN_INTERVAL must not be negative")
+        
+        if not 0 < self.BREAKER_OPEN_SECONDS <= self.BREAKER_MAX_OPEN_SECONDS:
+            raise ValueError("Breaker open periods must satisfy 0 < BREAKER_OPEN_SECONDS <= BREAKER_MAX_OPEN_SECONDS")
+        
+        if self.RSS_CACHE_TTL < 0:
+            raise ValueError("RSS_CACHE_TTL must not be negative")
+        
+        for name in ('FETCH_CONCURRENCY', 'TRANSLATE_CONCURRENCY', 'POST_CONCURRENCY', 'PARSE_POOL_WORKERS',
+                     'HOST_CONCURRENCY', 'BREAKER_FAILURE_THRESHOLD', 'RSS_CACHE_MAX_ENTRIES', 'SANTIMENT_MAX_PAGES', 'SANTIMENT_DAILY_QUOTA',
+                     'OUTBOX_BATCH_SIZE', 'OUTBOX_MAX_ATTEMPTS', 'POSTED_INDEX_MIN_CAPACITY', 'POSTED_INDEX_RECENT',
+                     'DB_POOL_SIZE', 'DB_BUSY_TIMEOUT_MS', 'DB_WRITE_BEHIND_MAX_ROWS'):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} must be at least 1")
 
 
 # Global config instance
@@ -6,6 +6,7 @@ Real-time monitoring and management interface
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
 from functools import wraps
 import sys
+import time
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -17,13 +18,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 load_dotenv()
 
 from database import Database
+from config import BotConfig as bot_config
 from translation_cache import TranslationCache
 from datetime import datetime, timedelta
 
 app = Flask(__name__)
 app.secret_key = os.getenv('DASHBOARD_SECRET_KEY', 'your-secret-key-change-in-production')
 
-# Initialize database and cache
+# Initialize database and cache (page queries use db.read(): read-only connections
+# that, with WAL, never block the bot's writes)
 db = Database('data/news_bot.db')
 cache = TranslationCache()  # No argument needed
 
@@ -94,7 +97,8 @@ def guilds():
 def feeds():
     """Manage RSS feeds"""
     all_feeds = db.get_all_rss_feeds()
-    return render_template('feeds.html', feeds=all_feeds)
+    circuits = db.get_circuit_breakers()
+    return render_template('feeds.html', feeds=all_feeds, circuits=circuits, now=time.time())
 
 
 @app.route('/feeds/add', methods=['POST'])
@@ -161,7 +165,7 @@ def articles():
     per_page = 50
     offset = (page - 1) * per_page
     
-    with db.connect() as conn:
+    with db.read() as conn:
         cursor = conn.execute('''
             SELECT source, article_hash, posted_at
             FROM posted_articles
@@ -220,7 +224,7 @@ def cache_view():
     cache_stats = cache.get_stats()
     
     # Get sample cached translations
-    with db.connect() as conn:
+    with db.read() as conn:
         cursor = conn.execute('''
             SELECT text_hash, 
                    substr(translated_text, 1, 100) as preview,
@@ -232,9 +236,15 @@ def cache_view():
         ''')
         cached_items = cursor.fetchall()
     
+    # Feed response cache stats (snapshot saved by the bot every news cycle)
+    response_cache_stats = db.get_runtime_stats('response_cache')
+    host_stats = db.get_runtime_stats('host_scheduler')
+    
     return render_template('cache.html',
         cache_stats=cache_stats,
-        cached_items=cached_items
+        cached_items=cached_items,
+        response_cache_stats=response_cache_stats,
+        host_stats=host_stats
     )
 
 
@@ -243,7 +253,7 @@ def health():
     """Health check endpoint for monitoring"""
     try:
         # Check database connection
-        with db.connect() as conn:
+        with db.read() as conn:
             conn.execute('SELECT 1')
         
         # Get basic stats
@@ -255,7 +265,10 @@ def health():
             'timestamp': datetime.now().isoformat(),
             'database': 'connected',
             'guilds': len(guilds),
-            'feeds': len([f for f in feeds if f.get('enabled', False)])
+            'feeds': len([f for f in feeds if f.get('enabled', False)]),
+            'open_circuits': len([c for c in db.get_circuit_breakers() if c['state'] == 'open']),
+            # Posts queued by the ingestion worker (INGEST_MODE=worker) and not yet sent
+            'outbox_pending': db.get_outbox_stats(bot_config.OUTBOX_MAX_ATTEMPTS)['pending']
         }), 200
     except Exception as e:
         return jsonify({
@@ -5,38 +5,154 @@ SQLite-based persistent storage with atomic operations
 
 import sqlite3
 import json
+import threading
 from contextlib import contextmanager
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple
 from datetime import datetime
 from pathlib import Path
 
 from logger_config import get_logger
+from config import BotConfig as bot_config
+from async_database import AsyncDatabase
+from write_behind import WriteBehindBuffer
 
 logger = get_logger('database')
 
+# Candidate rows per dedup query (3 parameters each, below SQLite's 999 limit)
+DEDUP_CHUNK_ROWS = 300
+
 
 class Database:
-    """SQLite database manager for bot data"""
+    """
+    SQLite database manager for bot data
+    
+    Connections are long-lived and pooled: connect() hands out a read-write
+    connection, read() a read-only one (dashboard pages, lookups). The file
+    runs in WAL mode so readers never block the bot's writes. When a pool is
+    empty (nested calls, streaming generators) an extra connection is opened
+    and closed once more than `pool_size` are idle.
+    
+    With `write_behind_interval` > 0, posted marks, translation saves and
+    cache hit counts are buffered (see WriteBehindBuffer) and flushed on the
+    writer thread; reads in this process add the buffered rows to what they
+    find in the file.
+    """
     
-    def __init__(self, db_path: str = 'data/news_bot.db'):
+    def __init__(self, db_path: str = 'data/news_bot.db', pool_size: int = bot_config.DB_POOL_SIZE,
+                 write_behind_interval: float = bot_config.DB_WRITE_BEHIND_INTERVAL):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool_size = pool_size
+        self._pool: List[sqlite3.Connection] = []
+        self._read_pool: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self.connections_opened = 0
+        self.commits = 0
+        self._aio: Optional[AsyncDatabase] = None
+        # Called with [(guild_id, source, article_id), ...] after posts/queued posts are stored
+        self._posted_listeners: List[Callable[[List[Tuple[int, str, str]]], None]] = []
         self.init_db()
+        self.write_behind: Optional[WriteBehindBuffer] = (
+            WriteBehindBuffer(self, write_behind_interval, bot_config.DB_WRITE_BEHIND_MAX_ROWS)
+            if write_behind_interval > 0 else None
+        )
         logger.info(f"Database initialized at {self.db_path}")
     
+    @property
+    def aio(self) -> AsyncDatabase:
+        """Awaitable facade for coroutines (queries run off the event loop)"""
+        if self._aio is None:
+            self._aio = AsyncDatabase(self)
+        return self._aio
+    
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            conn = sqlite3.connect(
+                f'{self.db_path.resolve().as_uri()}?mode=ro', uri=True,
+                timeout=bot_config.DB_BUSY_TIMEOUT_MS / 1000, check_same_thread=False
+            )
+        else:
+            conn = sqlite3.connect(
+                str(self.db_path), timeout=bot_config.DB_BUSY_TIMEOUT_MS / 1000, check_same_thread=False
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')  # WAL stays consistent; only the last commits may roll back on power loss
+        conn.execute(f'PRAGMA busy_timeout={int(bot_config.DB_BUSY_TIMEOUT_MS)}')
+        conn.execute(f'PRAGMA cache_size={-int(bot_config.DB_CACHE_SIZE_KB)}')
+        conn.execute(f'PRAGMA mmap_size={int(bot_config.DB_MMAP_SIZE)}')
+        conn.row_factory = sqlite3.Row  # Enable dict-like row access
+        self.connections_opened += 1
+        return conn
+    
+    def _acquire(self, pool: List[sqlite3.Connection], read_only: bool) -> sqlite3.Connection:
+        with self._pool_lock:
+            if pool:
+                return pool.pop()
+        return self._open(read_only)
+    
+    def _release(self, pool: List[sqlite3.Connection], conn: sqlite3.Connection):
+        with self._pool_lock:
+            if len(pool) < self.pool_size:
+                pool.append(conn)
+                return
+        conn.close()
+    
     @contextmanager
     def connect(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Enable dict-like row access
+        """Read-write connection from the pool; commits on success, rolls back on error"""
+        conn = self._acquire(self._pool, read_only=False)
         try:
             yield conn
             conn.commit()
+            self.commits += 1
         except Exception as e:
-            conn.rollback()
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                conn.close()
+                conn = None
             logger.error(f"Database error: {e}", exc_info=True)
             raise
         finally:
+            if conn is not None:
+                self._release(self._pool, conn)
+    
+    @contextmanager
+    def read(self):
+        """Read-only connection from the pool (writes raise sqlite3.OperationalError)"""
+        conn = self._acquire(self._read_pool, read_only=True)
+        try:
+            yield conn
+        except Exception as e:
+            logger.error(f"Database error: {e}", exc_info=True)
+            raise
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._release(self._read_pool, conn)
+    
+    def flush_writes(self):
+        """Commit buffered (write-behind) writes now, on the calling thread"""
+        if self.write_behind is not None:
+            self.write_behind.flush()
+    
+    def _pending_posted_keys(self) -> Set[Tuple[int, str, str]]:
+        """(guild_id, source, article_id) of buffered posted marks"""
+        if self.write_behind is None:
+            return set()
+        return {(guild_id, source, article_id) for guild_id, article_id, source, _, _ in self.write_behind.pending_posted()}
+    
+    def close(self):
+        """Finish queued async queries, flush buffered writes and close every idle pooled connection"""
+        if self.write_behind is not None:
+            self.write_behind.close()
+        if self._aio is not None:
+            self._aio.close()
+        self.flush_writes()  # rows added by queries that were still queued
+        with self._pool_lock:
+            pools = self._pool + self._read_pool
+            self._pool, self._read_pool = [], []
+        for conn in pools:
             conn.close()
     
     def init_db(self):
@@ -97,7 +213,93 @@ class Database:
                 )
             ''')
             
+            # HTTP validators and conditional GET stats per feed URL
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS feed_validators (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body_size INTEGER DEFAULT 0,
+                    request_count INTEGER DEFAULT 0,
+                    not_modified_count INTEGER DEFAULT 0,
+                    bytes_downloaded INTEGER DEFAULT 0,
+                    bytes_saved INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Feed body digests table (skip parsing byte-identical bodies)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS feed_body_digests (
+                    feed_key TEXT PRIMARY KEY,
+                    digest TEXT NOT NULL,
+                    unchanged_count INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Runtime stats table (bot -> dashboard snapshots)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS runtime_stats (
+                    name TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Incremental fetch cursors (e.g. Santiment publishedAt high-water mark)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS source_cursors (
+                    source TEXT PRIMARY KEY,
+                    cursor TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Per-day API usage for quota-limited sources
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS api_usage (
+                    service TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    requests INTEGER DEFAULT 0,
+                    items INTEGER DEFAULT 0,
+                    PRIMARY KEY (service, day)
+                )
+            ''')
+            
+            # Circuit breaker state per source / feed host
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS circuit_breakers (
+                    breaker_key TEXT PRIMARY KEY,
+                    state TEXT NOT NULL DEFAULT 'closed',
+                    failures TEXT NOT NULL DEFAULT '[]',
+                    opened_until REAL,
+                    open_seconds REAL,
+                    trips INTEGER DEFAULT 0,
+                    last_error TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Ready-to-post articles handed from the ingestion worker to the bot
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS news_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    guild_id INTEGER NOT NULL,
+                    channel_id INTEGER NOT NULL,
+                    article_id TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    attempts INTEGER DEFAULT 0,
+                    last_error TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    posted_at TIMESTAMP,
+                    UNIQUE(guild_id, article_id, source)
+                )
+            ''')
+            
             # Create indexes for performance
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_outbox_pending ON news_outbox(posted_at, id)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_posted_guild_source ON posted_articles(guild_id, source)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_posted_article_id ON posted_articles(article_id)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_rss_guild ON rss_feeds(guild_id)')
@@ -109,7 +311,7 @@ class Database:
     
     def get_guild_config(self, guild_id: int) -> Dict[str, Any]:
         """Get configuration for a guild"""
-        with self.connect() as conn:
+        with self.read() as conn:
             cursor = conn.execute(
                 'SELECT * FROM guild_configs WHERE guild_id = ?',
                 (guild_id,)
@@ -160,7 +362,7 @@ class Database:
     
     def get_rss_feeds(self, guild_id: int) -> List[Dict[str, Any]]:
         """Get all RSS feeds for a guild"""
-        with self.connect() as conn:
+        with self.read() as conn:
             cursor = conn.execute(
                 'SELECT id, name, url, channel_id, enabled FROM rss_feeds WHERE guild_id = ? AND enabled = 1',
                 (guild_id,)
@@ -189,7 +391,7 @@ class Database:
     
     def get_all_rss_feeds(self) -> List[Dict[str, Any]]:
         """Get all RSS feeds across all guilds"""
-        with self.connect() as conn:
+        with self.read() as conn:
             cursor = conn.execute('''
                 SELECT id as feed_id, guild_id, name as source_name, url, enabled
                 FROM rss_feeds
@@ -199,7 +401,7 @@ class Database:
     
     def get_all_guild_configs(self) -> List[Dict[str, Any]]:
         """Get all guild configurations"""
-        with self.connect() as conn:
+        with self.read() as conn:
             cursor = conn.execute('''
                 SELECT guild_id, glassnode_channel, santiment_channel,
                        phutcrypto_channel, theblock_channel
@@ -223,39 +425,134 @@ class Database:
             conn.execute('DELETE FROM rss_feeds WHERE id = ?', (feed_id,))
             logger.info(f"Deleted RSS feed {feed_id}")
     
+    def set_rss_feed_enabled(self, feed_id: int, enabled: bool):
+        """Enable or disable an RSS feed by ID"""
+        with self.connect() as conn:
+            conn.execute('UPDATE rss_feeds SET enabled = ? WHERE id = ?', (enabled, feed_id))
+    
     # ==================== Posted Articles Methods ====================
     
     def is_article_posted(self, guild_id: int, article_id: str, source: str) -> bool:
         """Check if article was already posted"""
-        with self.connect() as conn:
+        if (guild_id, source, article_id) in self._pending_posted_keys():
+            return True
+        with self.read() as conn:
             cursor = conn.execute(
                 'SELECT 1 FROM posted_articles WHERE guild_id = ? AND article_id = ? AND source = ?',
                 (guild_id, article_id, source)
             )
             return cursor.fetchone() is not None
     
+    def filter_unposted(self, guild_id: int, source: str, article_ids: Iterable[str]) -> List[str]:
+        """Return the candidate IDs not yet posted for a guild/source (one query)"""
+        return self.filter_unposted_many({(guild_id, source): article_ids})[(guild_id, source)]
+    
+    def filter_unposted_many(
+        self,
+        candidates: Dict[Tuple[int, str], Iterable[str]],
+        include_queued: bool = False
+    ) -> Dict[Tuple[int, str], List[str]]:
+        """
+        Return the unseen candidate IDs of many (guild_id, source) pairs at once
+        
+        All pairs share one connection and one indexed query per
+        DEDUP_CHUNK_ROWS candidates. With include_queued, articles waiting
+        in the news outbox count as seen too. Candidate order is kept.
+        """
+        candidates = {key: list(dict.fromkeys(ids)) for key, ids in candidates.items()}
+        rows = [(guild_id, source, article_id) for (guild_id, source), ids in candidates.items() for article_id in ids]
+        
+        # Buffered marks first: once a flush drops them they are committed
+        seen = self._pending_posted_keys()
+        with self.read() as conn:
+            for start in range(0, len(rows), DEDUP_CHUNK_ROWS):
+                chunk = rows[start:start + DEDUP_CHUNK_ROWS]
+                query = f'''
+                    WITH candidates(guild_id, source, article_id) AS (VALUES {', '.join(['(?, ?, ?)'] * len(chunk))})
+                    SELECT c.guild_id, c.source, c.article_id FROM candidates c
+                    WHERE EXISTS (
+                        SELECT 1 FROM posted_articles p
+                        WHERE p.guild_id = c.guild_id AND p.article_id = c.article_id AND p.source = c.source
+                    )
+                '''
+                if include_queued:
+                    query += '''
+                    OR EXISTS (
+                        SELECT 1 FROM news_outbox o
+                        WHERE o.guild_id = c.guild_id AND o.article_id = c.article_id AND o.source = c.source
+                    )
+                    '''
+                cursor = conn.execute(query, [value for row in chunk for value in row])
+                seen.update(tuple(row) for row in cursor.fetchall())
+        
+        return {
+            (guild_id, source): [article_id for article_id in ids if (guild_id, source, article_id) not in seen]
+            for (guild_id, source), ids in candidates.items()
+        }
+    
     def mark_article_posted(self, guild_id: int, article_id: str, source: str, 
                            title: str = None, url: str = None):
         """Mark article as posted"""
-        with self.connect() as conn:
-            conn.execute('''
-                INSERT OR IGNORE INTO posted_articles (guild_id, article_id, source, title, url)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (guild_id, article_id, source, title, url))
+        if self.write_behind is not None:
+            self.write_behind.add_posted((guild_id, article_id, source, title, url))
+        else:
+            with self.connect() as conn:
+                conn.execute('''
+                    INSERT OR IGNORE INTO posted_articles (guild_id, article_id, source, title, url)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (guild_id, article_id, source, title, url))
+        self._notify_posted([(guild_id, source, article_id)])
+    
+    def add_posted_listener(self, listener: Callable[[List[Tuple[int, str, str]]], None]):
+        """Register a callback for articles marked posted or queued (e.g. an in-memory index)"""
+        self._posted_listeners.append(listener)
+    
+    def _notify_posted(self, keys: List[Tuple[int, str, str]]):
+        for listener in self._posted_listeners:
+            try:
+                listener(keys)
+            except Exception as e:
+                logger.error(f"Posted-article listener failed: {e}", exc_info=True)
+    
+    def count_posted_keys(self, include_queued: bool = False) -> int:
+        """Number of posted (and optionally queued) guild/source/article rows"""
+        pending = len(self._pending_posted_keys())
+        with self.read() as conn:
+            total = pending + conn.execute('SELECT COUNT(*) FROM posted_articles').fetchone()[0]
+            if include_queued:
+                total += conn.execute('SELECT COUNT(*) FROM news_outbox').fetchone()[0]
+            return total
+    
+    def iter_posted_keys(self, include_queued: bool = False) -> Iterator[Tuple[int, str, str]]:
+        """Stream (guild_id, source, article_id) of posted (and queued) articles, oldest first (buffered marks last)"""
+        pending = self.write_behind.pending_posted() if self.write_behind is not None else []
+        query = 'SELECT guild_id, source, article_id, posted_at AS at FROM posted_articles'
+        if include_queued:
+            query += ' UNION ALL SELECT guild_id, source, article_id, created_at AS at FROM news_outbox'
+        with self.read() as conn:
+            for row in conn.execute(query + ' ORDER BY at'):
+                yield row['guild_id'], row['source'], row['article_id']
+        for guild_id, article_id, source, _, _ in pending:
+            yield guild_id, source, article_id
     
     def get_posted_articles(self, guild_id: int, source: str, limit: int = 100) -> List[str]:
         """Get list of posted article IDs for a source"""
-        with self.connect() as conn:
+        pending = [
+            row[1] for row in reversed(self.write_behind.pending_posted())
+            if row[0] == guild_id and row[2] == source
+        ] if self.write_behind is not None else []
+        with self.read() as conn:
             cursor = conn.execute('''
                 SELECT article_id FROM posted_articles
                 WHERE guild_id = ? AND source = ?
                 ORDER BY posted_at DESC
                 LIMIT ?
             ''', (guild_id, source, limit))
-            return [row['article_id'] for row in cursor.fetchall()]
+            return list(dict.fromkeys(pending + [row['article_id'] for row in cursor.fetchall()]))[:limit]
     
     def cleanup_old_articles(self, days: int = 30):
         """Remove posted articles older than X days"""
+        self.flush_writes()
         with self.connect() as conn:
             cursor = conn.execute('''
                 DELETE FROM posted_articles
@@ -269,6 +566,20 @@ class Database:
     
     def get_translation(self, text_hash: str) -> Optional[str]:
         """Get cached translation"""
+        if self.write_behind is not None:
+            # Pure read: the hit is counted in memory and flushed later
+            translated = self.write_behind.pending_translation(text_hash)
+            if translated is None:
+                with self.read() as conn:
+                    row = conn.execute(
+                        'SELECT translated_text FROM translation_cache WHERE text_hash = ?',
+                        (text_hash,)
+                    ).fetchone()
+                translated = row['translated_text'] if row else None
+            if translated is not None:
+                self.write_behind.add_use(text_hash)
+            return translated
+        
         with self.connect() as conn:
             cursor = conn.execute(
                 'SELECT translated_text FROM translation_cache WHERE text_hash = ?',
@@ -289,6 +600,9 @@ class Database:
     
     def save_translation(self, text_hash: str, original: str, translated: str):
         """Save translation to cache"""
+        if self.write_behind is not None:
+            self.write_behind.add_translation(text_hash, original, translated)
+            return
         with self.connect() as conn:
             conn.execute('''
                 INSERT OR REPLACE INTO translation_cache (text_hash, original_text, translated_text)
@@ -296,17 +610,21 @@ class Database:
             ''', (text_hash, original, translated))
     
     def get_cache_stats(self) -> Dict[str, int]:
-        """Get translation cache statistics"""
-        with self.connect() as conn:
+        """Get translation cache statistics (buffered saves and hits included)"""
+        pending_entries, pending_uses = (
+            self.write_behind.pending_cache_counts() if self.write_behind is not None else (0, 0)
+        )
+        with self.read() as conn:
             cursor = conn.execute('SELECT COUNT(*), SUM(use_count) FROM translation_cache')
             row = cursor.fetchone()
             return {
-                'total_entries': row[0] or 0,
-                'total_uses': row[1] or 0
+                'total_entries': (row[0] or 0) + pending_entries,
+                'total_uses': (row[1] or 0) + pending_uses
             }
     
     def cleanup_old_translations(self, days: int = 90):
         """Remove unused translations older than X days"""
+        self.flush_writes()
         with self.connect() as conn:
             cursor = conn.execute('''
                 DELETE FROM translation_cache
@@ -316,11 +634,302 @@ class Database:
             logger.info(f"Cleaned up {deleted} old translations (>{days} days)")
             return deleted
     
+    # ==================== Feed Validator Methods ====================
+    
+    def get_feed_validators(self, url: str) -> Dict[str, Any]:
+        """Get stored ETag/Last-Modified validators for a feed URL"""
+        with self.read() as conn:
+            cursor = conn.execute(
+                'SELECT etag, last_modified, body_size FROM feed_validators WHERE url = ?',
+                (url,)
+            )
+            row = cursor.fetchone()
+            if row:
+                return dict(row)
+            return {'etag': None, 'last_modified': None, 'body_size': 0}
+    
+    def save_feed_response(self, url: str, etag: Optional[str], last_modified: Optional[str],
+                           body_size: int, not_modified: bool):
+        """
+        Record one conditional GET response for a feed
+        
+        On 200 the validators and body size are replaced; on 304 they are kept
+        and the previous body size is counted as bytes saved.
+        """
+        with self.connect() as conn:
+            conn.execute('''
+                INSERT INTO feed_validators (
+                    url, etag, last_modified, body_size,
+                    request_count, not_modified_count, bytes_downloaded, bytes_saved
+                ) VALUES (?, ?, ?, ?, 1, ?, ?, 0)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = CASE WHEN ? THEN etag ELSE excluded.etag END,
+                    last_modified = CASE WHEN ? THEN last_modified ELSE excluded.last_modified END,
+                    body_size = CASE WHEN ? THEN body_size ELSE excluded.body_size END,
+                    request_count = request_count + 1,
+                    not_modified_count = not_modified_count + excluded.not_modified_count,
+                    bytes_downloaded = bytes_downloaded + excluded.bytes_downloaded,
+                    bytes_saved = bytes_saved + CASE WHEN ? THEN body_size ELSE 0 END,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (
+                url, etag, last_modified, body_size,
+                int(not_modified), 0 if not_modified else body_size,
+                not_modified, not_modified, not_modified, not_modified
+            ))
+    
+    def save_feed_validators(self, url: str, etag: Optional[str], last_modified: Optional[str]):
+        """Store the validators of a feed body whose articles were handled"""
+        with self.connect() as conn:
+            conn.execute('''
+                UPDATE feed_validators SET etag = ?, last_modified = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE url = ?
+            ''', (etag, last_modified, url))
+    
+    def get_feed_conditional_stats(self) -> List[Dict[str, Any]]:
+        """Get conditional GET statistics (304 rate, bytes saved) per feed"""
+        with self.read() as conn:
+            cursor = conn.execute('''
+                SELECT url, request_count, not_modified_count, bytes_downloaded, bytes_saved,
+                       ROUND(100.0 * not_modified_count / MAX(request_count, 1), 1) AS not_modified_rate
+                FROM feed_validators
+                ORDER BY bytes_saved DESC
+            ''')
+            return [dict(row) for row in cursor.fetchall()]
+    
+    # ==================== Body Digest Methods ====================
+    
+    def get_body_digest(self, feed_key: str) -> Optional[str]:
+        """Get the digest of the last parsed body for a feed"""
+        with self.read() as conn:
+            cursor = conn.execute(
+                'SELECT digest FROM feed_body_digests WHERE feed_key = ?',
+                (feed_key,)
+            )
+            row = cursor.fetchone()
+            return row['digest'] if row else None
+    
+    def save_body_digest(self, feed_key: str, digest: str, unchanged: bool):
+        """Store a feed's body digest; unchanged bodies only bump the hit counter"""
+        with self.connect() as conn:
+            conn.execute('''
+                INSERT INTO feed_body_digests (feed_key, digest, unchanged_count)
+                VALUES (?, ?, ?)
+                ON CONFLICT(feed_key) DO UPDATE SET
+                    digest = excluded.digest,
+                    unchanged_count = unchanged_count + excluded.unchanged_count,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (feed_key, digest, int(unchanged)))
+    
+    def get_body_digest_stats(self) -> List[Dict[str, Any]]:
+        """Get unchanged-body hit counts per feed"""
+        with self.read() as conn:
+            cursor = conn.execute('''
+                SELECT feed_key, unchanged_count, updated_at
+                FROM feed_body_digests
+                ORDER BY unchanged_count DESC
+            ''')
+            return [dict(row) for row in cursor.fetchall()]
+    
+    # ==================== Circuit Breaker Methods ====================
+    
+    def get_circuit_breaker(self, breaker_key: str) -> Optional[Dict[str, Any]]:
+        """Get persisted circuit breaker state (failures decoded to a list)"""
+        with self.read() as conn:
+            cursor = conn.execute(
+                'SELECT * FROM circuit_breakers WHERE breaker_key = ?',
+                (breaker_key,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            data = dict(row)
+            data['failures'] = json.loads(data['failures'])
+            return data
+    
+    def save_circuit_breaker(
+        self,
+        breaker_key: str,
+        state: str,
+        failures: List[float],
+        opened_until: Optional[float],
+        open_seconds: Optional[float],
+        trips: int,
+        last_error: Optional[str]
+    ):
+        """Store circuit breaker state"""
+        with self.connect() as conn:
+            conn.execute('''
+                INSERT INTO circuit_breakers
+                    (breaker_key, state, failures, opened_until, open_seconds, trips, last_error)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(breaker_key) DO UPDATE SET
+                    state = excluded.state,
+                    failures = excluded.failures,
+                    opened_until = excluded.opened_until,
+                    open_seconds = excluded.open_seconds,
+                    trips = excluded.trips,
+                    last_error = excluded.last_error,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (breaker_key, state, json.dumps(failures), opened_until, open_seconds, trips, last_error))
+    
+    def get_circuit_breakers(self, include_closed: bool = False) -> List[Dict[str, Any]]:
+        """Get circuit breakers, open and half-open ones first (failures decoded to a list)"""
+        with self.read() as conn:
+            cursor = conn.execute(f'''
+                SELECT breaker_key, state, failures, opened_until, open_seconds, trips, last_error, updated_at
+                FROM circuit_breakers
+                {'' if include_closed else "WHERE state != 'closed'"}
+                ORDER BY state = 'closed', updated_at DESC
+            ''')
+            return [{**row, 'failures': json.loads(row['failures'])} for row in map(dict, cursor.fetchall())]
+    
+    # ==================== Source Cursor Methods ====================
+    
+    def get_source_cursor(self, source: str) -> Optional[str]:
+        """Get the stored incremental fetch cursor for a source"""
+        with self.read() as conn:
+            cursor = conn.execute(
+                'SELECT cursor FROM source_cursors WHERE source = ?',
+                (source,)
+            )
+            row = cursor.fetchone()
+            return row['cursor'] if row else None
+    
+    def save_source_cursor(self, source: str, value: str):
+        """Store the incremental fetch cursor for a source"""
+        with self.connect() as conn:
+            conn.execute('''
+                INSERT INTO source_cursors (source, cursor) VALUES (?, ?)
+                ON CONFLICT(source) DO UPDATE SET
+                    cursor = excluded.cursor,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (source, value))
+    
+    # ==================== API Usage Methods ====================
+    
+    def record_api_usage(self, service: str, requests: int = 1, items: int = 0):
+        """Add requests/items to today's (UTC) usage for a service"""
+        day = datetime.utcnow().strftime('%Y-%m-%d')
+        with self.connect() as conn:
+            conn.execute('''
+                INSERT INTO api_usage (service, day, requests, items) VALUES (?, ?, ?, ?)
+                ON CONFLICT(service, day) DO UPDATE SET
+                    requests = requests + excluded.requests,
+                    items = items + excluded.items
+            ''', (service, day, requests, items))
+    
+    def get_api_usage(self, service: str, days: int = 7) -> List[Dict[str, Any]]:
+        """Get per-day usage for a service, newest day first"""
+        with self.read() as conn:
+            cursor = conn.execute('''
+                SELECT day, requests, items,
+                       ROUND(1.0 * items / MAX(requests, 1), 2) AS items_per_request
+                FROM api_usage
+                WHERE service = ?
+                ORDER BY day DESC
+                LIMIT ?
+            ''', (service, days))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    # ==================== News Outbox Methods ====================
+    
+    def enqueue_posts(self, posts: List[Dict[str, Any]]) -> int:
+        """Queue ready-to-post articles; returns how many were new"""
+        with self.connect() as conn:
+            cursor = conn.executemany('''
+                INSERT OR IGNORE INTO news_outbox (guild_id, channel_id, article_id, source, payload)
+                VALUES (:guild_id, :channel_id, :article_id, :source, :payload)
+            ''', posts)
+            queued = cursor.rowcount
+        self._notify_posted([(post['guild_id'], post['source'], post['article_id']) for post in posts])
+        return queued
+    
+    def get_pending_posts(self, limit: int, max_attempts: int) -> List[Dict[str, Any]]:
+        """Oldest queued posts not yet sent (failed ones up to max_attempts)"""
+        with self.read() as conn:
+            cursor = conn.execute('''
+                SELECT id, guild_id, channel_id, article_id, source, payload, attempts
+                FROM news_outbox
+                WHERE posted_at IS NULL AND attempts < ?
+                ORDER BY id
+                LIMIT ?
+            ''', (max_attempts, limit))
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def complete_post(self, post_id: int):
+        """Mark a queued post as sent"""
+        with self.connect() as conn:
+            conn.execute(
+                'UPDATE news_outbox SET posted_at = CURRENT_TIMESTAMP, last_error = NULL WHERE id = ?',
+                (post_id,)
+            )
+    
+    def fail_post(self, post_id: int, error: str, give_up: bool = False):
+        """Record a failed send (give_up drops the post for good)"""
+        with self.connect() as conn:
+            conn.execute('''
+                UPDATE news_outbox
+                SET attempts = CASE WHEN ? THEN 1000000 ELSE attempts + 1 END, last_error = ?
+                WHERE id = ?
+            ''', (give_up, error[:200], post_id))
+    
+    def get_outbox_stats(self, max_attempts: int) -> Dict[str, Any]:
+        """Queue depth, failures and age of the oldest pending post"""
+        with self.read() as conn:
+            cursor = conn.execute('''
+                SELECT
+                    SUM(posted_at IS NULL AND attempts < ?) AS pending,
+                    SUM(posted_at IS NULL AND attempts >= ?) AS dropped,
+                    SUM(posted_at IS NOT NULL) AS posted,
+                    CAST(MAX(CASE WHEN posted_at IS NULL AND attempts < ?
+                        THEN strftime('%s', 'now') - strftime('%s', created_at) END) AS INTEGER) AS oldest_pending_age
+                FROM news_outbox
+            ''', (max_attempts, max_attempts, max_attempts))
+            row = dict(cursor.fetchone())
+            return {key: value or 0 for key, value in row.items()}
+    
+    def cleanup_outbox(self, days: int = 7):
+        """Remove sent or dropped outbox rows older than X days"""
+        with self.connect() as conn:
+            cursor = conn.execute('''
+                DELETE FROM news_outbox
+                WHERE (posted_at IS NOT NULL OR last_error IS NOT NULL)
+                  AND created_at < datetime('now', '-' || ? || ' days')
+            ''', (days,))
+            return cursor.rowcount
+    
+    # ==================== Runtime Stats Methods ====================
+    
+    def save_runtime_stats(self, name: str, stats: Dict[str, Any]):
+        """Store a snapshot of in-process stats so the dashboard can show them"""
+        with self.connect() as conn:
+            conn.execute('''
+                INSERT INTO runtime_stats (name, data) VALUES (?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    data = excluded.data,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (name, json.dumps(stats)))
+    
+    def get_runtime_stats(self, name: str) -> Dict[str, Any]:
+        """Get the latest stats snapshot (empty dict if never saved)"""
+        with self.read() as conn:
+            cursor = conn.execute(
+                'SELECT data, updated_at FROM runtime_stats WHERE name = ?',
+                (name,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return {}
+            stats = json.loads(row['data'])
+            stats['updated_at'] = row['updated_at']
+            return stats
+    
     # ==================== Statistics Methods ====================
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get overall bot statistics"""
-        with self.connect() as conn:
+        pending = self._pending_posted_keys()
+        with self.read() as conn:
             stats = {}
             
             # Total guilds
@@ -331,9 +940,9 @@ class Database:
             cursor = conn.execute('SELECT COUNT(*) FROM rss_feeds WHERE enabled = 1')
             stats['total_rss_feeds'] = cursor.fetchone()[0]
             
-            # Total articles posted
+            # Total articles posted (buffered marks included)
             cursor = conn.execute('SELECT COUNT(*) FROM posted_articles')
-            stats['total_articles'] = cursor.fetchone()[0]
+            stats['total_articles'] = cursor.fetchone()[0] + len(pending)
             
             # Articles by source
             cursor = conn.execute('''
@@ -342,6 +951,8 @@ class Database:
                 GROUP BY source
             ''')
             stats['articles_by_source'] = {row['source']: row['count'] for row in cursor.fetchall()}
+            for _, source, _ in pending:
+                stats['articles_by_source'][source] = stats['articles_by_source'].get(source, 0) + 1
             
             # Cache stats
             stats['cache'] = self.get_cache_stats()
@@ -400,6 +1011,7 @@ class Database:
                             for article_id in article_ids:
                                 self.mark_article_posted(guild_id, article_id, source)
             
+            self.flush_writes()
             logger.info("✅ Migration completed successfully!")
             
         except Exception as e:
@@ -5,9 +5,13 @@ import os
 from dotenv import load_dotenv
 import asyncio
 
-# Load environment variables
+# Load environment variables (before config is imported)
 load_dotenv()
 
+from database import get_database
+from utils.http_client import get_http_client
+from cogs.news.parsing import shutdown_parse_pool
+
 # Bot configuration
 intents = discord.Intents.default()
 intents.message_content = True
@@ -23,6 +27,9 @@ class MyBot(commands.Bot):
         
     async def setup_hook(self):
         """Load all cogs when bot starts"""
+        # Shared HTTP connection pool for all fetchers and the health checker
+        await get_http_client().start()
+        
         # Load cogs
         await self.load_extension('cogs.news_cog')
         await self.load_extension('cogs.health_checker')  # RSS Health Monitoring
@@ -31,6 +38,13 @@ class MyBot(commands.Bot):
         await self.tree.sync()
         print(f"Synced commands")
         
+    async def close(self):
+        """Close shared resources on shutdown"""
+        await super().close()
+        await get_http_client().close()
+        shutdown_parse_pool()
+        get_database().close()  # finishes queued async writes
+        
     async def on_ready(self):
         print(f'Bot đã đăng nhập: {self.user.name}')
         print(f'Bot ID: {self.user.id}')
@@ -0,0 +1,36 @@
+"""
+News ingestion worker process
+Fetches, dedups and translates news away from the Discord gateway.
+Run it next to the bot with INGEST_MODE=worker:
+
+    python news_worker.py
+"""
+
+import asyncio
+import signal
+
+from dotenv import load_dotenv
+
+# Load environment variables before config is imported
+load_dotenv()
+
+from cogs.news.worker import NewsWorker
+
+
+async def main():
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C raises KeyboardInterrupt instead
+    
+    await NewsWorker().run(stop)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,118 @@
+"""
+Database micro-benchmark
+Operations per second of the bot's hot queries with one sqlite3.connect per
+call and default journaling (the old Database.connect) versus the pooled WAL
+connections, alone and while a dashboard thread keeps reading
+
+Usage:
+    python scripts/bench_db.py --ops 5000
+"""
+
+import sys
+import os
+import time
+import sqlite3
+import argparse
+import tempfile
+import threading
+from contextlib import contextmanager
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logger_config  # noqa: F401 - configure handlers before silencing them
+import logging
+
+from database import Database
+
+
+class PerCallDatabase(Database):
+    """Database as it was: a fresh connection per call, rollback journal"""
+
+    @contextmanager
+    def connect(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    read = connect
+
+
+def workload(db: Database, ops: int) -> int:
+    """Dedup checks, posted marks, cache reads/writes and stats reads in the bot's mix"""
+    done = 0
+    for i in range(ops):
+        kind = i % 5
+        if kind == 0:
+            db.mark_article_posted(i % 50, f'https://example.com/{i}', 'glassnode')
+        elif kind == 1:
+            db.is_article_posted(i % 50, f'https://example.com/{i - 1}', 'glassnode')
+        elif kind == 2:
+            db.save_translation(f'hash{i}', 'text', 'văn bản')
+        elif kind == 3:
+            db.get_translation(f'hash{i - 1}')
+        else:
+            db.get_runtime_stats('retry')
+        done += 1
+    return done
+
+
+def dashboard(db: Database, stop: threading.Event, counts: list):
+    """Dashboard pages: statistics plus a paged article list, back to back"""
+    while not stop.is_set():
+        try:
+            db.get_statistics()
+            with db.read() as conn:
+                conn.execute('SELECT source, posted_at FROM posted_articles ORDER BY posted_at DESC LIMIT 50').fetchall()
+            counts[0] += 1
+        except sqlite3.OperationalError:
+            counts[1] += 1
+
+
+def run(cls, path: str, ops: int, with_reader: bool):
+    db = cls(path)
+    stop = threading.Event()
+    counts = [0, 0]
+    reader = threading.Thread(target=dashboard, args=(db, stop, counts))
+    if with_reader:
+        reader.start()
+    try:
+        start = time.perf_counter()
+        done = workload(db, ops)
+        elapsed = time.perf_counter() - start
+    finally:
+        stop.set()
+        if with_reader:
+            reader.join()
+    return done / elapsed, counts[0], counts[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ops', type=int, default=5000)
+    args = parser.parse_args()
+    logging.getLogger('discord_news_bot').setLevel(logging.WARNING)
+
+    print("=" * 60)
+    print(f"Database: {args.ops} mixed operations")
+    print("=" * 60)
+    print(f"{'connections':<22}{'dashboard':>10}{'ops/sec':>10}{'pages':>8}{'locked':>8}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, cls in [('per call (before)', PerCallDatabase), ('pooled WAL (after)', Database)]:
+            for with_reader in (False, True):
+                path = os.path.join(workdir, f'{cls.__name__}-{with_reader}.db')
+                rate, pages, locked = run(cls, path, args.ops, with_reader)
+                print(f"{name:<22}{'yes' if with_reader else 'no':>10}{rate:>10.0f}"
+                      f"{pages if with_reader else '-':>8}{locked if with_reader else '-':>8}")
+
+
+if __name__ == "__main__":
+    main()
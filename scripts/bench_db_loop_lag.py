@@ -0,0 +1,129 @@
+"""
+Database event-loop lag benchmark
+Runs a news cycle's database traffic from coroutines (dedup checks, posted
+marks, translation cache reads/writes, stats snapshots) while a timer
+measures how late the event loop answers, calling Database directly (before)
+and through db.aio (after). A second thread writes like the ingestion worker
+or dashboard would, so some calls wait on the SQLite lock.
+
+Usage:
+    python scripts/bench_db_loop_lag.py --deliveries 400
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+import threading
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logger_config  # noqa: F401 - configure handlers before silencing them
+import logging
+
+from database import Database
+
+
+class SyncFacade:
+    """Database calls made straight from coroutines, as the cogs used to"""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def __getattr__(self, name):
+        method = getattr(self.db, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+async def delivery(db, guild: int, n: int):
+    """One channel's share of a cycle"""
+    ids = [f'https://example.com/{guild}/{n}/{i}' for i in range(5)]
+    unseen = await db.filter_unposted(guild, 'glassnode', ids)
+    for article_id in unseen[:2]:
+        await db.get_translation(article_id)
+        await db.save_translation(article_id, 'text', 'văn bản')
+        await db.mark_article_posted(guild, article_id, 'glassnode')
+    await db.save_runtime_stats(f'bench-{guild % 10}', {'n': n})
+
+
+def contender(path: str, stop: threading.Event):
+    """Another writer on the same file: a 5ms write transaction every 20ms"""
+    other = Database(path, pool_size=1)
+    n = 0
+    while not stop.is_set():
+        with other.connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO runtime_stats (name, data) VALUES ('contender', ?)", (str(n),))
+            time.sleep(0.005)
+        n += 1
+        time.sleep(0.015)
+    other.close()
+
+
+async def measure(db, deliveries: int, concurrency: int):
+    loop = asyncio.get_running_loop()
+    samples = []
+    stop = asyncio.Event()
+
+    async def ticker(interval: float = 0.005):
+        while not stop.is_set():
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            samples.append(max(0.0, loop.time() - expected))
+
+    task = asyncio.create_task(ticker())
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(guild, n):
+        async with semaphore:
+            await delivery(db, guild, n)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded(i % 100, i) for i in range(deliveries)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await task
+    return elapsed, samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--deliveries', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=20, help='Deliveries in flight (FETCH_CONCURRENCY-like)')
+    args = parser.parse_args()
+    logging.getLogger('discord_news_bot').setLevel(logging.WARNING)
+
+    print("=" * 72)
+    print(f"Event-loop lag: {args.deliveries} deliveries, {args.concurrency} in flight, one contending writer")
+    print("=" * 72)
+    print(f"{'calls':<18}{'seconds':>9}{'lag p50 ms':>12}{'lag p99 ms':>12}{'lag max ms':>12}{'ticks':>8}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in ('sync (before)', 'db.aio (after)'):
+            path = os.path.join(workdir, f'{name.split()[0]}.db')
+            db = Database(path)
+            stop = threading.Event()
+            thread = threading.Thread(target=contender, args=(path, stop))
+            thread.start()
+            try:
+                facade = SyncFacade(db) if name.startswith('sync') else db.aio
+                elapsed, samples = asyncio.run(measure(facade, args.deliveries, args.concurrency))
+            finally:
+                stop.set()
+                thread.join()
+                db.close()
+
+            samples.sort()
+            p50 = statistics.median(samples) * 1000
+            p99 = samples[int(len(samples) * 0.99)] * 1000
+            print(f"{name:<18}{elapsed:>9.2f}{p50:>12.2f}{p99:>12.2f}{samples[-1] * 1000:>12.2f}{len(samples):>8}")
+
+
+if __name__ == "__main__":
+    main()
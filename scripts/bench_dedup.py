@@ -0,0 +1,95 @@
+"""
+Dedup lookup benchmark
+Compares the per-article is_article_posted path with filter_unposted (one
+query per channel) and filter_unposted_many (one call per cycle) on a
+scratch database
+
+Usage:
+    python scripts/bench_dedup.py --guilds 1000 --sources 4 --articles 5
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import Database
+
+
+def populate(db: Database, guilds: int, sources: int, history: int):
+    """`history` posted articles per guild/source, as after a few weeks of posting"""
+    with db.connect() as conn:
+        conn.executemany(
+            'INSERT INTO posted_articles (guild_id, article_id, source) VALUES (?, ?, ?)',
+            (
+                (guild, f'https://example.com/{source}/{i}', f'source{source}')
+                for guild in range(guilds)
+                for source in range(sources)
+                for i in range(history)
+            )
+        )
+
+
+def build_candidates(guilds: int, sources: int, articles: int, history: int):
+    """Each feed's latest entries: the newest is unseen, the rest already posted"""
+    ids = {
+        source: [f'https://example.com/{source}/{history - articles + 1 + i}' for i in range(articles)]
+        for source in range(sources)
+    }
+    return {(guild, f'source{source}'): ids[source] for guild in range(guilds) for source in range(sources)}
+
+
+def per_article(db: Database, candidates) -> int:
+    return sum(
+        not db.is_article_posted(guild, article_id, source)
+        for (guild, source), ids in candidates.items()
+        for article_id in ids
+    )
+
+
+def per_channel(db: Database, candidates) -> int:
+    return sum(len(db.filter_unposted(guild, source, ids)) for (guild, source), ids in candidates.items())
+
+
+def per_cycle(db: Database, candidates) -> int:
+    return sum(len(ids) for ids in db.filter_unposted_many(candidates).values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--guilds', type=int, default=1000)
+    parser.add_argument('--sources', type=int, default=4, help='Subscribed sources per guild')
+    parser.add_argument('--articles', type=int, default=5, help='Candidate articles per source')
+    parser.add_argument('--history', type=int, default=50, help='Posted articles per guild/source')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = Database(os.path.join(workdir, 'bench.db'))
+        populate(db, args.guilds, args.sources, args.history)
+        candidates = build_candidates(args.guilds, args.sources, args.articles, args.history)
+        checks = len(candidates) * args.articles
+
+        print("=" * 60)
+        print(f"Dedup: {args.guilds} guilds x {args.sources} sources x {args.articles} candidates ({checks} checks)")
+        print("=" * 60)
+        print(f"{'path':<28}{'seconds':>10}{'unseen':>10}{'speedup':>10}")
+
+        baseline = None
+        for name, func in [
+            ('is_article_posted', per_article),
+            ('filter_unposted', per_channel),
+            ('filter_unposted_many', per_cycle),
+        ]:
+            start = time.perf_counter()
+            unseen = func(db, candidates)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{name:<28}{elapsed:>10.3f}{unseen:>10}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
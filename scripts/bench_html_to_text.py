@@ -0,0 +1,106 @@
+"""
+HTML-to-text micro-benchmark
+Compares the previous cleaners (BeautifulSoup get_text, the RSSSource re.sub
+chain) with cogs.news.text.html_to_text, cold and with a warm memo (the same
+summaries come back on every poll)
+
+Usage:
+    python scripts/bench_html_to_text.py --texts 200 --polls 10
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+from typing import Callable, List
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from cogs.news.text import html_to_text, clear_text_memo, get_text_stats
+
+
+def build_texts(count: int, seed: int) -> List[str]:
+    """Mix of feed summaries: plain text, light markup and full HTML bodies"""
+    rng = random.Random(seed)
+    texts = []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.3:
+            texts.append(f'Bitcoin climbs as ETF inflows reach record {i}. Analysts expect more volatility.')
+        elif kind < 0.8:
+            texts.append(
+                f'<p>Market update #{i}: BTC &amp; ETH rally, it#8217;s the <b>third</b> day in a row.</p>'
+                f'<p>Read more on <a href="https://example.com/{i}">our site</a>.</p>'
+            )
+        else:
+            texts.append(''.join(
+                f'<div class="para"><p>Paragraph {j} of insight {i} with <em>emphasis</em>, '
+                f'<a href="https://example.com/{j}">links</a> &quot;quotes&quot; and numbers 1,234.</p></div>'
+                for j in range(25)
+            ))
+    return texts
+
+
+def bs4_get_text(text: str) -> str:
+    """Previous TheBlock/Santiment path"""
+    return BeautifulSoup(text or '', 'html.parser').get_text()
+
+
+def rss_re_chain(text: str) -> str:
+    """Previous RSSSource path (imports and patterns per call)"""
+    import html
+    import re
+    text = re.sub(r'#(\d+);', r'&#\1;', text)
+    text = html.unescape(text)
+    text = re.sub(r'<[^>]+>', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def run(func: Callable[[str], str], texts: List[str], polls: int) -> float:
+    """Seconds per text, cleaning the same texts once per poll"""
+    start = time.perf_counter()
+    for _ in range(polls):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) / (polls * len(texts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--texts', type=int, default=200)
+    parser.add_argument('--polls', type=int, default=10, help='Times the same texts are cleaned')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    texts = build_texts(args.texts, args.seed)
+
+    print("=" * 60)
+    print(f"HTML-to-text benchmark ({args.texts} texts x {args.polls} polls)")
+    print("=" * 60)
+    print(f"{'cleaner':<32}{'us/text':>12}{'speedup':>10}")
+
+    baseline = run(bs4_get_text, texts, args.polls)
+    print(f"{'BeautifulSoup get_text':<32}{baseline * 1e6:>12.1f}{1:>9.1f}x")
+
+    chain = run(rss_re_chain, texts, args.polls)
+    print(f"{'re.sub chain (RSSSource)':<32}{chain * 1e6:>12.1f}{baseline / chain:>9.1f}x")
+
+    def cold(text: str) -> str:
+        clear_text_memo()
+        return html_to_text(text)
+
+    cold_time = run(cold, texts, 1)
+    print(f"{'html_to_text (cold memo)':<32}{cold_time * 1e6:>12.1f}{baseline / cold_time:>9.1f}x")
+
+    clear_text_memo()
+    warm = run(html_to_text, texts, args.polls)
+    print(f"{'html_to_text (repeat polls)':<32}{warm * 1e6:>12.1f}{baseline / warm:>9.1f}x")
+    print(f"\nmemo: {get_text_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Ingestion worker benchmark
+Measures how late the bot's event loop answers (the delay an interaction or
+gateway heartbeat would see) while heavy news cycles run, with ingestion on
+the bot loop (INGEST_MODE=inline) and in news_worker's process (worker).
+
+Feeds are served by a local server in its own process; translation is a fake
+translator with a fixed per-call delay; posting is a fake send.
+
+Usage:
+    python scripts/bench_ingest_worker.py --feeds 40 --guilds 3 --cycles 3
+"""
+
+import sys
+import os
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+import statistics
+import multiprocessing
+
+# Add parent to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def build_feed(items: int, tag: str) -> bytes:
+    """RSS feed with a few KB of HTML per item; `tag` makes every poll's items new"""
+    paragraph = '&lt;p&gt;Bitcoin &lt;b&gt;price&lt;/b&gt; analysis and on-chain metrics.&lt;/p&gt;' * 40
+    body = ''.join(
+        f'<item><title>Item {i} {tag}</title><link>https://example.com/{tag}/{i}</link>'
+        f'<guid>https://example.com/{tag}/{i}</guid><description>{paragraph}</description></item>'
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>{body}</channel></rss>'.encode()
+
+
+def serve_feeds(port_queue, items: int):
+    """Feed server process"""
+    from aiohttp import web
+
+    async def handler(request):
+        tag = f"{request.match_info['name']}-{request.query.get('cycle', '0')}"
+        return web.Response(body=build_feed(items, tag), content_type='application/rss+xml')
+
+    async def main():
+        app = web.Application()
+        app.router.add_get('/feed/{name}', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port_queue.put(site._server.sockets[0].getsockname()[1])
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+def configure(workdir: str):
+    """Run against a scratch database, quiet logs, no per-host spacing"""
+    os.chdir(workdir)
+    import logger_config  # noqa: F401 (sets up handlers at INFO on import)
+    logging.getLogger('discord_news_bot').setLevel(logging.WARNING)
+
+    from config import BotConfig as bot_config
+    bot_config.HOST_OVERRIDES = '127.0.0.1=64:0'
+
+
+class FakeTranslator:
+    """Stands in for GoogleTranslator (runs in the executor like the real one)"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def translate(self, text: str) -> str:
+        time.sleep(self.delay)
+        return text.upper()
+
+
+async def run_cycles(pipeline, port: int, args):
+    """Run `cycles` news cycles of every feed through a pipeline"""
+    from cogs.news.engine import Delivery, FetchJob
+    from cogs.news.metrics import CycleMetrics
+    from cogs.news.sources import RSSSource
+
+    pipeline.translator = FakeTranslator(args.translate_delay)
+    # Measure the pipeline, not the Google Translate quota
+    pipeline.rate_limiter.add_limiter('google_translate', 10 ** 6, 60)
+    for cycle in range(args.cycles):
+        jobs = []
+        for i in range(args.feeds):
+            job = FetchJob(
+                key=f'rss:{i}',
+                fetcher=RSSSource(f'Feed {i}', f'http://127.0.0.1:{port}/feed/{i}?cycle={cycle}')
+            )
+            job.deliveries = [
+                Delivery(guild_id=guild, channel_id=guild, source_key=f'rss_{i}')
+                for guild in range(1, args.guilds + 1)
+            ]
+            jobs.append(job)
+        await pipeline.engine.run(jobs, CycleMetrics(guilds=args.guilds))
+
+
+def worker_main(workdir: str, port: int, args):
+    """Ingestion worker process: the same cycles, queued in the outbox"""
+    sys.path.insert(0, ROOT)
+    configure(workdir)
+
+    from utils.http_client import get_http_client
+    from cogs.news.worker import NewsWorker
+
+    async def main():
+        await get_http_client().start()
+        try:
+            await run_cycles(NewsWorker().pipeline, port, args)
+        finally:
+            await get_http_client().close()
+
+    asyncio.run(main())
+
+
+async def measure_lag(stop: asyncio.Event, samples: list, interval: float = 0.01):
+    """Record how late a periodic timer fires (what an interaction would wait)"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+class FakeChannel:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.sent = 0
+
+    async def send(self, embed=None):
+        await asyncio.sleep(self.latency)
+        self.sent += 1
+
+
+class FakeBot:
+    """Just enough of commands.Bot for NewsCog to post"""
+
+    def __init__(self, latency: float):
+        self.channel = FakeChannel(latency)
+        self.guilds = []
+
+    def get_channel(self, channel_id):
+        return self.channel
+
+    async def wait_until_ready(self):
+        await asyncio.Event().wait()  # keeps the cog's own loops idle
+
+
+def make_cog(mode: str, args):
+    from config import BotConfig as bot_config
+    from cogs.news_cog import NewsCog
+
+    bot_config.INGEST_MODE = mode
+    bot = FakeBot(args.post_latency)
+    return bot, NewsCog(bot)
+
+
+async def run_inline(port: int, args) -> dict:
+    from utils.http_client import get_http_client
+
+    bot, cog = make_cog('inline', args)
+    await get_http_client().start()
+    stop = asyncio.Event()
+    samples: list = []
+    ticker = asyncio.create_task(measure_lag(stop, samples))
+
+    start = time.perf_counter()
+    try:
+        await run_cycles(cog.pipeline, port, args)
+    finally:
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await ticker
+        cog.news_checker.cancel()
+        await get_http_client().close()
+    return {'elapsed': elapsed, 'posted': bot.channel.sent, 'samples': samples}
+
+
+async def run_worker(workdir: str, port: int, args) -> dict:
+    bot, cog = make_cog('worker', args)
+    process = multiprocessing.get_context('spawn').Process(target=worker_main, args=(workdir, port, args))
+
+    # Started before measuring: in production the worker runs independently of the bot
+    start = time.perf_counter()
+    process.start()
+
+    stop = asyncio.Event()
+    samples: list = []
+    ticker = asyncio.create_task(measure_lag(stop, samples))
+    # The bot side only drains the outbox, as NewsCog.outbox_poster does
+    while True:
+        alive = process.is_alive()
+        if not await cog.drain_outbox():
+            if not alive:
+                break
+            await asyncio.sleep(args.outbox_poll)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    cog.outbox_poster.cancel()
+    process.join()
+    return {'elapsed': elapsed, 'posted': bot.channel.sent, 'samples': samples}
+
+
+def summarize(name: str, result: dict):
+    samples = sorted(result['samples'])
+    p95 = samples[int(len(samples) * 0.95) - 1] if samples else 0.0
+    print(
+        f"{name:<10}{result['elapsed']:>10.1f}{result['posted']:>9}"
+        f"{statistics.median(samples) * 1000:>11.1f}{p95 * 1000:>11.1f}{max(samples) * 1000:>11.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--feeds', type=int, default=40)
+    parser.add_argument('--items', type=int, default=100, help='Items per feed body (5 are kept)')
+    parser.add_argument('--guilds', type=int, default=3, help='Channels each feed is posted to')
+    parser.add_argument('--cycles', type=int, default=3)
+    parser.add_argument('--translate-delay', type=float, default=0.02, help='Seconds per fake translation')
+    parser.add_argument('--post-latency', type=float, default=0.01, help='Seconds per fake channel.send')
+    parser.add_argument('--outbox-poll', type=float, default=0.5, help='Seconds between outbox checks')
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context('spawn')
+    port_queue = ctx.Queue()
+    server = ctx.Process(target=serve_feeds, args=(port_queue, args.items), daemon=True)
+    server.start()
+    port = port_queue.get(timeout=30)
+
+    print("=" * 62)
+    print(f"Ingestion worker: {args.feeds} feeds x {args.guilds} guilds x {args.cycles} cycles")
+    print("=" * 62)
+    print(f"{'mode':<10}{'total s':>10}{'posted':>9}{'lag p50 ms':>11}{'p95 ms':>11}{'max ms':>11}")
+
+    try:
+        for mode in ('inline', 'worker'):
+            with tempfile.TemporaryDirectory() as workdir:
+                cwd = os.getcwd()
+                configure(workdir)
+                try:
+                    runner = run_inline(port, args) if mode == 'inline' else run_worker(workdir, port, args)
+                    summarize(mode, asyncio.run(runner))
+                finally:
+                    # Fresh singletons (database, caches) for the next mode
+                    import database
+                    database.db = None
+                    os.chdir(cwd)
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
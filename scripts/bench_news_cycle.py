@@ -0,0 +1,107 @@
+"""
+News cycle benchmark
+Compares cycle wall time of the old sequential loop with CycleEngine
+for N guilds x M feeds using simulated network/post latency
+
+Usage:
+    python scripts/bench_news_cycle.py --guilds 50 --feeds 6
+"""
+
+import sys
+import os
+import time
+import random
+import asyncio
+import argparse
+from typing import List
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.news.engine import CycleEngine, Delivery, FetchJob
+from cogs.news.metrics import CycleMetrics
+from cogs.news.models import Article
+
+
+class FakeFetcher:
+    """Fetcher that sleeps for a simulated network latency"""
+    
+    def __init__(self, name: str, latency: float):
+        self.name = name
+        self.latency = latency
+    
+    async def fetch_with_retry(self, scope: str = '') -> List[Article]:
+        await asyncio.sleep(self.latency)
+        return [
+            Article(id=f'{self.name}-{i}', title=f'{self.name} #{i}', url=f'https://example.com/{self.name}/{i}', source=self.name)
+            for i in range(5)
+        ]
+
+
+def build_jobs(guilds: int, feeds: int, seed: int) -> List[FetchJob]:
+    """Every guild subscribes to every feed; latencies are 50ms-1s, one 2s straggler"""
+    rng = random.Random(seed)
+    jobs = []
+    for f in range(feeds):
+        latency = 2.0 if f == 0 else rng.uniform(0.05, 1.0)
+        job = FetchJob(key=f'feed{f}', fetcher=FakeFetcher(f'feed{f}', latency))
+        job.deliveries = [Delivery(guild_id=g, channel_id=g, source_key=f'feed{f}') for g in range(guilds)]
+        jobs.append(job)
+    return jobs
+
+
+async def run_sequential(jobs: List[FetchJob], post_latency: float) -> float:
+    """Old behaviour: per guild, fetch every feed and post one at a time"""
+    start = time.perf_counter()
+    guilds = {d.guild_id for job in jobs for d in job.deliveries}
+    for _ in guilds:
+        for job in jobs:
+            await job.fetcher.fetch_with_retry()
+            await asyncio.sleep(post_latency)
+    return time.perf_counter() - start
+
+
+async def run_engine(jobs: List[FetchJob], post_latency: float, fetch_concurrency: int, post_concurrency: int) -> float:
+    """CycleEngine with bounded fetch and post concurrency"""
+    post_semaphore = asyncio.Semaphore(post_concurrency)
+    
+    async def deliver(delivery, articles):
+        async with post_semaphore:
+            await asyncio.sleep(post_latency)
+    
+    engine = CycleEngine(deliver, fetch_concurrency)
+    start = time.perf_counter()
+    await engine.run(jobs, CycleMetrics())
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--guilds', type=int, default=20)
+    parser.add_argument('--feeds', type=int, default=6)
+    parser.add_argument('--post-latency', type=float, default=0.01)
+    parser.add_argument('--fetch-concurrency', type=int, default=10)
+    parser.add_argument('--post-concurrency', type=int, default=50)
+    parser.add_argument('--skip-sequential', action='store_true', help='Skip the (slow) sequential baseline')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    print("=" * 60)
+    print(f"News cycle benchmark: {args.guilds} guilds x {args.feeds} feeds")
+    print("=" * 60)
+    
+    if not args.skip_sequential:
+        elapsed = await run_sequential(build_jobs(args.guilds, args.feeds, args.seed), args.post_latency)
+        print(f"Sequential loop : {elapsed:8.2f}s")
+    
+    elapsed = await run_engine(
+        build_jobs(args.guilds, args.feeds, args.seed),
+        args.post_latency,
+        args.fetch_concurrency,
+        args.post_concurrency
+    )
+    print(f"CycleEngine     : {elapsed:8.2f}s (slowest feed: 2.00s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
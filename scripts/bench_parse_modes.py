@@ -0,0 +1,90 @@
+"""
+Parse mode benchmark
+Compares event-loop lag and cycle time of the inline, thread and process
+parse modes on synthetic feeds (large items with HTML content)
+
+Usage:
+    python scripts/bench_parse_modes.py --feeds 40 --items 100
+"""
+
+import sys
+import os
+import time
+import asyncio
+import argparse
+import statistics
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.news.parsing import ParseEngine, parse_feed_entries, PARSE_MODES
+
+
+def build_feed(items: int) -> bytes:
+    """Build an RSS feed whose items carry a few KB of HTML each"""
+    paragraph = '&lt;p&gt;Bitcoin &lt;b&gt;price&lt;/b&gt; analysis and on-chain metrics.&lt;/p&gt;' * 40
+    body = ''.join(
+        f'<item><title>Item {i}</title><link>https://example.com/{i}</link>'
+        f'<guid>https://example.com/{i}</guid><description>{paragraph}</description></item>'
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>{body}</channel></rss>'.encode()
+
+
+async def measure_lag(stop: asyncio.Event, samples: list, interval: float = 0.005):
+    """Record how late a periodic timer fires (event-loop lag)"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def run_mode(mode: str, feeds: list, workers: int, limit: int) -> dict:
+    engine = ParseEngine(mode=mode, workers=workers)
+    
+    # Warm up pools (process workers import parsers once)
+    await engine.run(parse_feed_entries, feeds[0], limit, True)
+    
+    stop = asyncio.Event()
+    samples: list = []
+    ticker = asyncio.create_task(measure_lag(stop, samples))
+    await asyncio.sleep(0.05)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(engine.run(parse_feed_entries, body, limit, True) for body in feeds))
+    elapsed = time.perf_counter() - start
+    
+    stop.set()
+    await ticker
+    engine.shutdown()
+    
+    return {
+        'cycle': elapsed,
+        'lag_max': max(samples) * 1000 if samples else 0.0,
+        'lag_p50': statistics.median(samples) * 1000 if samples else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--feeds', type=int, default=40)
+    parser.add_argument('--items', type=int, default=100)
+    parser.add_argument('--limit', type=int, default=5, help='Entries kept per feed')
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    
+    feeds = [build_feed(args.items) for _ in range(args.feeds)]
+    
+    print("=" * 60)
+    print(f"Parse modes: {args.feeds} feeds x {args.items} items ({len(feeds[0]) // 1024} KB each)")
+    print("=" * 60)
+    print(f"{'mode':<10}{'cycle (s)':>12}{'lag max (ms)':>16}{'lag p50 (ms)':>16}")
+    
+    for mode in PARSE_MODES:
+        result = await run_mode(mode, feeds, args.workers, args.limit)
+        print(f"{mode:<10}{result['cycle']:>12.2f}{result['lag_max']:>16.1f}{result['lag_p50']:>16.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
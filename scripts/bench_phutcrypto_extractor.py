@@ -0,0 +1,128 @@
+"""
+5phutcrypto extractor benchmark
+Compares parse time and peak memory of the old full-page html.parser scrape
+with the region-limited extractor on each available BeautifulSoup backend
+
+Usage:
+    python scripts/bench_phutcrypto_extractor.py                        # synthetic homepage
+    python scripts/bench_phutcrypto_extractor.py --file homepage.html    # recorded page
+    curl -s https://5phutcrypto.io/ > homepage.html                      # record one
+"""
+
+import sys
+import os
+import time
+import argparse
+import tracemalloc
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from config import BotConfig as bot_config
+from cogs.news.parsing import extract_phutcrypto_links, links_from_soup, phutcrypto_region
+
+
+def build_page(cards: int) -> bytes:
+    """Synthetic WordPress-style homepage: heavy head, nav, article grid, sidebar, footer"""
+    head = (
+        '<head><meta charset="utf-8"><title>5 Phut Crypto</title>'
+        + '<style>' + '.c{color:#333;margin:0 auto;padding:4px}' * 800 + '</style>'
+        + '<script>' + 'window.dataLayer=window.dataLayer||[];' * 800 + '</script>'
+        + '</head>'
+    )
+    nav = '<header><nav><ul>' + ''.join(
+        f'<li><a href="https://5phutcrypto.io/chuyen-muc/{i}">Muc {i}</a></li>' for i in range(60)
+    ) + '</ul></nav></header>'
+    grid = '<main>' + ''.join(
+        f'<article class="post"><div class="thumb"><a href="https://5phutcrypto.io/bai-{i}">'
+        f'<img src="data:image/gif;base64,R0lGOD" data-src="https://5phutcrypto.io/img/{i}.jpg" alt="Bai {i}"></a></div>'
+        f'<h3 class="title"><a href="https://5phutcrypto.io/bai-{i}">Bai viet so {i} ve thi truong crypto</a></h3>'
+        f'<div class="meta"><a href="https://5phutcrypto.io/author/a">Tac gia</a> <span>{i} gio truoc</span></div>'
+        f'<p class="excerpt">{"Tom tat bai viet. " * 20}</p></article>'
+        for i in range(cards)
+    ) + '</main>'
+    sidebar = '<aside>' + ''.join(
+        f'<div><h3><a href="https://5phutcrypto.io/tag/t{i}">Tag {i}</a></h3></div>' for i in range(40)
+    ) + '</aside>'
+    footer = '<footer>' + '<p>Footer links and scripts</p><script>var x = 1;</script>' * 50 + '</footer>'
+    return f'<!DOCTYPE html><html>{head}<body>{nav}{grid}{sidebar}{footer}</body></html>'.encode()
+
+
+def full_page(body: bytes, limit: int, parser: str):
+    """Previous behaviour: build the whole tree with html.parser"""
+    return links_from_soup(BeautifulSoup(body, 'html.parser'), limit)
+
+
+def region(body: bytes, limit: int, parser: str):
+    """New extractor: parse only the article region with the given backend"""
+    return extract_phutcrypto_links(body, limit, parser)
+
+
+def available_backends():
+    backends = ['html.parser']
+    try:
+        import lxml  # noqa: F401
+        backends.append('lxml')
+    except ImportError:
+        print("lxml not installed; only the html.parser backend is measured (pip install lxml)")
+    return backends
+
+
+def measure(func, body: bytes, limit: int, parser: str, repeat: int):
+    """Return (mean seconds, peak bytes) for one extraction"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(body, limit, parser)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    func(body, limit, parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--file', nargs='*', default=[], help='Recorded homepage files')
+    parser.add_argument('--cards', type=int, default=60)
+    parser.add_argument('--limit', type=int, default=bot_config.PHUTCRYPTO_MAX_ARTICLES)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    pages = {}
+    for path in args.file:
+        with open(path, 'rb') as f:
+            pages[os.path.basename(path)] = f.read()
+    if not pages:
+        pages[f'synthetic-{args.cards}'] = build_page(args.cards)
+
+    runs = [('full page', full_page, 'html.parser')]
+    runs += [('region', region, backend) for backend in available_backends()]
+
+    print("=" * 80)
+    print(f"5phutcrypto extractor benchmark (limit={args.limit})")
+    print("=" * 80)
+    print(f"{'page':<20}{'KB':>6}{'parsed KB':>11}{'strategy':>11}{'backend':>13}{'ms':>9}{'peak KB':>10}")
+
+    for name, body in pages.items():
+        expected = full_page(body, args.limit, 'html.parser')
+        parsed_kb = len(phutcrypto_region(body, args.limit)) // 1024
+
+        for label, func, backend in runs:
+            if func(body, args.limit, backend) != expected:
+                print(f"  warning: {label}/{backend} result differs from the full-page scrape")
+
+            elapsed, peak = measure(func, body, args.limit, backend, args.repeat)
+            size = len(body) // 1024 if func is full_page else parsed_kb
+            print(
+                f"{name[:19]:<20}{len(body) // 1024:>6}{size:>11}{label:>11}{backend:>13}"
+                f"{elapsed * 1000:>9.1f}{peak // 1024:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Poll scheduler benchmark
+Simulates feeds with different publish rates and compares the fixed 3-minute
+loop with the adaptive PollScheduler: upstream requests per hour against
+detection latency (publish -> first poll that sees the item)
+
+Usage:
+    python scripts/bench_poll_scheduler.py --hours 24 --feeds-per-profile 10
+"""
+
+import sys
+import os
+import random
+import argparse
+import statistics
+from typing import Dict, List, Tuple
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import BotConfig as bot_config
+from cogs.news.poll_scheduler import PollScheduler
+
+# Profile name -> items published per hour
+PROFILES = {
+    'busy (50/h)': 50.0,
+    'active (10/h)': 10.0,
+    'regular (2/h)': 2.0,
+    'slow (1/4h)': 0.25,
+    'daily (1/day)': 1 / 24,
+    'weekly (1/week)': 1 / 168,
+}
+
+
+class SimFeed:
+    """Feed publishing items as a Poisson process; a poll shows the newest `page` items"""
+
+    def __init__(self, key: str, per_hour: float, duration: float, page: int, rng: random.Random):
+        self.key = key
+        self.page = page
+        self.published: List[float] = []
+
+        t = rng.expovariate(per_hour / 3600)
+        while t < duration:
+            self.published.append(t)
+            t += rng.expovariate(per_hour / 3600)
+
+        self.seen: Dict[int, float] = {}  # item index -> detection time
+
+    def poll(self, now: float) -> List[str]:
+        """Return ids of the newest items visible at `now` and record detections"""
+        visible = [i for i, t in enumerate(self.published) if t <= now][-self.page:]
+        for i in visible:
+            self.seen.setdefault(i, now)
+        return [f'{self.key}-{i}' for i in visible]
+
+    def latencies(self) -> Tuple[List[float], int]:
+        """Detection latencies and the number of items never seen"""
+        latencies = [self.seen[i] - t for i, t in enumerate(self.published) if i in self.seen]
+        return latencies, len(self.published) - len(latencies)
+
+
+def build_feeds(per_profile: int, duration: float, page: int, seed: int) -> Dict[str, List[SimFeed]]:
+    rng = random.Random(seed)
+    return {
+        name: [SimFeed(f'{name}-{n}', rate, duration, page, rng) for n in range(per_profile)]
+        for name, rate in PROFILES.items()
+    }
+
+
+def run_fixed(feeds: Dict[str, List[SimFeed]], duration: float, interval: float) -> Dict[str, int]:
+    """Old behaviour: poll every feed every `interval` seconds"""
+    requests = {name: 0 for name in feeds}
+    now = 0.0
+    while now < duration:
+        for name, group in feeds.items():
+            for feed in group:
+                feed.poll(now)
+                requests[name] += 1
+        now += interval
+    return requests
+
+
+def run_adaptive(feeds: Dict[str, List[SimFeed]], duration: float, tick: float, seed: int) -> Dict[str, int]:
+    """Adaptive scheduler driven by a simulated clock"""
+    scheduler = PollScheduler(rng=random.Random(seed))
+    by_key = {feed.key: (name, feed) for name, group in feeds.items() for feed in group}
+    scheduler.sync(by_key, now=0.0)
+
+    requests = {name: 0 for name in feeds}
+    now = 0.0
+    while now < duration:
+        for key in scheduler.due(now=now):
+            name, feed = by_key[key]
+            scheduler.record(key, feed.poll(now), now=now)
+            requests[name] += 1
+        now += tick
+    return requests
+
+
+def summarize(label: str, feeds: Dict[str, List[SimFeed]], requests: Dict[str, int], hours: float):
+    print(f"\n{label}")
+    print(f"  {'profile':<18} {'req/h':>8} {'items':>6} {'mean lat':>9} {'p95 lat':>9} {'missed':>7}")
+
+    total_requests, all_latencies, total_missed = 0, [], 0
+    for name, group in feeds.items():
+        latencies, missed = [], 0
+        for feed in group:
+            feed_latencies, feed_missed = feed.latencies()
+            latencies += feed_latencies
+            missed += feed_missed
+
+        total_requests += requests[name]
+        all_latencies += latencies
+        total_missed += missed
+        print(
+            f"  {name:<18} {requests[name] / hours:>8.1f} {len(latencies) + missed:>6} "
+            f"{_fmt(latencies, 'mean'):>9} {_fmt(latencies, 'p95'):>9} {missed:>7}"
+        )
+
+    print(
+        f"  {'TOTAL':<18} {total_requests / hours:>8.1f} {len(all_latencies) + total_missed:>6} "
+        f"{_fmt(all_latencies, 'mean'):>9} {_fmt(all_latencies, 'p95'):>9} {total_missed:>7}"
+    )
+
+
+def _fmt(latencies: List[float], kind: str) -> str:
+    if not latencies:
+        return '-'
+    if kind == 'mean':
+        value = statistics.mean(latencies)
+    else:
+        value = sorted(latencies)[int(len(latencies) * 0.95) - 1 if len(latencies) > 1 else 0]
+    return f'{value:.0f}s'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fixed loop vs adaptive poll scheduler')
+    parser.add_argument('--hours', type=float, default=24)
+    parser.add_argument('--feeds-per-profile', type=int, default=10)
+    parser.add_argument('--page', type=int, default=bot_config.RSS_MAX_ENTRIES, help='Entries visible per poll')
+    parser.add_argument('--interval', type=float, default=bot_config.NEWS_CHECK_INTERVAL, help='Fixed loop interval')
+    parser.add_argument('--tick', type=float, default=bot_config.POLL_TICK_SECONDS)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    duration = args.hours * 3600
+    print(f"Simulating {args.hours:.0f}h, {args.feeds_per_profile} feeds per profile, page={args.page}")
+
+    fixed_feeds = build_feeds(args.feeds_per_profile, duration, args.page, args.seed)
+    fixed = run_fixed(fixed_feeds, duration, args.interval)
+    summarize(f"Fixed loop (every {args.interval:.0f}s)", fixed_feeds, fixed, args.hours)
+
+    adaptive_feeds = build_feeds(args.feeds_per_profile, duration, args.page, args.seed)
+    adaptive = run_adaptive(adaptive_feeds, duration, args.tick, args.seed)
+    summarize(
+        f"Adaptive scheduler ({bot_config.POLL_MIN_INTERVAL}-{bot_config.POLL_MAX_INTERVAL}s, tick {args.tick:.0f}s)",
+        adaptive_feeds, adaptive, args.hours
+    )
+
+
+if __name__ == '__main__':
+    main()
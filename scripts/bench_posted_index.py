@@ -0,0 +1,89 @@
+"""
+Posted-index benchmark
+Warms a PostedIndex from a scratch database and compares its dedup lookups
+(Bloom prefilter + recent IDs, DB only for the rest) with one
+filter_unposted_many query per cycle; reports memory and lookup latency
+
+Usage:
+    python scripts/bench_posted_index.py --guilds 1000 --sources 4 --articles 5
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logger_config  # noqa: F401 - configure handlers before silencing them
+import logging
+
+from database import Database
+from cogs.news.posted_index import PostedIndex
+from bench_dedup import populate, build_candidates
+
+
+def indexed(db: Database, index: PostedIndex, candidates) -> int:
+    """Same flow as PostedFilter: classify, then one query for the unknown IDs"""
+    unseen = 0
+    unknown = {}
+    for (guild, source), ids in candidates.items():
+        new, _, maybe = index.classify(guild, source, ids)
+        unseen += len(new)
+        if maybe:
+            unknown[(guild, source)] = maybe
+    if unknown:
+        unseen += sum(len(ids) for ids in db.filter_unposted_many(unknown).values())
+    return unseen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--guilds', type=int, default=1000)
+    parser.add_argument('--sources', type=int, default=4, help='Subscribed sources per guild')
+    parser.add_argument('--articles', type=int, default=5, help='Candidate articles per source')
+    parser.add_argument('--history', type=int, default=50, help='Posted articles per guild/source')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed lookup rounds per path')
+    args = parser.parse_args()
+    logging.getLogger('discord_news_bot').setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = Database(os.path.join(workdir, 'bench.db'))
+        populate(db, args.guilds, args.sources, args.history)
+        candidates = build_candidates(args.guilds, args.sources, args.articles, args.history)
+        checks = len(candidates) * args.articles
+
+        index = PostedIndex()
+        stats = index.rebuild(db)
+
+        print("=" * 60)
+        print(f"Posted index: {args.guilds} guilds x {args.sources} sources x {args.history} posted")
+        print("=" * 60)
+        print(f"Rebuild: {stats['last_rebuild_seconds']:.2f}s for {stats['items']} articles")
+        print(f"Bloom:   {stats['bloom_bytes'] / 1024:.0f} KB ({stats['bloom_bits']} bits, "
+              f"{stats['bloom_hashes']} hashes, est. FP {stats['estimated_fp_rate']:.2%})")
+        print(f"Recent:  {stats['recent_bytes'] / 1024:.0f} KB ({stats['recent_ids']} IDs in {stats['pairs']} pairs)")
+        print()
+        print(f"Lookups: {checks} checks per round, {args.rounds} rounds")
+        print(f"{'path':<28}{'ms/round':>10}{'us/check':>10}{'unseen':>10}")
+
+        for name, func in [
+            ('filter_unposted_many', lambda: sum(len(ids) for ids in db.filter_unposted_many(candidates).values())),
+            ('posted index', lambda: indexed(db, index, candidates)),
+        ]:
+            start = time.perf_counter()
+            for _ in range(args.rounds):
+                unseen = func()
+            elapsed = (time.perf_counter() - start) / args.rounds
+            print(f"{name:<28}{elapsed * 1000:>10.1f}{elapsed / checks * 1e6:>10.2f}{unseen:>10}")
+
+        stats = index.get_stats()
+        print()
+        print(f"Index: {stats['definitely_new']} new, {stats['recent_hits']} recent hits, "
+              f"{stats['db_fallbacks']} DB fallbacks, avg classify {stats['avg_lookup_us']}us per ID")
+
+
+if __name__ == "__main__":
+    main()
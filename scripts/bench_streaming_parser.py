@@ -0,0 +1,77 @@
+"""
+Streaming parser benchmark
+Compares parse time and peak memory of the feedparser path with the
+incremental streaming parser when only RSS_MAX_ENTRIES entries are used
+
+Usage:
+    python scripts/bench_streaming_parser.py                      # synthetic 150-item feed
+    python scripts/bench_streaming_parser.py --file feed1.xml ...  # recorded feeds
+"""
+
+import sys
+import os
+import time
+import argparse
+import tracemalloc
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import BotConfig as bot_config
+from cogs.news.parsing import parse_feed_entries, stream_feed_entries
+
+
+def build_feed(items: int) -> bytes:
+    """Synthetic feed with full HTML content per item"""
+    content = '&lt;p&gt;Market update with &lt;a href="https://example.com"&gt;links&lt;/a&gt;.&lt;/p&gt;' * 60
+    body = ''.join(
+        f'<item><title>Item {i}</title><link>https://example.com/{i}</link><guid>https://example.com/{i}</guid>'
+        f'<pubDate>Mon, 01 Jan 2025 00:00:00 GMT</pubDate><description>{content}</description></item>'
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>{body}</channel></rss>'.encode()
+
+
+def measure(func, body: bytes, limit: int, repeat: int):
+    """Return (mean seconds, peak bytes) for parsing one body"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(body, limit)
+    elapsed = (time.perf_counter() - start) / repeat
+    
+    tracemalloc.start()
+    func(body, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--file', nargs='*', default=[], help='Recorded feed files')
+    parser.add_argument('--items', type=int, default=150)
+    parser.add_argument('--limit', type=int, default=bot_config.RSS_MAX_ENTRIES)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    feeds = {}
+    for path in args.file:
+        with open(path, 'rb') as f:
+            feeds[os.path.basename(path)] = f.read()
+    if not feeds:
+        feeds[f'synthetic-{args.items}'] = build_feed(args.items)
+    
+    print("=" * 72)
+    print(f"Streaming parser benchmark (limit={args.limit})")
+    print("=" * 72)
+    print(f"{'feed':<24}{'size KB':>9}{'parser':>12}{'ms':>10}{'peak KB':>12}")
+    
+    for name, body in feeds.items():
+        for label, func in (('feedparser', parse_feed_entries), ('streaming', stream_feed_entries)):
+            elapsed, peak = measure(func, body, args.limit, args.repeat)
+            print(f"{name[:23]:<24}{len(body) // 1024:>9}{label:>12}{elapsed * 1000:>10.1f}{peak // 1024:>12}")
+
+
+if __name__ == "__main__":
+    main()
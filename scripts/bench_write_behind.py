@@ -0,0 +1,70 @@
+"""
+Write-behind benchmark
+Commits and time per news cycle for the database writes that follow a post:
+dedup check, translation cache lookups (hits for guilds after the first),
+cache saves and posted marks, with one commit per write (before) and the
+write-behind buffer (after)
+
+Usage:
+    python scripts/bench_write_behind.py --guilds 50 --articles 10 --cycles 5
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logger_config  # noqa: F401 - configure handlers before silencing them
+import logging
+
+from database import Database
+
+
+def cycle(db: Database, number: int, guilds: int, articles: int):
+    """Every guild receives the same new articles of one source"""
+    ids = [f'https://example.com/{number}/{i}' for i in range(articles)]
+    unseen = db.filter_unposted_many({(guild, 'theblock'): ids for guild in range(guilds)})
+    for guild in range(guilds):
+        for article_id in unseen[(guild, 'theblock')]:
+            for field in ('title', 'description'):
+                text_hash = f'{article_id}#{field}'
+                if db.get_translation(text_hash) is None:
+                    db.save_translation(text_hash, 'English text', 'Văn bản tiếng Việt')
+            db.mark_article_posted(guild, article_id, 'theblock', 'Title', article_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--guilds', type=int, default=50)
+    parser.add_argument('--articles', type=int, default=10, help='New articles per cycle')
+    parser.add_argument('--cycles', type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger('discord_news_bot').setLevel(logging.WARNING)
+
+    writes = args.guilds * args.articles * (1 + 2)  # posted mark + two cache lookups (save or hit)
+    print("=" * 64)
+    print(f"Write-behind: {args.guilds} guilds x {args.articles} new articles per cycle (~{writes} writes)")
+    print("=" * 64)
+    print(f"{'writes':<22}{'commits/cycle':>15}{'ms/cycle':>12}{'flushes':>10}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, interval in [('one commit (before)', 0), ('write-behind (after)', 2.0)]:
+            db = Database(os.path.join(workdir, f'{interval}.db'), write_behind_interval=interval)
+            commits = db.commits
+            start = time.perf_counter()
+            for number in range(args.cycles):
+                cycle(db, number, args.guilds, args.articles)
+            db.flush_writes()
+            elapsed = time.perf_counter() - start
+            per_cycle = (db.commits - commits) / args.cycles
+            flushes = db.write_behind.flushes if db.write_behind is not None else '-'
+            print(f"{name:<22}{per_cycle:>15.1f}{elapsed / args.cycles * 1000:>12.1f}{flushes:>10}")
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
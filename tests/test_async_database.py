@@ -0,0 +1,95 @@
+"""
+Unit tests for the async database facade
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / 'test.db'))
+    yield db
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_methods_are_awaitable(db):
+    """Test that async calls match their sync counterparts"""
+    await db.aio.mark_article_posted(1, 'a', 'glassnode')
+
+    assert await db.aio.is_article_posted(1, 'a', 'glassnode')
+    assert await db.aio.filter_unposted(1, 'glassnode', ['a', 'b']) == ['b']
+    assert db.aio.get_stats()['writes'] == 1
+    assert db.aio.get_stats()['reads'] == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_on_one_thread_reads_on_pool(db):
+    """Test the single writer thread and the read pool"""
+    def thread_name(*args):
+        return threading.current_thread().name
+
+    writers = await asyncio.gather(*(db.aio.run(thread_name) for _ in range(5)))
+    readers = await asyncio.gather(*(db.aio.run_read(thread_name) for _ in range(5)))
+
+    assert len(set(writers)) == 1 and writers[0].startswith('db-writer')
+    assert all(name.startswith('db-reader') for name in readers)
+
+
+@pytest.mark.asyncio
+async def test_cache_lookups_write_through_on_the_writer(tmp_path):
+    """Test that get_translation only runs on the read pool while its hit count is buffered"""
+    for interval, reads in ((60, 1), (0, 0)):
+        db = Database(str(tmp_path / f'{interval}.db'), write_behind_interval=interval)
+        try:
+            await db.aio.save_translation('h', 'text', 'văn bản')
+            assert await db.aio.get_translation('h') == 'văn bản'
+            assert db.aio.get_stats()['reads'] == reads
+        finally:
+            db.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_keep_submission_order(db):
+    """Test that queued writes apply in order"""
+    await asyncio.gather(*(db.aio.save_runtime_stats('order', {'n': n}) for n in range(20)))
+    assert (await db.aio.get_runtime_stats('order'))['n'] == 19
+
+
+@pytest.mark.asyncio
+async def test_slow_query_does_not_block_loop(db):
+    """Test that the event loop keeps running while a query holds the writer"""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await db.aio.run(time.sleep, 0.2)
+    task.cancel()
+    assert ticks >= 5
+
+
+def test_sync_only_methods_are_not_exposed(db):
+    """Test that generators, hooks and private helpers have no async version"""
+    for name in ('iter_posted_keys', 'connect', '_notify_posted', 'db_path'):
+        with pytest.raises(AttributeError):
+            getattr(db.aio, name)
+
+
+@pytest.mark.asyncio
+async def test_close_finishes_writes_and_restarts(db):
+    """Test that close() waits for queued writes and the facade works afterwards"""
+    write = asyncio.ensure_future(db.aio.save_runtime_stats('closing', {'ok': True}))
+    await asyncio.sleep(0)
+    db.aio.close()
+    await write
+    assert db.get_runtime_stats('closing')['ok'] is True
+    assert await db.aio.get_runtime_stats('closing')
@@ -0,0 +1,119 @@
+"""
+Unit tests for circuit breakers
+"""
+
+import asyncio
+import aiohttp
+import pytest
+from database import Database
+from utils.circuit_breaker import CircuitBreakers, breaker_keys
+
+
+@pytest.fixture
+def clock():
+    return [1000.0]
+
+
+@pytest.fixture
+def breakers(tmp_path, clock):
+    db = Database(str(tmp_path / 'test.db'))
+    return CircuitBreakers(threshold=2, window=60, open_seconds=100, max_open_seconds=300, db=db, clock=lambda: clock[0])
+
+
+def test_failures_outside_window_do_not_trip(breakers, clock):
+    """Test that only failures within the window count"""
+    keys = breaker_keys('https://a.com/feed', 'https://a.com/feed')
+    assert keys == ('https://a.com/feed', 'host:a.com')
+    
+    breakers.record(keys, ValueError('bad xml'))
+    clock[0] += 61
+    breakers.record(keys, ValueError('bad xml'))
+    assert breakers.acquire(keys)
+    
+    breakers.record(keys, ValueError('bad xml'))
+    assert not breakers.acquire(keys)
+    # Invalid content is the feed's problem; the host stays closed
+    assert breakers.get('host:a.com').state == 'closed'
+
+
+def test_host_failure_blocks_other_feeds(breakers):
+    """Test that connection-level failures open the shared host breaker"""
+    error = aiohttp.ClientConnectionError('refused')
+    for _ in range(2):
+        breakers.record(breaker_keys('https://a.com/one', 'https://a.com/one'), error)
+    
+    assert not breakers.acquire(breaker_keys('https://a.com/two', 'https://a.com/two'))
+    assert breakers.acquire(breaker_keys('https://b.com/feed', 'https://b.com/feed'))
+
+
+def test_half_open_allows_single_probe(breakers, clock):
+    """Test half-open probing, backoff of the open period and closing on success"""
+    keys = ('source:santiment',)
+    for _ in range(2):
+        breakers.record(keys, asyncio.TimeoutError())
+    
+    clock[0] += 100
+    assert breakers.acquire(keys) and breakers.is_probing(keys)
+    assert not breakers.acquire(keys)  # probe in flight
+    
+    breakers.record(keys, asyncio.TimeoutError())
+    assert breakers.get('source:santiment').open_seconds == 200
+    
+    clock[0] += 200
+    assert breakers.acquire(keys)
+    breakers.release(keys)  # cancelled probe gives its slot back
+    assert breakers.acquire(keys)
+    breakers.record(keys)
+    
+    assert breakers.get('source:santiment').state == 'closed'
+    assert breakers.get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_preload_and_queued_saves(tmp_path, clock):
+    """Test that preloaded breakers need no SQLite reads and saves reach the writer thread"""
+    db = Database(str(tmp_path / 'test.db'))
+    breakers = CircuitBreakers(threshold=1, open_seconds=100, db=db, clock=lambda: clock[0])
+    breakers.record(('source:santiment',), asyncio.TimeoutError())
+    await db.aio.run(lambda: None)  # queued behind the save
+    assert db.get_circuit_breakers()[0]['breaker_key'] == 'source:santiment'
+    
+    restarted = CircuitBreakers(db=db, clock=lambda: clock[0])
+    await restarted.preload()
+    
+    def no_reads(key):
+        raise AssertionError(f"read {key} from SQLite")
+    
+    db.get_circuit_breaker = no_reads
+    assert not restarted.acquire(('source:santiment',))
+    assert restarted.acquire(('source:glassnode',))
+    assert restarted.get('source:santiment').failures == []
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_health_check_skips_open_circuits(tmp_path, clock, monkeypatch):
+    """Test that an open circuit is not counted toward auto-disabling a feed"""
+    import cogs.health_checker as health_checker
+    
+    db = Database(str(tmp_path / 'test.db'))
+    db.add_rss_feed(1, 'Feed', 'https://a.com/feed', 10)
+    breakers = CircuitBreakers(threshold=1, open_seconds=100, db=db, clock=lambda: clock[0])
+    breakers.record(breaker_keys('https://a.com/feed', 'https://a.com/feed'), ValueError('bad xml'))
+    monkeypatch.setattr(health_checker, 'get_database', lambda: db)
+    monkeypatch.setattr(health_checker, 'get_circuit_breakers', lambda: breakers)
+    
+    class Bot:
+        async def wait_until_ready(self):
+            await asyncio.Event().wait()
+    
+    checker = health_checker.HealthChecker(Bot())
+    try:
+        for _ in range(checker.max_failures_before_disable):
+            await checker.health_check_task()
+    finally:
+        checker.cog_unload()
+    
+    assert checker.feed_failures == {}
+    assert db.get_all_rss_feeds()[0]['enabled']
+    db.close()
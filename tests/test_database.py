@@ -0,0 +1,91 @@
+"""
+Unit tests for the pooled SQLite connections
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import pytest
+from database import Database
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / 'test.db'), pool_size=2, write_behind_interval=0)  # every call hits the pool
+    yield db
+    db.close()
+
+
+def test_connections_are_reused_and_tuned(db):
+    """Test that repeated calls share pooled connections running in WAL mode"""
+    for i in range(20):
+        db.mark_article_posted(1, f'a{i}', 'glassnode')
+        assert db.is_article_posted(1, f'a{i}', 'glassnode')
+    assert db.connections_opened == 2  # one read-write, one read-only
+
+    with db.connect() as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+        assert conn.execute('PRAGMA busy_timeout').fetchone()[0] > 0
+
+
+def test_read_connections_reject_writes(db):
+    """Test that read() hands out read-only connections"""
+    with pytest.raises(sqlite3.OperationalError):
+        with db.read() as conn:
+            conn.execute("INSERT INTO runtime_stats (name, data) VALUES ('x', '{}')")
+    assert db.get_runtime_stats('x') == {}
+
+
+def test_nested_use_opens_overflow_connections(db):
+    """Test that nested calls never wait on the pool and extras are closed"""
+    with db.connect(), db.connect(), db.connect():
+        db.save_runtime_stats('nested', {'ok': True})
+    assert db.get_runtime_stats('nested')['ok'] is True
+    assert len(db._pool) == 2
+
+
+def test_failed_transaction_rolls_back(db):
+    """Test that an error discards the writes and the connection stays usable"""
+    with pytest.raises(ValueError):
+        with db.connect() as conn:
+            conn.execute("INSERT INTO runtime_stats (name, data) VALUES ('x', '{}')")
+            raise ValueError('boom')
+    assert db.get_runtime_stats('x') == {}
+    db.save_runtime_stats('x', {})
+    assert 'updated_at' in db.get_runtime_stats('x')
+
+
+def test_readers_do_not_block_writer(db):
+    """Test that a long read transaction (dashboard) does not block commits"""
+    db.save_runtime_stats('seed', {})
+    with db.read() as conn:
+        conn.execute('BEGIN')
+        conn.execute('SELECT COUNT(*) FROM runtime_stats').fetchone()
+
+        thread = threading.Thread(target=db.save_runtime_stats, args=('writer', {'n': 1}))
+        thread.start()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    assert db.get_runtime_stats('writer')['n'] == 1
+
+
+def test_pool_settings_read_from_environment(tmp_path):
+    """Test that DB_POOL_SIZE and DB_BUSY_TIMEOUT_MS reach a new Database"""
+    code = (
+        "import sys\n"
+        "from database import Database\n"
+        "db = Database(sys.argv[1])\n"
+        "with db.connect() as conn:\n"
+        "    print(db.pool_size, conn.execute('PRAGMA busy_timeout').fetchone()[0])\n"
+        "db.close()\n"
+    )
+    env = dict(os.environ, DB_POOL_SIZE='7', DB_BUSY_TIMEOUT_MS='1234')
+    result = subprocess.run([sys.executable, '-c', code, str(tmp_path / 'test.db')],
+                            env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.split()[-2:] == ['7', '1234']
@@ -0,0 +1,64 @@
+"""
+Unit tests for batched posted-article lookups
+"""
+
+import asyncio
+import json
+import pytest
+from database import Database
+from cogs.news.dedup import PostedFilter
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / 'test.db'))
+    db.mark_article_posted(1, 'a', 'glassnode')
+    db.mark_article_posted(2, 'b', 'glassnode')
+    db.mark_article_posted(1, 'c', 'rss_x')
+    return db
+
+
+def test_filter_unposted_keeps_order_and_scope(db):
+    """Test that only IDs posted for the same guild and source are dropped"""
+    assert db.filter_unposted(1, 'glassnode', ['c', 'a', 'b', 'c']) == ['c', 'b']
+    assert db.filter_unposted(3, 'glassnode', []) == []
+
+
+def test_filter_unposted_many_across_chunks(db, monkeypatch):
+    """Test many guild/source pairs, split over several queries"""
+    import database
+    monkeypatch.setattr(database, 'DEDUP_CHUNK_ROWS', 2)
+
+    unseen = db.filter_unposted_many({
+        (1, 'glassnode'): ['a', 'b'],
+        (2, 'glassnode'): ['a', 'b'],
+        (1, 'rss_x'): ['c', 'd', 'e'],
+    })
+    assert unseen == {(1, 'glassnode'): ['b'], (2, 'glassnode'): ['a'], (1, 'rss_x'): ['d', 'e']}
+
+
+def test_filter_unposted_many_includes_queued(db):
+    """Test that outbox rows count as seen only when asked"""
+    db.enqueue_posts([{'guild_id': 1, 'channel_id': 10, 'article_id': 'b', 'source': 'glassnode', 'payload': json.dumps({})}])
+
+    assert db.filter_unposted_many({(1, 'glassnode'): ['a', 'b']}) == {(1, 'glassnode'): ['b']}
+    assert db.filter_unposted_many({(1, 'glassnode'): ['a', 'b']}, include_queued=True) == {(1, 'glassnode'): []}
+
+
+@pytest.mark.asyncio
+async def test_posted_filter_coalesces_concurrent_checks(db):
+    """Test that deliveries started together share one query"""
+    posted_filter = PostedFilter(db)
+
+    results = await asyncio.gather(*(
+        posted_filter.unseen(guild_id, 'glassnode', ['a', 'b', 'z'])
+        for guild_id in (1, 2, 3)
+    ))
+
+    assert results == [['b', 'z'], ['a', 'z'], ['a', 'b', 'z']]
+    assert posted_filter.get_stats()['queries'] == 1
+    assert posted_filter.get_stats()['lookups'] == 3
+
+    # A later check is a new round trip
+    assert await posted_filter.unseen(1, 'rss_x', ['c']) == []
+    assert posted_filter.get_stats()['queries'] == 2
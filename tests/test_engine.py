@@ -0,0 +1,149 @@
+"""
+Unit tests for the concurrent news cycle engine
+"""
+
+import asyncio
+import time
+import pytest
+from cogs.news.engine import CycleEngine, Delivery, FetchJob
+from cogs.news.metrics import CycleMetrics
+from cogs.news.models import Article
+
+
+class FakeFetcher:
+    """Fetcher returning one article after a delay"""
+    
+    def __init__(self, name, delay=0.0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+    
+    async def fetch_with_retry(self, scope=''):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError('boom')
+        return [Article(id=self.name, title=self.name, url='https://example.com', source=self.name)]
+
+
+def _job(name, guilds, **kwargs):
+    fetcher = FakeFetcher(name, **kwargs)
+    job = FetchJob(key=name, fetcher=fetcher)
+    job.deliveries = [Delivery(guild_id=g, channel_id=g, source_key=name) for g in guilds]
+    return job
+
+
+@pytest.mark.asyncio
+async def test_each_job_fetched_once_and_delivered_to_all():
+    """Test fetch-once fan-out"""
+    delivered = []
+    
+    async def deliver(delivery, articles):
+        delivered.append((delivery.guild_id, articles[0].id))
+    
+    jobs = [_job('a', [1, 2, 3]), _job('b', [1])]
+    metrics = CycleMetrics()
+    await CycleEngine(deliver, fetch_concurrency=2).run(jobs, metrics)
+    
+    assert [job.fetcher.calls for job in jobs] == [1, 1]
+    assert sorted(delivered) == [(1, 'a'), (1, 'b'), (2, 'a'), (3, 'a')]
+    assert metrics.guilds_per_fetch('a') == 3.0
+
+
+@pytest.mark.asyncio
+async def test_cycle_time_follows_slowest_feed():
+    """Test that fetches run concurrently"""
+    async def deliver(delivery, articles):
+        pass
+    
+    jobs = [_job(f'feed{i}', [1], delay=0.2) for i in range(5)]
+    start = time.perf_counter()
+    await CycleEngine(deliver, fetch_concurrency=5).run(jobs, CycleMetrics())
+    
+    assert time.perf_counter() - start < 0.6
+
+
+@pytest.mark.asyncio
+async def test_failures_do_not_cancel_other_jobs():
+    """Test that a failing fetch or delivery is isolated"""
+    delivered = []
+    
+    async def deliver(delivery, articles):
+        if delivery.guild_id == 1:
+            raise RuntimeError('send failed')
+        delivered.append(delivery.guild_id)
+    
+    jobs = [_job('bad', [2], fail=True), _job('good', [1, 2])]
+    await CycleEngine(deliver, fetch_concurrency=1).run(jobs, CycleMetrics())
+    
+    assert delivered == [2]
+
+
+@pytest.mark.asyncio
+async def test_straggler_misses_deadline_and_is_delivered_next_run():
+    """Test that a slow fetch is left out of the cycle and picked up later"""
+    delivered = []
+    
+    async def deliver(delivery, articles):
+        delivered.append(articles[0].id)
+    
+    engine = CycleEngine(deliver, fetch_concurrency=2)
+    slow, fast = _job('slow', [1], delay=0.3), _job('fast', [1])
+    
+    metrics = CycleMetrics()
+    start = time.perf_counter()
+    await engine.run([slow, fast], metrics, deadline=0.1)
+    
+    assert time.perf_counter() - start < 0.25
+    assert delivered == ['fast']
+    assert list(metrics.deadline_missed) == ['slow']
+    assert engine.stragglers == ['slow']
+    
+    await asyncio.sleep(0.3)
+    assert engine.has_ready_stragglers()
+    
+    metrics = CycleMetrics()
+    await engine.run([], metrics, deadline=0.1)
+    
+    assert delivered == ['fast', 'slow']
+    assert metrics.carried_over == 1
+    assert metrics.fetch_seconds['slow'] >= 0.3
+    assert engine.stragglers == []
+    assert slow.fetcher.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_running_straggler_is_not_fetched_twice():
+    """Test that a due straggler reuses its in-flight fetch"""
+    async def deliver(delivery, articles):
+        pass
+    
+    engine = CycleEngine(deliver, fetch_concurrency=2)
+    slow = _job('slow', [1], delay=0.3)
+    
+    await engine.run([slow], CycleMetrics(), deadline=0.05)
+    await engine.run([slow], CycleMetrics())
+    
+    assert slow.fetcher.calls == 1
+    assert engine.stragglers == []
+
+
+@pytest.mark.asyncio
+async def test_runs_never_overlap():
+    """Test that a second run waits for the first to finish"""
+    active, overlaps = [0], []
+    
+    async def deliver(delivery, articles):
+        active[0] += 1
+        overlaps.append(active[0])
+        await asyncio.sleep(0.05)
+        active[0] -= 1
+    
+    engine = CycleEngine(deliver, fetch_concurrency=2)
+    await asyncio.gather(
+        engine.run([_job('a', [1])], CycleMetrics()),
+        engine.run([_job('b', [1])], CycleMetrics()),
+    )
+    
+    assert overlaps == [1, 1]
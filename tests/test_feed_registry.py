@@ -0,0 +1,86 @@
+"""
+Unit tests for the shared RSS feed registry
+"""
+
+import pytest
+from cogs.news.feed_registry import FeedRegistry, normalize_feed_url
+
+
+class TestNormalizeFeedURL:
+    """Test canonical feed URL keys"""
+    
+    def test_scheme_and_host_case(self):
+        """Test that scheme and host case do not create separate feeds"""
+        assert normalize_feed_url('HTTPS://CoinTelegraph.com/rss') == 'cointelegraph.com/rss'
+        assert normalize_feed_url('http://cointelegraph.com/rss') == 'cointelegraph.com/rss'
+    
+    def test_trailing_slash(self):
+        """Test that trailing slashes are ignored"""
+        assert normalize_feed_url('https://decrypt.co/feed/') == normalize_feed_url('https://decrypt.co/feed')
+    
+    def test_tracking_params_removed(self):
+        """Test that tracking parameters are dropped and others kept sorted"""
+        url = 'https://example.com/rss?utm_source=discord&b=2&a=1&fbclid=xyz'
+        assert normalize_feed_url(url) == 'example.com/rss?a=1&b=2'
+    
+    def test_default_port_and_fragment(self):
+        """Test that default ports and fragments are dropped"""
+        assert normalize_feed_url('https://example.com:443/rss#top') == 'example.com/rss'
+        assert normalize_feed_url('https://example.com:8443/rss') == 'example.com:8443/rss'
+    
+    def test_path_case_preserved(self):
+        """Test that path case is significant"""
+        assert normalize_feed_url('https://example.com/RSS') != normalize_feed_url('https://example.com/rss')
+
+
+def _config(*feeds):
+    return {'rss_feeds': [{'name': name, 'url': url, 'channel_id': channel} for name, url, channel in feeds]}
+
+
+def test_build_groups_identical_feeds():
+    """Test that the same feed across guilds is fetched by one shared source"""
+    registry = FeedRegistry()
+    configs = {
+        1: _config(('BBC News', 'https://feeds.bbci.co.uk/news/rss.xml', 10)),
+        2: _config(('BBC', 'https://feeds.bbci.co.uk/news/rss.xml/', 20),
+                   ('Decrypt', 'https://decrypt.co/feed', 21)),
+    }
+    
+    feeds = registry.build(configs)
+    by_key = {feed.key: feed for feed in feeds}
+    
+    assert len(feeds) == 2
+    bbc = by_key['feeds.bbci.co.uk/news/rss.xml']
+    assert [(s.guild_id, s.channel_id) for s in bbc.subscribers] == [(1, 10), (2, 20)]
+    # Per-guild posted-article keys stay on the URL each guild configured
+    assert bbc.subscribers[1].source_key == 'rss:https://feeds.bbci.co.uk/news/rss.xml/'
+
+
+def test_build_reuses_sources_across_cycles():
+    """Test that fetchers (and their state) survive between cycles"""
+    registry = FeedRegistry()
+    configs = {1: _config(('Decrypt', 'https://decrypt.co/feed', 10))}
+    
+    first = registry.build(configs)[0].source
+    second = registry.build(configs)[0].source
+    assert first is second
+    
+    assert registry.build({}) == []
+    assert registry.build(configs)[0].source is not first
+
+
+def test_dedup_report():
+    """Test dedup ratio report"""
+    registry = FeedRegistry()
+    configs = {
+        guild_id: _config(('Decrypt', 'https://decrypt.co/feed', guild_id))
+        for guild_id in range(4)
+    }
+    
+    report = FeedRegistry.dedup_report(registry.build(configs))
+    assert report == {
+        'subscriptions': 4,
+        'unique_feeds': 1,
+        'fetches_saved': 3,
+        'dedup_ratio': 4.0,
+    }
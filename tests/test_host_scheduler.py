@@ -0,0 +1,83 @@
+"""
+Unit tests for the per-host politeness scheduler
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import pytest
+from utils.host_scheduler import HostPolicy, HostScheduler, host_of, parse_host_overrides
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_host_of_and_overrides():
+    """Test host keys, override parsing and most-specific matching"""
+    assert host_of('https://www.CoinTelegraph.com/rss/tag/bitcoin') == 'cointelegraph.com'
+    
+    overrides = parse_host_overrides('bbci.co.uk=1:2, feeds.bbci.co.uk=3:0.5')
+    scheduler = HostScheduler(concurrency=2, min_interval=1, overrides=overrides)
+    
+    assert scheduler.policy_for('feeds.bbci.co.uk') == HostPolicy(3, 0.5)
+    assert scheduler.policy_for('news.bbci.co.uk') == HostPolicy(1, 2.0)
+    assert scheduler.policy_for('notbbci.co.uk') == HostPolicy(2, 1)
+    
+    with pytest.raises(ValueError):
+        parse_host_overrides('example.com=fast')
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limited_per_host():
+    """Test that one host is limited while another host runs in parallel"""
+    scheduler = HostScheduler(concurrency=1, min_interval=0, overrides={})
+    running = {'a.com': 0, 'b.com': 0}
+    peak = {'a.com': 0, 'b.com': 0}
+    
+    async def request(url, host):
+        async with scheduler.slot(url):
+            running[host] += 1
+            peak[host] = max(peak[host], running[host])
+            await asyncio.sleep(0.02)
+            running[host] -= 1
+    
+    await asyncio.gather(
+        *(request(f'https://a.com/feed{i}', 'a.com') for i in range(3)),
+        request('https://b.com/feed', 'b.com'),
+    )
+    
+    assert peak == {'a.com': 1, 'b.com': 1}
+    stats = scheduler.get_stats()
+    assert stats['a.com']['requests'] == 3 and stats['a.com']['max_queued'] == 2
+    assert stats['a.com']['waited'] == 2 and stats['b.com']['waited'] == 0
+
+
+@pytest.mark.asyncio
+async def test_min_interval_spaces_request_starts():
+    """Test that request starts on one host are spaced by min_interval"""
+    scheduler = HostScheduler(concurrency=3, min_interval=0.05, overrides={})
+    starts = []
+    
+    async def request():
+        async with scheduler.slot('https://a.com/feed'):
+            starts.append(time.monotonic())
+    
+    await asyncio.gather(*(request() for _ in range(3)))
+    
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+    assert scheduler.get_stats()['a.com']['max_wait'] >= 0.09
+
+
+def test_limits_read_from_environment():
+    """Test that HOST_* environment variables reach the shared scheduler"""
+    code = (
+        "from utils.host_scheduler import get_host_scheduler\n"
+        "s = get_host_scheduler()\n"
+        "p = s.policy_for('cointelegraph.com')\n"
+        "print(s.default.concurrency, s.default.min_interval, p.concurrency, p.min_interval)\n"
+    )
+    env = dict(os.environ, HOST_CONCURRENCY='5', HOST_MIN_INTERVAL='0.25', HOST_OVERRIDES='cointelegraph.com=1:2')
+    result = subprocess.run([sys.executable, '-c', code], env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ['5', '0.25', '1', '2.0']
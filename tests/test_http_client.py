@@ -0,0 +1,57 @@
+"""
+Unit tests for the shared HTTP client
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from utils.http_client import HTTPClient
+
+
+@pytest_asyncio.fixture
+async def local_server():
+    """Local HTTP server returning a small feed"""
+    async def handler(request):
+        return web.Response(text='<rss><channel></channel></rss>', content_type='application/rss+xml')
+    
+    app = web.Application()
+    app.router.add_get('/feed', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f'http://127.0.0.1:{port}/feed'
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused(local_server):
+    """Test that sequential requests reuse one keep-alive connection"""
+    client = HTTPClient()
+    await client.start()
+    try:
+        for _ in range(3):
+            async with client.session.get(local_server) as response:
+                assert response.status == 200
+                await response.read()
+        
+        stats = client.get_stats()
+        assert stats['total_requests'] == 3
+        assert stats['new_connections'] == 1
+        assert stats['reused_connections'] == 2
+        assert stats['tls_handshakes'] == 0
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_session_recreated_after_close():
+    """Test lazy session creation after close"""
+    client = HTTPClient()
+    session = client.session
+    await client.close()
+    
+    assert session.closed
+    assert not client.session.closed
+    await client.close()
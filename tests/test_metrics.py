@@ -0,0 +1,55 @@
+"""
+Unit tests for news cycle metrics
+"""
+
+import pytest
+from cogs.news.metrics import CycleMetrics
+
+
+def test_guilds_per_fetch():
+    """Test fan-out ratio for a source fetched once and served to many guilds"""
+    metrics = CycleMetrics(guilds=3)
+    metrics.record_fetch('glassnode', 5)
+    for _ in range(3):
+        metrics.record_served('glassnode')
+    
+    assert metrics.fetches['glassnode'] == 1
+    assert metrics.guilds_per_fetch('glassnode') == 3.0
+
+
+def test_guilds_per_fetch_without_fetch():
+    """Test ratio is zero for sources that were never fetched"""
+    metrics = CycleMetrics()
+    assert metrics.guilds_per_fetch('santiment') == 0.0
+
+
+def test_to_dict():
+    """Test dictionary summary"""
+    metrics = CycleMetrics(guilds=2)
+    metrics.record_fetch('theblock', 4)
+    metrics.record_served('theblock')
+    metrics.finish()
+    
+    data = metrics.to_dict()
+    assert data['guilds'] == 2
+    assert data['sources']['theblock'] == {
+        'fetches': 1,
+        'articles': 4,
+        'unchanged': 0,
+        'guilds_served': 1,
+        'guilds_per_fetch': 1.0,
+    }
+
+
+def test_overrun_and_slowest():
+    """Test deadline overrun and slowest-fetch ranking"""
+    metrics = CycleMetrics(budget=0.0)
+    metrics.record_fetch_time('fast', 0.1)
+    metrics.record_fetch_time('medium', 1.0)
+    metrics.record_deadline_miss('hung', 5.0)
+    metrics.finish()
+    
+    assert metrics.overrun > 0
+    assert metrics.slowest(2) == [('hung', 5.0), ('medium', 1.0)]
+    assert metrics.to_dict()['deadline_missed'] == ['hung']
+    assert CycleMetrics().overrun == 0.0
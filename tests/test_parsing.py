@@ -0,0 +1,189 @@
+"""
+Unit tests for the feed parsing stage
+"""
+
+import pickle
+import threading
+import pytest
+from bs4 import BeautifulSoup
+from cogs.news.parsing import (
+    ParseEngine,
+    FeedEntry,
+    parse_feed_entries,
+    stream_feed_entries,
+    validate_feed,
+    html_to_text_batch,
+    extract_phutcrypto_links,
+    links_from_soup,
+    phutcrypto_region,
+    find_websub_links
+)
+
+
+SAMPLE_FEED = (
+    b'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>'
+    b'<item><title>First</title><link>https://example.com/1</link>'
+    b'<description>&lt;p&gt;Hello &lt;b&gt;world&lt;/b&gt;&lt;/p&gt;</description>'
+    b'<enclosure url="https://example.com/1.jpg" type="image/jpeg" length="1"/></item>'
+    b'<item><title>Second</title><link>https://example.com/2</link></item>'
+    b'<item><title>Third</title><link>https://example.com/3</link></item>'
+    b'</channel></rss>'
+)
+
+SAMPLE_PAGE = b'''
+<html><body>
+<div><img data-src="https://5phutcrypto.io/a.jpg"><h3><a href="https://5phutcrypto.io/bai-1">Bai 1</a></h3></div>
+<div><h3><a href="https://5phutcrypto.io/tag/btc">Tag</a></h3></div>
+<div><h3><a href="https://other.site/x">Other</a></h3></div>
+<div><img src="https://5phutcrypto.io/b.jpg"><h3><a href="https://5phutcrypto.io/bai-2">Bai 2</a></h3></div>
+<div><h3><a href="https://5phutcrypto.io/bai-3">Bai 3</a></h3></div>
+</body></html>
+'''
+
+
+def test_parse_feed_entries():
+    """Test compact entry tuples and limit"""
+    entries = parse_feed_entries(SAMPLE_FEED, 2)
+    
+    assert [entry.title for entry in entries] == ['First', 'Second']
+    assert entries[0].link == 'https://example.com/1'
+    assert entries[0].image_url == 'https://example.com/1.jpg'
+    assert '<b>' in entries[0].summary
+    assert pickle.loads(pickle.dumps(entries)) == entries
+
+
+def test_parse_feed_entries_strip_html():
+    """Test summaries stripped inside the worker"""
+    entries = parse_feed_entries(SAMPLE_FEED, 1, True)
+    assert entries[0].summary == 'Hello world'
+
+
+def test_validate_feed():
+    """Test feed validation"""
+    assert validate_feed(SAMPLE_FEED) == (True, '')
+    assert validate_feed(b'<rss version="2.0"><channel></channel></rss>')[0] is False
+
+
+def test_html_to_text_batch():
+    """Test batch HTML stripping"""
+    assert html_to_text_batch(['<p>a</p>', '', None]) == ['a', '', '']
+
+
+def test_extract_phutcrypto_links():
+    """Test scraping of article links with skip rules and limit"""
+    links = extract_phutcrypto_links(SAMPLE_PAGE, 2)
+    
+    assert [link.url for link in links] == ['https://5phutcrypto.io/bai-1', 'https://5phutcrypto.io/bai-2']
+    assert links[0].image_url == 'https://5phutcrypto.io/a.jpg'
+    assert links[1].image_url == 'https://5phutcrypto.io/b.jpg'
+
+
+def test_phutcrypto_region_stops_after_limit():
+    """Test that only <body> up to the card after the last needed article is parsed"""
+    page = b'<html><head><script>var big = 1;</script></head>' + SAMPLE_PAGE.replace(b'<html>', b'')
+    region = phutcrypto_region(page, 2)
+    
+    assert region.startswith(b'<body')
+    assert b'bai-2' in region and b'bai-3' not in region and b'<script>' not in region
+    assert phutcrypto_region(page, 10).startswith(b'<body')
+
+
+@pytest.mark.parametrize('parser', ['html.parser', 'lxml'])
+def test_extract_phutcrypto_links_backends(parser):
+    """Test that both backends match the full-page html.parser result"""
+    if parser == 'lxml':
+        pytest.importorskip('lxml')
+    
+    expected = links_from_soup(BeautifulSoup(SAMPLE_PAGE, 'html.parser'), 3)
+    assert extract_phutcrypto_links(SAMPLE_PAGE, 3, parser) == expected
+
+
+def test_invalid_mode():
+    """Test that unknown modes are rejected"""
+    with pytest.raises(ValueError):
+        ParseEngine(mode='gpu')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('mode', ['inline', 'thread', 'process'])
+async def test_engine_modes_return_same_result(mode):
+    """Test every mode produces identical entries"""
+    engine = ParseEngine(mode=mode, workers=1)
+    try:
+        entries = await engine.run(parse_feed_entries, SAMPLE_FEED, 5)
+    finally:
+        engine.shutdown()
+    
+    assert entries == parse_feed_entries(SAMPLE_FEED, 5)
+    assert all(isinstance(entry, FeedEntry) for entry in entries)
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_uses_dedicated_pool():
+    """Test that thread mode runs on the feed-parse pool"""
+    engine = ParseEngine(mode='thread', workers=1)
+    try:
+        name = await engine.run(lambda: threading.current_thread().name)
+    finally:
+        engine.shutdown()
+    
+    assert name.startswith('feed-parse')
+
+
+ATOM_FEED = (
+    b'<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>A</title>'
+    b'<entry><title>Atom One</title><id>urn:1</id><updated>2025-01-02T00:00:00Z</updated>'
+    b'<published>2025-01-01T00:00:00Z</published>'
+    b'<link rel="self" href="https://example.com/self"/><link href="https://example.com/a1"/>'
+    b'<summary>Short</summary></entry>'
+    b'<entry><title>Atom Two</title><id>urn:2</id><link href="https://example.com/a2"/></entry>'
+    b'</feed>'
+)
+
+
+def test_stream_matches_feedparser_rss():
+    """Test streaming parser produces the same RSS entries as feedparser"""
+    assert stream_feed_entries(SAMPLE_FEED, 5) == parse_feed_entries(SAMPLE_FEED, 5)
+    assert stream_feed_entries(SAMPLE_FEED, 1, True)[0].summary == 'Hello world'
+
+
+def test_stream_atom():
+    """Test Atom entries (alternate link, id, published preferred over updated)"""
+    entries = stream_feed_entries(ATOM_FEED, 5)
+    
+    assert [entry.title for entry in entries] == ['Atom One', 'Atom Two']
+    assert entries[0].link == 'https://example.com/a1'
+    assert entries[0].id == 'urn:1'
+    assert entries[0].published == '2025-01-01T00:00:00Z'
+    assert entries[0].summary == 'Short'
+
+
+def test_stream_stops_at_limit():
+    """Test that bytes after the last needed entry are never parsed"""
+    truncated = SAMPLE_FEED.replace(b'<item><title>Third', b'<item><title>Third &broken;<<<')
+    entries = stream_feed_entries(truncated, 2)
+    
+    assert [entry.title for entry in entries] == ['First', 'Second']
+
+
+def test_stream_falls_back_on_malformed_feed():
+    """Test feedparser fallback for feeds that are not well-formed XML"""
+    malformed = SAMPLE_FEED.replace(b'<title>First</title>', b'<title>First&nbsp;</title>')
+    entries = stream_feed_entries(malformed, 5)
+    
+    assert [entry.link for entry in entries] == [
+        'https://example.com/1', 'https://example.com/2', 'https://example.com/3'
+    ]
+
+
+def test_find_websub_links():
+    """Test hub/self detection in the feed head (not in entries)"""
+    body = (
+        b'<rss xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+        b'<atom:link rel="hub" href="https://hub.example.com/"/>'
+        b'<atom:link href="https://example.com/feed" rel="self" type="application/rss+xml"/>'
+        b'<item><atom:link rel="hub" href="https://wrong.example.com/"/></item>'
+        b'</channel></rss>'
+    )
+    assert find_websub_links(body) == ('https://hub.example.com/', 'https://example.com/feed')
+    assert find_websub_links(b'<rss><channel><item/></channel></rss>') == (None, None)
@@ -0,0 +1,93 @@
+"""
+Unit tests for the adaptive poll scheduler
+"""
+
+import random
+from cogs.news.poll_scheduler import PollScheduler
+
+
+def _scheduler(**kwargs):
+    options = dict(min_interval=60, max_interval=1800, initial_interval=180, jitter=0.0, rng=random.Random(1))
+    options.update(kwargs)
+    return PollScheduler(**options)
+
+
+def test_new_feeds_are_due_immediately():
+    """Test that synced feeds are due on the first tick and only once"""
+    scheduler = _scheduler()
+    scheduler.sync(['a', 'b'], now=0)
+    
+    assert sorted(scheduler.due(now=0)) == ['a', 'b']
+    assert scheduler.due(now=0) == []
+
+
+def test_removed_feeds_are_dropped():
+    """Test that sync() forgets feeds nobody subscribes to"""
+    scheduler = _scheduler()
+    scheduler.sync(['a', 'b'], now=0)
+    scheduler.sync(['a'], now=0)
+    
+    assert scheduler.due(now=0) == ['a']
+    assert 'b' not in scheduler
+
+
+def test_busy_feed_polled_more_often_than_quiet_feed():
+    """Test that intervals follow the observed publish rate within bounds"""
+    scheduler = _scheduler()
+    scheduler.sync(['busy', 'quiet'], now=0)
+    
+    now, busy_items = 0.0, 0
+    for _ in range(180):  # three hours
+        for key in scheduler.due(now=now):
+            if key == 'busy':
+                busy_items += 2  # two new articles every poll
+                ids = [f'busy-{i}' for i in range(busy_items - 5, busy_items)]
+            else:
+                ids = ['quiet-1']
+            scheduler.record(key, ids, now=now)
+        now += 60
+    
+    busy = scheduler.get('busy')
+    quiet = scheduler.get('quiet')
+    assert busy.interval < 90
+    assert quiet.interval > 900
+    assert quiet.interval <= 1800
+
+
+def test_full_page_of_new_items_halves_interval():
+    """Test that a saturated page (possible missed items) speeds polling up"""
+    scheduler = _scheduler()
+    scheduler.sync(['a'], now=0)
+    scheduler.record('a', ['1', '2'], now=0)
+    scheduler.record('a', ['1', '2'], now=1000)
+    before = scheduler.get('a').interval
+    
+    scheduler.record('a', ['3', '4'], now=2000)
+    assert scheduler.get('a').interval <= before / 2
+
+
+def test_jitter_spreads_due_times():
+    """Test that jitter keeps feeds from polling at the same instant"""
+    scheduler = _scheduler(jitter=0.2)
+    keys = [f'feed{i}' for i in range(20)]
+    scheduler.sync(keys, now=0)
+    scheduler.due(now=1000)
+    for key in keys:
+        scheduler.record(key, [], now=1000)
+    
+    due_times = {scheduler.get(key).next_due for key in keys}
+    assert len(due_times) == len(keys)
+
+
+def test_min_interval_floor_applies_on_next_poll():
+    """Test the per-feed floor used for feeds receiving WebSub pushes"""
+    scheduler = _scheduler()
+    scheduler.sync(['pushed'], now=0)
+    scheduler.set_min_interval('pushed', 3600)
+    scheduler.record('pushed', ['1'], now=0)
+    
+    assert scheduler.get('pushed').interval == 3600
+    
+    scheduler.set_min_interval('pushed', None)
+    scheduler.record('pushed', ['1'], now=3600)
+    assert scheduler.get('pushed').interval < 3600
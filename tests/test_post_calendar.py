@@ -40,7 +40,7 @@ async def on_ready():
             print(f"🔹 Processing guild: {guild.name}")
             
             try:
-                config = news_cog.load_news_config(guild.id)
+                config = await news_cog.load_news_config(guild.id)
                 
                 if config and config.get('economic_calendar_channel'):
                     channel = bot.get_channel(config['economic_calendar_channel'])
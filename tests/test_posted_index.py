@@ -0,0 +1,108 @@
+"""
+Unit tests for the in-memory posted-article index
+"""
+
+import json
+import pytest
+from database import Database
+from cogs.news.dedup import PostedFilter
+from cogs.news.posted_index import BloomFilter, PostedIndex
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / 'test.db'))
+    db.mark_article_posted(1, 'a', 'glassnode')
+    db.mark_article_posted(1, 'b', 'glassnode')
+    db.mark_article_posted(2, 'a', 'rss_x')
+    return db
+
+
+@pytest.fixture
+def index(db):
+    index = PostedIndex(min_capacity=1000, fp_rate=0.01, recent=2)
+    index.rebuild(db)
+    db.add_posted_listener(index.add)
+    return index
+
+
+def test_bloom_has_no_false_negatives():
+    """Test that every added key is found and the FP rate stays near target"""
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f'key-{i}' for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    count = bloom.count
+    assert count > 980  # a new key whose bits are all set already is not counted
+    assert not bloom.add('key-1')
+    assert bloom.count == count
+
+    false_positives = sum(f'other-{i}' in bloom for i in range(10000))
+    assert false_positives < 300
+    assert bloom.estimated_fp_rate() == pytest.approx(0.01, rel=0.5)
+
+
+def test_classify_splits_new_posted_unknown(db, index):
+    """Test Bloom misses, recent-set hits and Bloom-only hits"""
+    assert index.ready
+    new, posted, unknown = index.classify(1, 'glassnode', ['a', 'b', 'z'])
+    assert (new, posted, unknown) == (['z'], ['a', 'b'], [])
+
+    # Recent sets keep the last 2 IDs per pair; older ones need the database
+    db.mark_article_posted(1, 'c', 'glassnode')
+    new, posted, unknown = index.classify(1, 'glassnode', ['a', 'b', 'c'])
+    assert (new, posted, unknown) == ([], ['b', 'c'], ['a'])
+
+    # Scoped per guild and source
+    assert index.classify(2, 'glassnode', ['a'])[0] == ['a']
+
+
+def test_write_through_from_outbox(db, index):
+    """Test that queued posts are indexed as soon as they are enqueued"""
+    db.enqueue_posts([{'guild_id': 3, 'channel_id': 10, 'article_id': 'q', 'source': 'glassnode', 'payload': json.dumps({})}])
+    assert index.classify(3, 'glassnode', ['q'])[1] == ['q']
+
+
+def test_rebuild_replays_writes_made_during_it(db):
+    """Test that posts stored while a rebuild streams rows are not lost"""
+    index = PostedIndex(min_capacity=1000, fp_rate=0.01, recent=10)
+    db.add_posted_listener(index.add)
+    rows = db.iter_posted_keys
+
+    def iter_and_post(include_queued=False):
+        for row in rows(include_queued):
+            yield row
+        db.mark_article_posted(5, 'late', 'glassnode')
+
+    db.iter_posted_keys = iter_and_post
+    stats = index.rebuild(db)
+
+    assert stats['items'] == 4
+    assert index.classify(5, 'glassnode', ['late'])[1] == ['late']
+    assert stats['memory_bytes'] == stats['bloom_bytes'] + stats['recent_bytes']
+
+
+@pytest.mark.asyncio
+async def test_posted_filter_skips_database_for_known_ids(db, index):
+    """Test that the DB is only queried for IDs the index cannot answer"""
+    posted_filter = PostedFilter(db, index=index)
+
+    assert await posted_filter.unseen(1, 'glassnode', ['a', 'b', 'z']) == ['z']
+    assert posted_filter.get_stats()['queries'] == 0
+
+    db.mark_article_posted(1, 'c', 'glassnode')  # pushes 'a' out of the recent set
+    assert await posted_filter.unseen(1, 'glassnode', ['z', 'a']) == ['z']
+    assert posted_filter.get_stats()['queries'] == 1
+
+    # The database answer is remembered
+    assert index.classify(1, 'glassnode', ['a'])[1] == ['a']
+    assert index.get_stats()['false_positives'] == 0
+
+
+@pytest.mark.asyncio
+async def test_posted_filter_without_ready_index_uses_database(db):
+    """Test the fallback before the index is warmed"""
+    posted_filter = PostedFilter(db, index=PostedIndex(min_capacity=1000))
+    assert await posted_filter.unseen(1, 'glassnode', ['a', 'z']) == ['z']
+    assert posted_filter.get_stats()['queries'] == 1
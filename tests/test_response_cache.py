@@ -0,0 +1,106 @@
+"""
+Unit tests for the feed response cache
+"""
+
+import asyncio
+import pytest
+from utils.response_cache import ResponseCache
+
+
+class CountingLoader:
+    """Loader returning a fixed body after a delay"""
+
+    def __init__(self, body=b'<rss/>', delay=0.0):
+        self.body = body
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.body
+
+
+@pytest.mark.asyncio
+async def test_hit_within_ttl():
+    """Test that a second lookup is served from the cache"""
+    cache = ResponseCache(ttl=60, max_entries=10, max_bytes=1024)
+    loader = CountingLoader()
+
+    assert await cache.get_or_fetch('https://a/rss', loader) == b'<rss/>'
+    assert await cache.get_or_fetch('https://a/rss', loader) == b'<rss/>'
+
+    assert loader.calls == 1
+    stats = cache.get_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_request():
+    """Test single-flight: concurrent callers wait for the same download"""
+    cache = ResponseCache(ttl=60, max_entries=10, max_bytes=1024)
+    loader = CountingLoader(delay=0.05)
+
+    results = await asyncio.gather(*(cache.get_or_fetch('https://a/rss', loader) for _ in range(5)))
+
+    assert results == [b'<rss/>'] * 5
+    assert loader.calls == 1
+    assert cache.get_stats()['coalesced'] == 4
+
+
+@pytest.mark.asyncio
+async def test_max_age_and_expiry():
+    """Test that callers can require fresher data than the TTL"""
+    cache = ResponseCache(ttl=60, max_entries=10, max_bytes=1024)
+    loader = CountingLoader()
+
+    await cache.get_or_fetch('https://a/rss', loader)
+    await asyncio.sleep(0.02)
+    await cache.get_or_fetch('https://a/rss', loader, max_age=0.01)
+    assert loader.calls == 2
+
+    expired = ResponseCache(ttl=0, max_entries=10, max_bytes=1024)
+    await expired.get_or_fetch('https://a/rss', loader)
+    await asyncio.sleep(0.01)
+    await expired.get_or_fetch('https://a/rss', loader)
+    assert loader.calls == 4
+    assert expired.get_stats()['expirations'] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_by_count_and_size():
+    """Test that least recently used entries are evicted"""
+    cache = ResponseCache(ttl=60, max_entries=2, max_bytes=1024)
+
+    await cache.get_or_fetch('a', CountingLoader(b'a'))
+    await cache.get_or_fetch('b', CountingLoader(b'b'))
+    await cache.get_or_fetch('a', CountingLoader(b'a'))  # a is now most recent
+    await cache.get_or_fetch('c', CountingLoader(b'c'))
+
+    reload_b = CountingLoader(b'b')
+    await cache.get_or_fetch('b', reload_b)
+    assert reload_b.calls == 1
+    assert cache.get_stats()['evictions'] == 2
+
+    small = ResponseCache(ttl=60, max_entries=10, max_bytes=10)
+    await small.get_or_fetch('x', CountingLoader(b'x' * 6))
+    await small.get_or_fetch('y', CountingLoader(b'y' * 6))
+    assert small.get_stats()['entries'] == 1 and small.get_stats()['bytes'] == 6
+
+
+@pytest.mark.asyncio
+async def test_none_and_errors_are_not_cached():
+    """Test that 304 (None) results and failures are not cached"""
+    cache = ResponseCache(ttl=60, max_entries=10, max_bytes=1024)
+
+    not_modified = CountingLoader(body=None)
+    assert await cache.get_or_fetch('a', not_modified) is None
+    assert await cache.get_or_fetch('a', not_modified) is None
+    assert not_modified.calls == 2
+
+    async def failing():
+        raise RuntimeError('down')
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch('b', failing)
+    assert await cache.get_or_fetch('b', CountingLoader(b'ok')) == b'ok'
@@ -0,0 +1,122 @@
+"""
+Unit tests for the retry policy engine
+"""
+
+import asyncio
+import random
+import aiohttp
+import pytest
+from multidict import CIMultiDict
+from yarl import URL
+from utils.retry import RetryBudget, RetryPolicy, retry_after_seconds, retry_deadline
+
+
+def http_error(status: int, retry_after: str = None) -> aiohttp.ClientResponseError:
+    request_info = aiohttp.RequestInfo(URL('https://api.example.com/'), 'GET', CIMultiDict())
+    headers = CIMultiDict({'Retry-After': retry_after}) if retry_after else None
+    return aiohttp.ClientResponseError(request_info, (), status=status, headers=headers)
+
+
+def flaky(errors):
+    """Coroutine function raising the given errors in turn, then returning 'ok'"""
+    calls = []
+
+    async def func():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return 'ok'
+
+    func.calls = calls
+    return func
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping"""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr('utils.retry.asyncio.sleep', fake_sleep)
+    return delays
+
+
+def test_full_jitter_bounds():
+    """Test that delays are uniform between 0 and the capped exponential"""
+    policy = RetryPolicy('test', base_delay=1, max_delay=5, rng=random.Random(1))
+    for attempt, cap in [(0, 1), (1, 2), (2, 4), (5, 5)]:
+        delays = [policy.backoff(attempt) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert max(delays) > cap * 0.8
+
+
+def test_retry_after_parsing():
+    """Test seconds and HTTP-date Retry-After values"""
+    assert retry_after_seconds(http_error(503, '7')) == 7.0
+    assert retry_after_seconds(http_error(503, 'Wed, 21 Oct 2015 07:28:00 GMT')) == 0.0
+    assert retry_after_seconds(http_error(503)) is None
+    assert retry_after_seconds(ValueError('x')) is None
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(sleeps):
+    """Test recovery after transient failures, honoring Retry-After"""
+    policy = RetryPolicy('test', max_attempts=3, base_delay=0.1, max_delay=30, budget=RetryBudget(max_tokens=10))
+    func = flaky([aiohttp.ClientConnectionError('reset'), http_error(429, '12')])
+
+    assert await policy.call(func) == 'ok'
+    assert len(func.calls) == 3
+    assert sleeps[0] <= 0.1 and sleeps[1] == 12.0
+    assert policy.get_stats()['recovered'] == 1
+    assert policy.get_stats()['retry_after_waits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_non_transient_and_long_retry_after_are_not_retried(sleeps):
+    """Test that 4xx errors and a Retry-After beyond max_delay give up at once"""
+    policy = RetryPolicy('test', max_delay=30, budget=RetryBudget(max_tokens=10))
+
+    for error in (http_error(404), http_error(503, '3600')):
+        func = flaky([error])
+        with pytest.raises(aiohttp.ClientResponseError):
+            await policy.call(func)
+        assert len(func.calls) == 1
+
+    assert sleeps == []
+    assert policy.get_stats()['not_retryable'] == 1
+
+
+@pytest.mark.asyncio
+async def test_budget_exhaustion_stops_retries(sleeps):
+    """Test that the shared budget caps retries across calls"""
+    budget = RetryBudget(ratio=0.1, max_tokens=2)
+    policy = RetryPolicy('test', max_attempts=5, budget=budget)
+
+    func = flaky([asyncio.TimeoutError()] * 5)
+    with pytest.raises(asyncio.TimeoutError):
+        await policy.call(func)
+
+    # A full bucket of two tokens allows two retries
+    assert len(func.calls) == 3
+    assert policy.get_stats()['budget_stops'] == 1
+    assert budget.get_stats()['rejected'] == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_stops_retries(sleeps):
+    """Test that no retry starts when it would end past the deadline"""
+    policy = RetryPolicy('test', base_delay=1, deadline_margin=2, budget=RetryBudget(max_tokens=10))
+    loop = asyncio.get_running_loop()
+
+    func = flaky([asyncio.TimeoutError()])
+    with retry_deadline(loop.time() + 1):
+        with pytest.raises(asyncio.TimeoutError):
+            await policy.call(func)
+
+    assert len(func.calls) == 1
+    assert policy.get_stats()['deadline_stops'] == 1
+
+    # Outside the context the deadline no longer applies
+    assert await policy.call(flaky([asyncio.TimeoutError()])) == 'ok'
@@ -135,3 +135,416 @@ def test_rss_source_icon_detection():
     # Cointelegraph
     source = RSSSource('Cointelegraph', 'https://cointelegraph.com/rss')
     assert 'cointelegraph.com' in source.source.icon_url
+
+
+@pytest.mark.asyncio
+async def test_rss_source_conditional_get(tmp_path, monkeypatch):
+    """Test that validators are sent and a 304 returns no articles"""
+    from aiohttp import web
+    from database import Database
+    from utils.response_cache import ResponseCache
+    from utils.host_scheduler import HostScheduler
+    import cogs.news.sources as sources
+    
+    db = Database(str(tmp_path / 'test.db'))
+    monkeypatch.setattr(sources, 'get_database', lambda: db)
+    no_cache = ResponseCache(ttl=0)
+    monkeypatch.setattr(sources, 'get_response_cache', lambda: no_cache)
+    no_spacing = HostScheduler(min_interval=0, overrides={})
+    monkeypatch.setattr(sources, 'get_host_scheduler', lambda: no_spacing)
+    
+    feed_xml = (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>'
+        '<item><title>Hello</title><link>https://example.com/1</link><guid>1</guid></item>'
+        '</channel></rss>'
+    )
+    seen_headers = []
+    
+    async def handler(request):
+        seen_headers.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=feed_xml, headers={'ETag': '"v1"'}, content_type='application/rss+xml')
+    
+    app = web.Application()
+    app.router.add_get('/rss', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    
+    try:
+        source = RSSSource('Local', f'http://127.0.0.1:{port}/rss')
+        first = await source.fetch()
+        second = await source.fetch()
+        
+        # Validators survive a restart (new fetcher instance)
+        third = await RSSSource('Local', f'http://127.0.0.1:{port}/rss').fetch()
+    finally:
+        await source.http.close()
+        await runner.cleanup()
+    
+    assert [a.title for a in first] == ['Hello']
+    assert second == [] and third == []
+    assert seen_headers == [None, '"v1"', '"v1"']
+    
+    stats = db.get_feed_conditional_stats()[0]
+    assert stats['request_count'] == 3
+    assert stats['not_modified_count'] == 2
+    assert stats['bytes_saved'] == 2 * len(feed_xml)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_body_skips_parse(tmp_path, monkeypatch):
+    """Test that a byte-identical body (no validators) is not parsed again"""
+    from aiohttp import web
+    from database import Database
+    from utils.response_cache import ResponseCache
+    from utils.host_scheduler import HostScheduler
+    from utils.circuit_breaker import CircuitBreakers
+    import cogs.news.sources as sources
+    
+    db = Database(str(tmp_path / 'test.db'))
+    monkeypatch.setattr(sources, 'get_database', lambda: db)
+    no_cache = ResponseCache(ttl=0)
+    monkeypatch.setattr(sources, 'get_response_cache', lambda: no_cache)
+    no_spacing = HostScheduler(min_interval=0, overrides={})
+    monkeypatch.setattr(sources, 'get_host_scheduler', lambda: no_spacing)
+    breakers = CircuitBreakers(db=db)
+    monkeypatch.setattr(sources, 'get_circuit_breakers', lambda: breakers)
+    
+    bodies = {'title': 'Hello'}
+    
+    async def handler(request):
+        # Ignores conditional requests, like many real servers
+        return web.Response(
+            text=(
+                '<?xml version="1.0"?><rss version="2.0"><channel>'
+                f'<item><title>{bodies["title"]}</title><link>https://example.com/1</link></item>'
+                '</channel></rss>'
+            ),
+            content_type='application/rss+xml'
+        )
+    
+    app = web.Application()
+    app.router.add_get('/rss', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    url = f'http://127.0.0.1:{port}/rss'
+    
+    try:
+        source = RSSSource('Local', url)
+        first = await source.fetch_with_retry()
+        await source.commit_digest()  # the engine does this once every delivery succeeded
+        second = await source.fetch_with_retry()
+        
+        # Digest survives a restart (new fetcher instance)
+        restarted = RSSSource('Local', url)
+        third = await restarted.fetch_with_retry()
+        
+        bodies['title'] = 'Changed'
+        fourth = await restarted.fetch_with_retry()
+    finally:
+        await source.http.close()
+        await runner.cleanup()
+    
+    assert [a.title for a in first] == ['Hello']
+    assert second == [] and source.unchanged_hits == 1 and source.last_unchanged
+    assert third == [] and restarted.unchanged_hits == 1
+    assert [a.title for a in fourth] == ['Changed'] and not restarted.last_unchanged
+    assert db.get_body_digest_stats()[0]['unchanged_count'] == 2
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_and_failed_delivery_refetch(tmp_path, monkeypatch):
+    """Test that a new subscriber and a failed delivery bypass the 304/digest skip"""
+    from aiohttp import web
+    from database import Database
+    from utils.response_cache import ResponseCache
+    from utils.host_scheduler import HostScheduler
+    from utils.circuit_breaker import CircuitBreakers
+    from cogs.news.engine import CycleEngine, Delivery, FetchJob
+    from cogs.news.metrics import CycleMetrics
+    import cogs.news.sources as sources
+    
+    db = Database(str(tmp_path / 'test.db'))
+    monkeypatch.setattr(sources, 'get_database', lambda: db)
+    no_cache = ResponseCache(ttl=0)
+    monkeypatch.setattr(sources, 'get_response_cache', lambda: no_cache)
+    no_spacing = HostScheduler(min_interval=0, overrides={})
+    monkeypatch.setattr(sources, 'get_host_scheduler', lambda: no_spacing)
+    breakers = CircuitBreakers(db=db)
+    monkeypatch.setattr(sources, 'get_circuit_breakers', lambda: breakers)
+    
+    feed = {'version': 'v1', 'title': 'Hello'}
+    
+    async def handler(request):
+        etag = f'"{feed["version"]}"'
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304)
+        return web.Response(
+            text=(
+                '<?xml version="1.0"?><rss version="2.0"><channel>'
+                f'<item><title>{feed["title"]}</title><link>https://example.com/{feed["version"]}</link></item>'
+                '</channel></rss>'
+            ),
+            headers={'ETag': etag},
+            content_type='application/rss+xml'
+        )
+    
+    app = web.Application()
+    app.router.add_get('/rss', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    
+    delivered = []
+    failing = set()
+    
+    async def deliver(delivery, articles):
+        delivered.append((delivery.guild_id, articles[0].title))
+        if delivery.guild_id in failing:
+            raise LookupError('channel missing')
+    
+    engine = CycleEngine(deliver, fetch_concurrency=1)
+    source = RSSSource('Local', f'http://127.0.0.1:{port}/rss')
+    
+    async def cycle(*guilds):
+        delivered.clear()
+        job = FetchJob(key='rss:local', fetcher=source)
+        job.deliveries = [Delivery(guild_id=g, channel_id=g, source_key='rss_local') for g in guilds]
+        await engine.run([job], CycleMetrics())
+        return sorted(delivered)
+    
+    try:
+        assert await cycle(1) == [(1, 'Hello')]
+        assert await cycle(1) == []  # 304
+        
+        # A guild subscribing to the already-polled feed gets its entries
+        assert await cycle(1, 2) == [(1, 'Hello'), (2, 'Hello')]
+        assert await cycle(1, 2) == []
+        
+        # A failed delivery is retried by the next poll until it succeeds
+        feed.update(version='v2', title='Changed')
+        failing.add(2)
+        assert await cycle(1, 2) == [(1, 'Changed'), (2, 'Changed')]
+        failing.clear()
+        assert await cycle(1, 2) == [(1, 'Changed'), (2, 'Changed')]
+        assert await cycle(1, 2) == []
+    finally:
+        await source.http.close()
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_santiment_incremental_cursor(tmp_path, monkeypatch):
+    """Test that Santiment pages down to the stored publishedAt mark and advances it"""
+    from aiohttp import web
+    from database import Database
+    from utils.rate_limiter import MultiServiceRateLimiter
+    from utils.host_scheduler import HostScheduler
+    import cogs.news.sources as sources
+    
+    db = Database(str(tmp_path / 'test.db'))
+    monkeypatch.setattr(sources, 'get_database', lambda: db)
+    limiter = MultiServiceRateLimiter()
+    limiter.add_limiter('santiment', max_calls=100, period=3600)
+    monkeypatch.setattr(sources, 'get_rate_limiter', lambda: limiter)
+    no_spacing = HostScheduler(min_interval=0, overrides={})
+    monkeypatch.setattr(sources, 'get_host_scheduler', lambda: no_spacing)
+    monkeypatch.setenv('SANTIMENT_API_KEY', 'test-key')
+    
+    # Newest first, like the API
+    insights = [
+        {'id': i, 'title': f'Insight {i}', 'text': f'<p>Body {i}</p>',
+         'publishedAt': f'2026-01-{i:02d}T00:00:00Z', 'user': {'username': 'analyst'}}
+        for i in range(3, 0, -1)
+    ]
+    pages = []
+    
+    async def handler(request):
+        variables = (await request.json())['variables']
+        pages.append(variables['page'])
+        start = (variables['page'] - 1) * variables['pageSize']
+        return web.json_response({'data': {'allInsights': insights[start:start + variables['pageSize']]}})
+    
+    app = web.Application()
+    app.router.add_post('/graphql', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    
+    try:
+        source = SantimentSource()
+        source.GRAPHQL_URL = f'http://127.0.0.1:{port}/graphql'
+        source.page_size = 2
+        
+        # First run: newest page only, sets the mark
+        first = await source.fetch()
+        
+        # Downtime: five new insights; paging stops at the page holding the mark
+        insights[:0] = [
+            {'id': i, 'title': f'Insight {i}', 'text': '', 'publishedAt': f'2026-01-{i:02d}T00:00:00Z', 'user': None}
+            for i in range(8, 3, -1)
+        ]
+        pages.clear()
+        second = await source.fetch()
+        third = await source.fetch()
+    finally:
+        await source.http.close()
+        await runner.cleanup()
+    
+    assert [a.id for a in first] == ['3', '2']
+    assert first[0].description == 'Body 3' and first[0].author == 'analyst'
+    assert [a.id for a in second] == ['8', '7', '6', '5', '4']
+    assert pages == [1, 2, 3, 1]
+    assert third == []
+    assert db.get_source_cursor('santiment') == '2026-01-08T00:00:00Z'
+    
+    usage = db.get_api_usage('santiment')[0]
+    assert usage['requests'] == 5 and usage['items'] == 7
+
+
+@pytest.mark.asyncio
+async def test_santiment_mark_waits_for_delivery(tmp_path, monkeypatch):
+    """Test that drafts don't stop paging and the mark only moves past delivered, complete backlogs"""
+    from aiohttp import web
+    from database import Database
+    from utils.rate_limiter import MultiServiceRateLimiter
+    from utils.host_scheduler import HostScheduler
+    import cogs.news.sources as sources
+    
+    db = Database(str(tmp_path / 'test.db'))
+    db.save_source_cursor('santiment', '2026-01-01T00:00:00Z')
+    monkeypatch.setattr(sources, 'get_database', lambda: db)
+    limiter = MultiServiceRateLimiter()
+    limiter.add_limiter('santiment', max_calls=100, period=3600)
+    monkeypatch.setattr(sources, 'get_rate_limiter', lambda: limiter)
+    no_spacing = HostScheduler(min_interval=0, overrides={})
+    monkeypatch.setattr(sources, 'get_host_scheduler', lambda: no_spacing)
+    monkeypatch.setenv('SANTIMENT_API_KEY', 'test-key')
+    
+    # A draft on the first page, the mark on the third
+    insights = [
+        {'id': 'draft', 'title': 'Draft', 'text': '', 'publishedAt': None, 'user': None},
+        *({'id': i, 'title': f'Insight {i}', 'text': '', 'publishedAt': f'2026-01-{i:02d}T00:00:00Z', 'user': None}
+          for i in range(4, 0, -1)),
+    ]
+    failing_pages = set()
+    
+    async def handler(request):
+        variables = (await request.json())['variables']
+        if variables['page'] in failing_pages:
+            return web.json_response({'errors': ['boom']})
+        start = (variables['page'] - 1) * variables['pageSize']
+        return web.json_response({'data': {'allInsights': insights[start:start + variables['pageSize']]}})
+    
+    app = web.Application()
+    app.router.add_post('/graphql', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    
+    try:
+        source = SantimentSource()
+        source.GRAPHQL_URL = f'http://127.0.0.1:{port}/graphql'
+        source.page_size = 2
+        
+        # A page of the backlog fails: its insights may not be skipped later
+        failing_pages.add(2)
+        partial = await source.fetch_with_retry('scope')
+        await source.commit_digest()
+        assert [a.id for a in partial] == ['4']
+        assert db.get_source_cursor('santiment') == '2026-01-01T00:00:00Z'
+        
+        # Complete backlog, but a delivery failed (no commit)
+        failing_pages.clear()
+        undelivered = await source.fetch_with_retry('scope')
+        assert [a.id for a in undelivered] == ['4', '3', '2']
+        assert db.get_source_cursor('santiment') == '2026-01-01T00:00:00Z'
+        
+        retried = await source.fetch_with_retry('scope')
+        assert [a.id for a in retried] == ['4', '3', '2']
+        await source.commit_digest()
+    finally:
+        await source.http.close()
+        await runner.cleanup()
+    
+    assert db.get_source_cursor('santiment') == '2026-01-04T00:00:00Z'
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_skips_dead_feed(tmp_path, monkeypatch):
+    """Test that a failing feed trips its breaker and is then skipped without requests"""
+    from aiohttp import web
+    from database import Database
+    from utils.response_cache import ResponseCache
+    from utils.host_scheduler import HostScheduler
+    from utils.circuit_breaker import CircuitBreakers
+    from utils.retry import RetryPolicy
+    import cogs.news.sources as sources
+    
+    db = Database(str(tmp_path / 'test.db'))
+    monkeypatch.setattr(sources, 'get_database', lambda: db)
+    no_cache = ResponseCache(ttl=0)
+    monkeypatch.setattr(sources, 'get_response_cache', lambda: no_cache)
+    no_spacing = HostScheduler(min_interval=0, overrides={})
+    monkeypatch.setattr(sources, 'get_host_scheduler', lambda: no_spacing)
+    now = [1000.0]
+    breakers = CircuitBreakers(threshold=2, window=600, open_seconds=300, db=db, clock=lambda: now[0])
+    monkeypatch.setattr(sources, 'get_circuit_breakers', lambda: breakers)
+    monkeypatch.setattr(sources, 'get_retry_policy', lambda name: RetryPolicy(name, max_attempts=1))
+    
+    requests = []
+    
+    async def handler(request):
+        requests.append(request.path)
+        return web.Response(status=404)
+    
+    app = web.Application()
+    app.router.add_get('/{name}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    
+    try:
+        dead = RSSSource('Dead', f'http://127.0.0.1:{port}/dead')
+        await dead.fetch_with_retry()
+        await dead.fetch_with_retry()
+        assert len(requests) == 2
+        
+        # Open: no request at all
+        assert await dead.fetch_with_retry() == []
+        assert len(requests) == 2 and dead.circuit_skips == 1
+        
+        # A 404 is the feed's problem, not the host's: a neighbour still goes out
+        await RSSSource('Neighbour', f'http://127.0.0.1:{port}/other').fetch_with_retry()
+        assert requests[-1] == '/other'
+        
+        # After the open period one probe goes out; its failure doubles the period
+        now[0] += 301
+        await dead.fetch_with_retry()
+        assert len(requests) == 4
+        breaker = breakers.get(dead.url)
+        assert breaker.state == 'open' and breaker.open_seconds == 600
+        
+        # State survives a restart
+        await db.aio.run(lambda: None)  # saves are queued on the writer thread
+        restarted = CircuitBreakers(db=db, clock=lambda: now[0])
+        await restarted.preload()
+        assert not restarted.acquire(dead.breaker_keys)
+    finally:
+        await dead.http.close()
+        await runner.cleanup()
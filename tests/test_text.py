@@ -0,0 +1,48 @@
+"""
+Unit tests for HTML-to-text normalization
+"""
+
+import pytest
+from cogs.news.text import html_to_text, html_to_text_batch, get_text_stats, clear_text_memo
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    clear_text_memo()
+    yield
+    clear_text_memo()
+
+
+def test_strips_tags_and_entities():
+    """Test tags, entities and whitespace"""
+    assert html_to_text('<p>Bitcoin &amp; <b>ETH</b></p>\n\n<p>rally</p>') == 'Bitcoin & ETH rally'
+    assert html_to_text('It#8217;s up') == 'It’s up'
+    assert html_to_text('It&#8217;s up') == 'It’s up'
+
+
+def test_strips_entity_escaped_tags():
+    """Test markup that arrives entity-escaped"""
+    assert html_to_text('&lt;p&gt;Bitcoin &lt;b&gt;rally&lt;/b&gt;&lt;/p&gt;') == 'Bitcoin rally'
+    assert html_to_text('&lt;p&gt;BTC &amp;gt; 100k&lt;/p&gt;') == 'BTC &gt; 100k'
+
+
+def test_drops_script_style_and_comments():
+    """Test that non-text markup content is removed"""
+    text = '<style>p{color:red}</style><p>Visible</p><!-- hidden --><script>var x = "<b>";</script>'
+    assert html_to_text(text) == 'Visible'
+
+
+def test_fast_path_and_memo():
+    """Test that plain text skips the regexes and repeated markup is memoized"""
+    assert html_to_text('  plain   text ') == 'plain text'
+    assert html_to_text('<i>same</i>') == html_to_text('<i>same</i>') == 'same'
+    
+    stats = get_text_stats()
+    assert stats['fast_path'] == 1
+    assert stats['misses'] == 1 and stats['hits'] == 1
+    assert stats['memo_entries'] == 1
+
+
+def test_batch_handles_empty_values():
+    """Test batch cleaning with None and empty strings"""
+    assert html_to_text_batch(['<p>a</p>', '', None]) == ['a', '', '']
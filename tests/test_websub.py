@@ -0,0 +1,130 @@
+"""
+Unit tests for WebSub push ingestion against a local stand-in hub
+"""
+
+import asyncio
+import hashlib
+import hmac
+import secrets
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from cogs.news.websub import WebSubSubscriber
+from utils.http_client import get_http_client
+
+TOPIC = 'https://example.com/feed'
+FEED = b'<rss version="2.0"><channel><item><title>Pushed</title><link>https://example.com/1</link></item></channel></rss>'
+
+
+class StandInHub:
+    """Minimal WebSub hub: verifies intent, then lets the test publish"""
+
+    def __init__(self):
+        self.subscribers = {}  # topic -> (callback, secret)
+        self.verified = asyncio.Event()
+        self.url = None
+        self._runner = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/hub', self.handle_request)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = f'http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/hub'
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+    async def handle_request(self, request):
+        form = await request.post()
+        asyncio.create_task(self.verify(dict(form)))
+        return web.Response(status=202)
+
+    async def verify(self, form):
+        challenge = secrets.token_hex(8)
+        params = {
+            'hub.mode': form['hub.mode'],
+            'hub.topic': form['hub.topic'],
+            'hub.challenge': challenge,
+            'hub.lease_seconds': form.get('hub.lease_seconds', '3600'),
+        }
+        async with aiohttp.ClientSession() as session:
+            async with session.get(form['hub.callback'], params=params) as response:
+                if response.status == 200 and await response.text() == challenge:
+                    self.subscribers[form['hub.topic']] = (form['hub.callback'], form.get('hub.secret'))
+                    self.verified.set()
+
+    async def publish(self, topic, body, secret=None):
+        callback, real_secret = self.subscribers[topic]
+        signature = hmac.new((secret or real_secret).encode(), body, hashlib.sha256).hexdigest()
+        async with aiohttp.ClientSession() as session:
+            async with session.post(callback, data=body, headers={'X-Hub-Signature': f'sha256={signature}'}) as response:
+                return response.status
+
+
+@pytest_asyncio.fixture
+async def hub_and_subscriber():
+    pushed = asyncio.Queue()
+
+    async def on_push(topic, body):
+        await pushed.put((topic, body))
+
+    hub = StandInHub()
+    await hub.start()
+    subscriber = WebSubSubscriber(on_push, callback_base=None, host='127.0.0.1', port=0, lease_seconds=3600)
+    await subscriber.start()
+
+    yield hub, subscriber, pushed
+
+    await subscriber.stop()
+    await hub.stop()
+    await get_http_client().close()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_verify_and_receive_push(hub_and_subscriber):
+    """Test the full subscribe -> verify -> signed push flow"""
+    hub, subscriber, pushed = hub_and_subscriber
+
+    assert subscriber.needs_subscribe(TOPIC, hub.url)
+    assert await subscriber.subscribe(TOPIC, hub.url)
+    await asyncio.wait_for(hub.verified.wait(), timeout=5)
+
+    assert subscriber.is_active(TOPIC)
+    assert not subscriber.needs_subscribe(TOPIC, hub.url)
+
+    assert await hub.publish(TOPIC, FEED) == 202
+    topic, body = await asyncio.wait_for(pushed.get(), timeout=5)
+    assert topic == TOPIC and body == FEED
+    assert subscriber.get_stats()[TOPIC]['pushes'] == 1
+
+
+@pytest.mark.asyncio
+async def test_push_with_bad_signature_is_ignored(hub_and_subscriber):
+    """Test that pushes not signed with our secret never reach the pipeline"""
+    hub, subscriber, pushed = hub_and_subscriber
+
+    await subscriber.subscribe(TOPIC, hub.url)
+    await asyncio.wait_for(hub.verified.wait(), timeout=5)
+
+    assert await hub.publish(TOPIC, FEED, secret='forged') == 202
+    await asyncio.sleep(0.05)
+
+    assert pushed.empty()
+    assert subscriber.get_stats()[TOPIC]['rejected'] == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_challenge_is_refused(hub_and_subscriber):
+    """Test that verification for a topic we never asked for fails"""
+    hub, subscriber, pushed = hub_and_subscriber
+
+    params = {'hub.mode': 'subscribe', 'hub.topic': TOPIC, 'hub.challenge': 'abc'}
+    async with aiohttp.ClientSession() as session:
+        async with session.get(subscriber.callback_url(TOPIC), params=params) as response:
+            assert response.status == 404
+
+    assert not subscriber.is_active(TOPIC)
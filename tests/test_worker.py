@@ -0,0 +1,133 @@
+"""
+Unit tests for the ingestion worker and the SQLite outbox
+"""
+
+import asyncio
+import pytest
+from config import BotConfig as bot_config
+from database import Database
+from cogs.news.engine import Delivery
+from cogs.news.models import Article, PostPayload
+
+
+class FakeChannel:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, embed=None):
+        self.sent.append(embed)
+
+
+class FakeBot:
+    """Bot with one reachable channel (ID 10) that never becomes ready"""
+
+    def __init__(self):
+        self.channel = FakeChannel()
+        self.guilds = []
+
+    def get_channel(self, channel_id):
+        return self.channel if channel_id == 10 else None
+
+    async def wait_until_ready(self):
+        await asyncio.Event().wait()
+
+
+def _articles(*ids):
+    return [Article(id=i, title=f'Tin {i}', url=f'https://5phutcrypto.io/{i}', source='5 Phút Crypto') for i in ids]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    import cogs.news.pipeline as pipeline
+    import cogs.news.worker as worker
+    import cogs.news_cog as news_cog
+
+    db = Database(str(tmp_path / 'test.db'))
+    for module in (pipeline, worker, news_cog):
+        monkeypatch.setattr(module, 'get_database', lambda: db)
+    return db
+
+
+def test_post_payload_round_trip():
+    """Test that payloads survive the JSON outbox"""
+    payload = PostPayload(
+        guild_id=1, channel_id=10, source_key='glassnode',
+        article=_articles('a')[0], title='Tiêu đề', description='Mô tả'
+    )
+    assert PostPayload.from_dict(payload.to_dict()) == payload
+
+
+@pytest.mark.asyncio
+async def test_worker_queues_each_article_once(db):
+    """Test that queued articles are not prepared again by the next cycle"""
+    from cogs.news.worker import NewsWorker
+
+    worker = NewsWorker()
+    delivery = Delivery(guild_id=1, channel_id=10, source_key='5phutcrypto', is_vietnamese=True)
+
+    await worker.pipeline.deliver_articles(delivery, _articles('a', 'b'))
+    await worker.pipeline.deliver_articles(delivery, _articles('a', 'b', 'c'))
+
+    rows = db.get_pending_posts(10, max_attempts=3)
+    assert [row['article_id'] for row in rows] == ['a', 'b', 'c']
+    assert worker.queued == 3
+    assert db.get_outbox_stats(3)['pending'] == 3
+
+
+@pytest.mark.asyncio
+async def test_bot_posts_outbox_rows(db, monkeypatch):
+    """Test that the bot posts queued payloads and drops unreachable channels"""
+    from cogs.news.worker import NewsWorker
+    from cogs.news_cog import NewsCog
+
+    worker = NewsWorker()
+    await worker.pipeline.deliver_articles(
+        Delivery(guild_id=1, channel_id=10, source_key='5phutcrypto', is_vietnamese=True), _articles('a', 'b')
+    )
+    await worker.pipeline.deliver_articles(
+        Delivery(guild_id=2, channel_id=99, source_key='5phutcrypto', is_vietnamese=True), _articles('a')
+    )
+
+    monkeypatch.setattr(bot_config, 'INGEST_MODE', 'worker')
+    bot = FakeBot()
+    cog = NewsCog(bot)
+    try:
+        assert cog.pipeline is None
+        await cog.post_outbox_rows(db.get_pending_posts(10, max_attempts=3))
+    finally:
+        cog.outbox_poster.cancel()
+
+    assert [embed.title.split(' ', 1)[1] for embed in bot.channel.sent] == ['Tin a', 'Tin b']
+    assert db.is_article_posted(1, 'a', '5phutcrypto') and db.is_article_posted(1, 'b', '5phutcrypto')
+    stats = db.get_outbox_stats(3)
+    assert (stats['pending'], stats['posted'], stats['dropped']) == (0, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_guild_configs_are_cached_between_ticks(db, monkeypatch):
+    """Test that scheduler ticks reuse configs until a save invalidates them"""
+    from types import SimpleNamespace
+    from cogs.news_cog import NewsCog
+
+    monkeypatch.setattr(bot_config, 'INGEST_MODE', 'worker')
+    bot = FakeBot()
+    bot.guilds = [SimpleNamespace(id=1)]
+    cog = NewsCog(bot)
+    loads = []
+    real_load = cog.load_news_config
+
+    async def load(guild_id):
+        loads.append(guild_id)
+        return await real_load(guild_id)
+
+    cog.load_news_config = load
+    try:
+        await cog.guild_news_configs()
+        await cog.guild_news_configs()
+        assert loads == [1]
+
+        await cog.save_news_config({'glassnode_channel': 10}, 1)
+        assert (await cog.guild_news_configs())[1]['glassnode_channel'] == 10
+        assert loads == [1, 1]
+    finally:
+        cog.outbox_poster.cancel()
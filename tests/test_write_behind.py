@@ -0,0 +1,166 @@
+"""
+Unit tests for write-behind batching of posted marks and cache writes
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+import pytest
+from database import Database
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / 'test.db'), write_behind_interval=60)
+    yield db
+    db.close()
+
+
+def _count(db, sql):
+    with db.connect() as conn:
+        return conn.execute(sql).fetchone()[0]
+
+
+def test_posted_marks_commit_once_and_reads_see_them(db):
+    """Test that marks share one commit and dedup reads see them before it"""
+    commits = db.commits
+    for i in range(10):
+        db.mark_article_posted(1, f'a{i}', 'glassnode')
+    assert db.commits == commits
+    assert len(db.write_behind) == 10
+
+    # Reads use the buffered rows instead of flushing them
+    assert db.is_article_posted(1, 'a3', 'glassnode')
+    assert db.filter_unposted(1, 'glassnode', ['a1', 'new']) == ['new']
+    assert db.get_posted_articles(1, 'glassnode', limit=2) == ['a9', 'a8']
+    assert db.count_posted_keys() == 10
+    assert db.commits == commits
+
+    db.flush_writes()
+    assert db.commits == commits + 1
+    assert db.filter_unposted(1, 'glassnode', ['a1', 'new']) == ['new']
+
+
+def test_cache_hits_are_merged(db):
+    """Test that hits on one translation become one counter update"""
+    db.save_translation('h', 'text', 'văn bản')
+    assert db.get_translation('h') == 'văn bản'  # served from the buffer
+    db.flush_writes()
+
+    commits = db.commits
+    for _ in range(5):
+        assert db.get_translation('h') == 'văn bản'
+    assert db.get_translation('missing') is None
+    assert db.commits == commits
+
+    db.flush_writes()
+    assert db.commits == commits + 1
+    assert _count(db, "SELECT use_count FROM translation_cache WHERE text_hash = 'h'") == 1 + 6
+
+
+def _wait_for_flushes(db, flushes):
+    deadline = time.time() + 2
+    while db.write_behind.flushes < flushes and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_flushes_run_on_the_writer_thread(db):
+    """Test that queued flushes and reads never commit on a reader thread"""
+    import asyncio
+    import threading
+    threads = set()
+    real_flush = db.write_behind.flush
+
+    def flush():
+        threads.add(threading.current_thread().name)
+        return real_flush()
+
+    db.write_behind.flush = flush
+
+    async def cycle():
+        await db.aio.mark_article_posted(1, 'a', 'glassnode')
+        assert await db.aio.is_article_posted(1, 'a', 'glassnode')
+        assert await db.aio.filter_unposted(1, 'glassnode', ['a', 'b']) == ['b']
+        db.write_behind._request_flush()
+        await db.aio.run(lambda: None)  # queued behind the flush
+
+    asyncio.run(cycle())
+    assert db.write_behind.flushes == 1
+    assert threads and all(name.startswith('db-writer') for name in threads)
+
+
+def test_batch_size_and_interval_flush(tmp_path, monkeypatch):
+    """Test the early flush at max rows and the timer flush"""
+    from config import BotConfig as bot_config
+    monkeypatch.setattr(bot_config, 'DB_WRITE_BEHIND_MAX_ROWS', 3)
+    db = Database(str(tmp_path / 'test.db'), write_behind_interval=0.05)
+    try:
+        for i in range(3):
+            db.mark_article_posted(1, f'a{i}', 'glassnode')
+        _wait_for_flushes(db, 1)
+        assert len(db.write_behind) == 0
+
+        db.mark_article_posted(1, 'late', 'glassnode')
+        _wait_for_flushes(db, 2)
+        assert _count(db, "SELECT COUNT(*) FROM posted_articles") == 4
+    finally:
+        db.close()
+
+
+def test_failed_flush_keeps_rows(db, monkeypatch):
+    """Test that rows survive a failed flush and go out with the next one"""
+    db.mark_article_posted(1, 'a', 'glassnode')
+    db.get_translation('h')
+    real_connect = db.connect
+
+    def failing_connect():
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(db, 'connect', failing_connect)
+    with pytest.raises(sqlite3.OperationalError):
+        db.flush_writes()
+    assert len(db.write_behind) == 1
+    assert db.write_behind.get_stats()['failures'] == 1
+
+    monkeypatch.setattr(db, 'connect', real_connect)
+    assert db.is_article_posted(1, 'a', 'glassnode')
+
+
+def test_close_flushes(tmp_path):
+    """Test that shutdown commits what is buffered"""
+    path = str(tmp_path / 'test.db')
+    db = Database(path, write_behind_interval=60)
+    db.mark_article_posted(1, 'a', 'glassnode')
+    db.close()
+
+    assert Database(path, write_behind_interval=0).is_article_posted(1, 'a', 'glassnode')
+
+
+def test_write_through_when_disabled(tmp_path):
+    """Test that interval 0 keeps one commit per write"""
+    db = Database(str(tmp_path / 'test.db'), write_behind_interval=0)
+    commits = db.commits
+    db.mark_article_posted(1, 'a', 'glassnode')
+    db.save_translation('h', 'text', 'văn bản')
+    assert db.get_translation('h') == 'văn bản'
+    assert db.write_behind is None
+    assert db.commits == commits + 3
+
+
+def test_write_through_from_environment(tmp_path):
+    """Test that DB_WRITE_BEHIND_INTERVAL=0 turns the buffer off"""
+    code = (
+        "import sys\n"
+        "from database import Database\n"
+        "db = Database(sys.argv[1])\n"
+        "print(db.write_behind is None)\n"
+        "db.close()\n"
+    )
+    env = dict(os.environ, DB_WRITE_BEHIND_INTERVAL='0')
+    result = subprocess.run([sys.executable, '-c', code, str(tmp_path / 'test.db')],
+                            env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.split()[-1] == 'True'
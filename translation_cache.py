@@ -29,8 +29,14 @@ class TranslationCache:
     def get(self, text: str) -> Optional[str]:
         """Get cached translation"""
         text_hash = self._hash_text(text)
-        translation = self.db.get_translation(text_hash)
-        
+        return self._count(text_hash, self.db.get_translation(text_hash))
+    
+    async def get_async(self, text: str) -> Optional[str]:
+        """get() without blocking the event loop"""
+        text_hash = self._hash_text(text)
+        return self._count(text_hash, await self.db.aio.get_translation(text_hash))
+    
+    def _count(self, text_hash: str, translation: Optional[str]) -> Optional[str]:
         if translation:
             self.hit_count += 1
             logger.debug(f"Cache HIT for text hash {text_hash[:8]}...")
@@ -46,6 +52,12 @@ class TranslationCache:
         self.db.save_translation(text_hash, text, translation)
         logger.debug(f"Cached translation {text_hash[:8]}... ({len(text)} chars)")
     
+    async def set_async(self, text: str, translation: str):
+        """set() without blocking the event loop"""
+        text_hash = self._hash_text(text)
+        await self.db.aio.save_translation(text_hash, text, translation)
+        logger.debug(f"Cached translation {text_hash[:8]}... ({len(text)} chars)")
+    
     def get_stats(self) -> dict:
         """Get cache statistics"""
         total_requests = self.hit_count + self.miss_count
@@ -1,6 +1,11 @@
 """Utils package"""
 from .rate_limiter import get_rate_limiter, RateLimiter, MultiServiceRateLimiter
 from .helpers import retry_with_backoff, format_timestamp, truncate_text, rate_limiters
+from .http_client import get_http_client, HTTPClient
+from .response_cache import get_response_cache, ResponseCache
+from .host_scheduler import get_host_scheduler, HostScheduler
+from .circuit_breaker import get_circuit_breakers, CircuitBreakers
+from .retry import get_retry_policy, get_retry_stats, retry_deadline, RetryPolicy, RetryBudget
 
 __all__ = [
     'get_rate_limiter', 
@@ -9,5 +14,18 @@ __all__ = [
     'retry_with_backoff',
     'format_timestamp',
     'truncate_text',
-    'rate_limiters'
+    'rate_limiters',
+    'get_http_client',
+    'HTTPClient',
+    'get_response_cache',
+    'ResponseCache',
+    'get_host_scheduler',
+    'HostScheduler',
+    'get_circuit_breakers',
+    'CircuitBreakers',
+    'get_retry_policy',
+    'get_retry_stats',
+    'retry_deadline',
+    'RetryPolicy',
+    'RetryBudget'
 ]
@@ -0,0 +1,260 @@
+"""
+Circuit breakers per source and per feed host
+Failing upstreams are skipped without a request until their probe window
+"""
+
+import asyncio
+import functools
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+from database import get_database
+from .host_scheduler import host_of
+
+logger = get_logger('circuit_breaker')
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+HOST_PREFIX = 'host:'
+
+
+def breaker_keys(key: str, url: Optional[str] = None) -> Tuple[str, ...]:
+    """Breakers guarding one fetch: the feed/source itself and its host"""
+    host = host_of(url) if url else ''
+    return (key, HOST_PREFIX + host) if host else (key,)
+
+
+def is_host_failure(error: BaseException) -> bool:
+    """Whether an error says the host (not just one feed on it) is failing"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500 or error.status == 429
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+@dataclass
+class CircuitBreaker:
+    """State of one breaker"""
+
+    key: str
+    state: str = CLOSED
+    failures: List[float] = field(default_factory=list)  # time.time() of recent failures
+    opened_until: Optional[float] = None  # probe allowed from here on
+    open_seconds: Optional[float] = None  # length of the current open period
+    trips: int = 0
+    last_error: Optional[str] = None
+    probing: bool = False  # a half-open probe is in flight (not persisted)
+
+
+class CircuitBreakers:
+    """
+    Closed / open / half-open breakers keyed by source or 'host:<domain>'
+
+    - closed: requests pass; `threshold` failures within `window` seconds open
+      the breaker.
+    - open: requests fail fast until `opened_until`.
+    - half-open: one probe request passes. Success closes the breaker, failure
+      reopens it for twice as long (up to `max_open_seconds`).
+
+    A fetch is guarded by several breakers at once (acquire/record take all
+    keys); host breakers only count failures of the host itself (connection
+    errors, timeouts, 5xx, 429), so one broken feed does not block its
+    neighbours. State changes are persisted so an open circuit survives a
+    restart: preload() reads every stored breaker at startup and saves are
+    queued on the database writer thread, so the event loop never waits
+    for SQLite.
+    """
+
+    def __init__(
+        self,
+        threshold: int = bot_config.BREAKER_FAILURE_THRESHOLD,
+        window: float = bot_config.BREAKER_WINDOW,
+        open_seconds: float = bot_config.BREAKER_OPEN_SECONDS,
+        max_open_seconds: float = bot_config.BREAKER_MAX_OPEN_SECONDS,
+        db=None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.threshold = threshold
+        self.window = window
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self._db = db
+        self.clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._preloaded = False
+
+        # Statistics
+        self.fast_fails = 0
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = get_database()
+        return self._db
+
+    async def preload(self):
+        """Load every persisted breaker (startup), so get() no longer reads SQLite"""
+        if self._preloaded:
+            return
+        try:
+            rows = await self.db.aio.get_circuit_breakers(include_closed=True)
+        except Exception as e:
+            logger.error(f"Error loading circuit breakers, reading them on first use: {e}")
+            return
+        for row in rows:
+            self._breakers.setdefault(row['breaker_key'], self._from_row(row))
+        self._preloaded = True
+        logger.info(f"Loaded {len(rows)} circuit breakers")
+
+    @staticmethod
+    def _from_row(row: Dict) -> CircuitBreaker:
+        return CircuitBreaker(
+            key=row['breaker_key'],
+            state=row['state'],
+            failures=row['failures'],
+            opened_until=row['opened_until'],
+            open_seconds=row['open_seconds'],
+            trips=row['trips'] or 0,
+            last_error=row['last_error'],
+        )
+
+    def get(self, key: str) -> CircuitBreaker:
+        """Breaker for a key (read from SQLite on first use unless preloaded)"""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            row = None if self._preloaded else self.db.get_circuit_breaker(key)
+            breaker = self._from_row(row) if row else CircuitBreaker(key=key)
+            self._breakers[key] = breaker
+        return breaker
+
+    def _blocked(self, breaker: CircuitBreaker, now: float) -> bool:
+        if breaker.state == OPEN:
+            return now < breaker.opened_until
+        return breaker.state == HALF_OPEN and breaker.probing
+
+    def acquire(self, keys: Iterable[str]) -> bool:
+        """
+        Whether a request guarded by these breakers may go out
+
+        Open breakers whose window has passed turn half-open and the caller
+        becomes their probe; it must then call record() or release().
+        """
+        now = self.clock()
+        breakers = [self.get(key) for key in keys]
+        if any(self._blocked(breaker, now) for breaker in breakers):
+            self.fast_fails += 1
+            return False
+
+        for breaker in breakers:
+            if breaker.state == OPEN:
+                breaker.state = HALF_OPEN
+                self._save(breaker)
+                logger.info(f"Circuit half-open for {breaker.key}: sending probe")
+            if breaker.state == HALF_OPEN:
+                breaker.probing = True
+        return True
+
+    def release(self, keys: Iterable[str]):
+        """Give back a probe slot without a result (e.g. the fetch was cancelled)"""
+        for key in keys:
+            self.get(key).probing = False
+
+    def is_probing(self, keys: Iterable[str]) -> bool:
+        """Whether any of the breakers is half-open (callers should not retry)"""
+        return any(self.get(key).state == HALF_OPEN for key in keys)
+
+    def record(self, keys: Iterable[str], error: Optional[BaseException] = None):
+        """Record the outcome of a request guarded by these breakers"""
+        for key in keys:
+            failed = error is not None and (not key.startswith(HOST_PREFIX) or is_host_failure(error))
+            if failed:
+                self._failure(self.get(key), error)
+            else:
+                self._success(self.get(key))
+
+    def _success(self, breaker: CircuitBreaker):
+        breaker.probing = False
+        if breaker.state == CLOSED and not breaker.failures:
+            return  # nothing to persist on the hot path
+
+        if breaker.state != CLOSED:
+            logger.info(f"Circuit closed for {breaker.key}")
+        breaker.state = CLOSED
+        breaker.failures = []
+        breaker.opened_until = None
+        breaker.open_seconds = None
+        self._save(breaker)
+
+    def _failure(self, breaker: CircuitBreaker, error: BaseException):
+        now = self.clock()
+        breaker.probing = False
+        breaker.last_error = f"{type(error).__name__}: {error}"[:200]
+
+        if breaker.state == HALF_OPEN:
+            self._open(breaker, now, min((breaker.open_seconds or self.open_seconds) * 2, self.max_open_seconds))
+        else:
+            breaker.failures = [t for t in breaker.failures if now - t < self.window] + [now]
+            if len(breaker.failures) >= self.threshold:
+                self._open(breaker, now, self.open_seconds)
+        self._save(breaker)
+
+    def _open(self, breaker: CircuitBreaker, now: float, seconds: float):
+        breaker.state = OPEN
+        breaker.open_seconds = seconds
+        breaker.opened_until = now + seconds
+        breaker.failures = []
+        breaker.trips += 1
+        logger.warning(f"Circuit open for {breaker.key} for {seconds:.0f}s: {breaker.last_error}")
+
+    def _save(self, breaker: CircuitBreaker):
+        """Queue the breaker's state on the writer thread (saves apply in order)"""
+        future = self.db.aio.submit(
+            self.db.save_circuit_breaker,
+            breaker.key, breaker.state, list(breaker.failures), breaker.opened_until,
+            breaker.open_seconds, breaker.trips, breaker.last_error
+        )
+        future.add_done_callback(functools.partial(self._saved, breaker.key))
+
+    @staticmethod
+    def _saved(key: str, future):
+        if future.exception() is not None:
+            logger.error(f"Error saving circuit breaker {key}: {future.exception()}")
+
+    def retry_after(self, keys: Iterable[str]) -> float:
+        """Seconds until every blocking breaker allows a probe"""
+        now = self.clock()
+        return max(
+            [max(self.get(key).opened_until - now, 0.0) for key in keys if self.get(key).state == OPEN],
+            default=0.0
+        )
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Breakers that are not closed, with their probe times"""
+        now = self.clock()
+        return {
+            key: {
+                'state': breaker.state,
+                'retry_in': round(max(breaker.opened_until - now, 0.0)) if breaker.opened_until else 0,
+                'trips': breaker.trips,
+                'last_error': breaker.last_error,
+            }
+            for key, breaker in sorted(self._breakers.items())
+            if breaker.state != CLOSED
+        }
+
+
+# Global circuit breakers instance
+_circuit_breakers: Optional[CircuitBreakers] = None
+
+
+def get_circuit_breakers() -> CircuitBreakers:
+    """Get global circuit breakers instance (singleton)"""
+    global _circuit_breakers
+
+    if _circuit_breakers is None:
+        _circuit_breakers = CircuitBreakers()
+
+    return _circuit_breakers
@@ -5,10 +5,12 @@ Includes retry logic with exponential backoff
 
 import asyncio
 import functools
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 from datetime import datetime
 import pytz
 
+from .retry import RetryPolicy
+
 # Import logger
 try:
     from logger_config import get_logger
@@ -22,16 +24,23 @@ def retry_with_backoff(
     max_retries: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
-    exponential_base: float = 2.0
+    exponential_base: float = 2.0,
+    retryable: Optional[Callable[[BaseException], bool]] = None
 ) -> Callable:
     """
     Decorator for retrying async functions with exponential backoff
     
+    Thin wrapper around utils.retry.RetryPolicy: delays use full jitter,
+    honor Retry-After, draw on the shared retry budget and stop near the
+    caller's retry_deadline. Retries every exception unless `retryable`
+    says otherwise.
+    
     Args:
-        max_retries: Maximum number of retry attempts
-        base_delay: Initial delay in seconds
+        max_retries: Maximum number of attempts
+        base_delay: Initial delay cap in seconds
         max_delay: Maximum delay between retries
-        exponential_base: Base for exponential backoff calculation
+        exponential_base: Growth of the delay cap per attempt
+        retryable: Predicate deciding which errors are retried
     
     Example:
         @retry_with_backoff(max_retries=3, base_delay=1)
@@ -39,40 +48,20 @@ def retry_with_backoff(
             ...
     """
     def decorator(func: Callable) -> Callable:
+        policy = RetryPolicy(
+            func.__name__,
+            max_attempts=max_retries,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            multiplier=exponential_base,
+            retryable=retryable,
+        )
+        
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
-            
-            for attempt in range(max_retries):
-                try:
-                    result = await func(*args, **kwargs)
-                    
-                    # Log success if it's a retry
-                    if attempt > 0:
-                        logger.info(f"✅ {func.__name__} succeeded on attempt {attempt + 1}/{max_retries}")
-                    
-                    return result
-                    
-                except Exception as e:
-                    last_exception = e
-                    
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base ** attempt), max_delay)
-                    
-                    if attempt < max_retries - 1:
-                        logger.warning(
-                            f"⚠️ {func.__name__} failed (attempt {attempt + 1}/{max_retries}): {str(e)[:100]}. "
-                            f"Retrying in {delay:.1f}s..."
-                        )
-                        await asyncio.sleep(delay)
-                    else:
-                        logger.error(
-                            f"❌ {func.__name__} failed after {max_retries} attempts: {str(e)[:200]}"
-                        )
-            
-            # All retries exhausted, raise the last exception
-            raise last_exception
+            return await policy.call(func, *args, **kwargs)
         
+        wrapper.retry_policy = policy
         return wrapper
     return decorator
 
@@ -0,0 +1,178 @@
+"""
+Per-host politeness scheduler
+Limits concurrent requests and request rate per domain, shared by every
+fetcher and the health checker
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+
+logger = get_logger('host_scheduler')
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """Politeness limits for one host"""
+
+    concurrency: int  # requests in flight at once
+    min_interval: float  # seconds between request starts
+
+
+def parse_host_overrides(spec: str) -> Dict[str, HostPolicy]:
+    """
+    Parse 'host=concurrency:interval' pairs separated by commas
+
+    Example: 'cointelegraph.com=1:2,api.santiment.net=1:0.5'
+    """
+    overrides = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        try:
+            host, limits = item.split('=', 1)
+            concurrency, interval = limits.split(':', 1)
+            policy = HostPolicy(concurrency=int(concurrency), min_interval=float(interval))
+        except ValueError:
+            raise ValueError(f"Invalid host override '{item}' (expected host=concurrency:interval)")
+        if policy.concurrency < 1 or policy.min_interval < 0:
+            raise ValueError(f"Invalid host override '{item}' (concurrency >= 1, interval >= 0)")
+        overrides[host.strip().lower()] = policy
+    return overrides
+
+
+def host_of(url: str) -> str:
+    """Scheduling key of a URL: lowercased host without 'www.'"""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class _HostState:
+    def __init__(self, policy: HostPolicy):
+        self.policy = policy
+        self.semaphore = asyncio.Semaphore(policy.concurrency)
+        self.next_start = 0.0  # time.monotonic() before which no request may start
+
+        # Statistics
+        self.active = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.requests = 0
+        self.waited = 0  # requests that had to wait for a slot or the interval
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class HostScheduler:
+    """
+    Concurrency and rate limits keyed by host
+
+    slot(url) waits for one of the host's `concurrency` slots, then for the
+    host's `min_interval` since the previous request start. Start times are
+    reserved before sleeping, so queued requests leave in arrival order.
+    Hosts match an override when they equal it or are a subdomain of it;
+    the longest matching override wins.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = bot_config.HOST_CONCURRENCY,
+        min_interval: float = bot_config.HOST_MIN_INTERVAL,
+        overrides: Optional[Dict[str, HostPolicy]] = None
+    ):
+        self.default = HostPolicy(concurrency=concurrency, min_interval=min_interval)
+        self.overrides = parse_host_overrides(bot_config.HOST_OVERRIDES) if overrides is None else overrides
+        self._hosts: Dict[str, _HostState] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def policy_for(self, host: str) -> HostPolicy:
+        """Limits for a host (most specific override, else the default)"""
+        best = None
+        for domain, policy in self.overrides.items():
+            if host == domain or host.endswith('.' + domain):
+                if best is None or len(domain) > len(best[0]):
+                    best = (domain, policy)
+        return best[1] if best else self.default
+
+    def _state(self, host: str) -> _HostState:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphores are bound to a loop (scripts/tests may run several)
+            self._loop = loop
+            self._hosts = {}
+
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.policy_for(host))
+        return state
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a politeness slot for one request to url's host"""
+        state = self._state(host_of(url))
+        queued_at = time.monotonic()
+
+        state.queued += 1
+        state.max_queued = max(state.max_queued, state.queued)
+        try:
+            await state.semaphore.acquire()
+            try:
+                now = time.monotonic()
+                start = max(now, state.next_start)
+                state.next_start = start + state.policy.min_interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            except BaseException:
+                state.semaphore.release()
+                raise
+        finally:
+            state.queued -= 1
+
+        wait = time.monotonic() - queued_at
+        state.requests += 1
+        state.total_wait += wait
+        state.max_wait = max(state.max_wait, wait)
+        if wait > 0.001:
+            state.waited += 1
+
+        state.active += 1
+        try:
+            yield
+        finally:
+            state.active -= 1
+            state.semaphore.release()
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Per-host limits, queue depth and wait times"""
+        return {
+            host: {
+                'concurrency': state.policy.concurrency,
+                'min_interval': state.policy.min_interval,
+                'active': state.active,
+                'queued': state.queued,
+                'max_queued': state.max_queued,
+                'requests': state.requests,
+                'waited': state.waited,
+                'avg_wait': round(state.total_wait / state.requests, 3) if state.requests else 0.0,
+                'max_wait': round(state.max_wait, 3),
+            }
+            for host, state in sorted(self._hosts.items())
+        }
+
+
+# Global host scheduler instance
+_host_scheduler: Optional[HostScheduler] = None
+
+
+def get_host_scheduler() -> HostScheduler:
+    """Get global host scheduler instance (singleton)"""
+    global _host_scheduler
+
+    if _host_scheduler is None:
+        _host_scheduler = HostScheduler()
+
+    return _host_scheduler
@@ -0,0 +1,154 @@
+"""
+Shared HTTP client
+One long-lived, pooled aiohttp session for every fetcher and the health checker
+"""
+
+import asyncio
+import aiohttp
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+
+logger = get_logger('http_client')
+
+
+class HTTPClient:
+    """
+    Process-wide pooled aiohttp session
+
+    The session keeps TCP/TLS connections alive between requests, caches DNS
+    lookups and limits connections per host. It is started by the bot in
+    setup_hook and closed on shutdown; scripts and tests get a lazily created
+    session on first use.
+    """
+
+    def __init__(
+        self,
+        limit: int = bot_config.HTTP_POOL_LIMIT,
+        limit_per_host: int = bot_config.HTTP_LIMIT_PER_HOST,
+        dns_cache_ttl: int = bot_config.HTTP_DNS_CACHE_TTL,
+        keepalive_timeout: float = bot_config.HTTP_KEEPALIVE_TIMEOUT,
+        timeout: float = bot_config.REQUEST_TIMEOUT
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Statistics
+        self.total_requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.tls_handshakes = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+
+    async def start(self):
+        """Create the pooled session (idempotent)"""
+        self._create_session()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared session; created on first use if start() was not called"""
+        self._create_session()
+        return self._session
+
+    def _create_session(self):
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return
+
+        # A session is bound to the loop it was created on (scripts/tests may run several loops)
+        self._loop = loop
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=self.timeout,
+                connect=bot_config.HTTP_CONNECT_TIMEOUT,
+                sock_read=bot_config.HTTP_READ_TIMEOUT,
+            ),
+            headers={'User-Agent': bot_config.USER_AGENT},
+            auto_decompress=True,  # Accept-Encoding gzip/deflate (br when brotli is installed)
+            trace_configs=[self._build_trace_config()],
+        )
+        logger.info(
+            f"HTTP client started: limit={self.limit}, per_host={self.limit_per_host}, "
+            f"dns_ttl={self.dns_cache_ttl}s, keepalive={self.keepalive_timeout}s"
+        )
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """Trace hooks feeding the connection reuse / TLS handshake counters"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx: SimpleNamespace, params):
+            self.total_requests += 1
+            ctx.is_tls = params.url.scheme == 'https'
+
+        async def on_connection_create_end(session, ctx: SimpleNamespace, params):
+            self.new_connections += 1
+            if getattr(ctx, 'is_tls', False):
+                self.tls_handshakes += 1
+
+        async def on_connection_reuseconn(session, ctx: SimpleNamespace, params):
+            self.reused_connections += 1
+
+        async def on_dns_cache_hit(session, ctx: SimpleNamespace, params):
+            self.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx: SimpleNamespace, params):
+            self.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    async def close(self):
+        """Close the session and all pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("HTTP client closed")
+        self._session = None
+
+    def get_stats(self) -> Dict:
+        """Get connection pool statistics"""
+        connections = self.new_connections + self.reused_connections
+        return {
+            'total_requests': self.total_requests,
+            'new_connections': self.new_connections,
+            'reused_connections': self.reused_connections,
+            'reuse_rate': round(self.reused_connections / connections * 100, 1) if connections else 0,
+            'tls_handshakes': self.tls_handshakes,
+            'dns_cache_hits': self.dns_cache_hits,
+            'dns_cache_misses': self.dns_cache_misses,
+        }
+
+
+# Global HTTP client instance
+_http_client: Optional[HTTPClient] = None
+
+
+def get_http_client() -> HTTPClient:
+    """Get global HTTP client instance (singleton)"""
+    global _http_client
+
+    if _http_client is None:
+        _http_client = HTTPClient()
+
+    return _http_client
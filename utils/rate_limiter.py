@@ -46,6 +46,7 @@ class RateLimiter:
         Returns: wait time in seconds (0 if no wait needed)
         """
         now = time()
+        wait_time = 0.0
         
         # Remove expired calls from tracking
         while self.calls and self.calls[0] < now - self.period:
@@ -72,7 +73,24 @@ class RateLimiter:
         self.calls.append(now)
         self.total_calls += 1
         
-        return 0.0 if len(self.calls) < self.max_calls else wait_time
+        return max(wait_time, 0.0)
+    
+    def try_acquire(self) -> bool:
+        """
+        Record a call only if the budget allows it right now
+        Returns: True if the call may be made (never waits)
+        """
+        now = time()
+        
+        while self.calls and self.calls[0] < now - self.period:
+            self.calls.popleft()
+        
+        if len(self.calls) >= self.max_calls:
+            return False
+        
+        self.calls.append(now)
+        self.total_calls += 1
+        return True
     
     def get_stats(self) -> Dict:
         """Get rate limiter statistics"""
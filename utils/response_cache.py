@@ -0,0 +1,169 @@
+"""
+Feed response cache
+TTL-bounded, size-limited LRU cache of feed bodies with single-flight fetches
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+
+logger = get_logger('response_cache')
+
+Loader = Callable[[], Awaitable[Optional[bytes]]]
+
+
+@dataclass
+class CachedResponse:
+    """One cached response body"""
+
+    body: bytes
+    fetched_at: float  # time.monotonic() of the download
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class ResponseCache:
+    """
+    Cache feed bodies by URL in front of every feed fetch
+
+    - Entries expire after `ttl` seconds; callers may ask for fresher data
+      with `max_age` (the news loop does, so the cache never delays posts).
+    - Concurrent callers for the same URL share one in-flight request.
+    - The least recently used entries are evicted beyond `max_entries`
+      entries or `max_bytes` total body size.
+
+    A loader returning None (e.g. 304 Not Modified) is passed to every waiting
+    caller but never cached; loader exceptions propagate and are not cached.
+    """
+
+    def __init__(
+        self,
+        ttl: float = bot_config.RSS_CACHE_TTL,
+        max_entries: int = bot_config.RSS_CACHE_MAX_ENTRIES,
+        max_bytes: int = bot_config.RSS_CACHE_MAX_BYTES
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._size = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # callers that joined an in-flight request
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get_or_fetch(self, url: str, loader: Loader, max_age: Optional[float] = None) -> Optional[bytes]:
+        """
+        Get a cached body for url, or run loader once for all concurrent callers
+
+        Args:
+            url: Cache key
+            loader: Coroutine function downloading the body
+            max_age: Oldest acceptable entry in seconds (defaults to ttl)
+        """
+        max_age = self.ttl if max_age is None else min(max_age, self.ttl)
+
+        entry = self._entries.get(url)
+        if entry is not None:
+            if entry.age <= max_age:
+                self._entries.move_to_end(url)
+                self.hits += 1
+                return entry.body
+            if entry.age > self.ttl:
+                self._remove(url)
+                self.expirations += 1
+
+        in_flight = self._in_flight.get(url)
+        if in_flight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(in_flight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[url] = future
+
+        try:
+            body = await loader()
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # mark retrieved when nobody else is waiting
+            else:
+                future.cancel()
+            raise
+        else:
+            if body is not None:
+                self._store(url, body)
+            future.set_result(body)
+            return body
+        finally:
+            self._in_flight.pop(url, None)
+
+    def _store(self, url: str, body: bytes):
+        """Insert an entry and evict least recently used ones over the limits"""
+        if url in self._entries:
+            self._remove(url)
+
+        if len(body) > self.max_bytes:
+            return
+
+        self._entries[url] = CachedResponse(body=body, fetched_at=time.monotonic())
+        self._size += len(body)
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, url: str):
+        entry = self._entries.pop(url)
+        self._size -= len(entry.body)
+
+    def invalidate(self, url: str):
+        """Drop a cached entry (e.g. after a feed URL was edited)"""
+        if url in self._entries:
+            self._remove(url)
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+        self._size = 0
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            'entries': len(self._entries),
+            'bytes': self._size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': round((self.hits + self.coalesced) / lookups * 100, 1) if lookups else 0,
+        }
+
+
+# Global response cache instance
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get global response cache instance (singleton)"""
+    global _response_cache
+
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+
+    return _response_cache
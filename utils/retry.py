@@ -0,0 +1,270 @@
+"""
+Retry policy engine
+Full-jitter exponential backoff, Retry-After support, a shared retry budget
+and caller deadlines, with per-policy metrics
+"""
+
+import asyncio
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+
+import aiohttp
+
+from logger_config import get_logger
+from config import BotConfig as bot_config
+
+logger = get_logger('retry')
+
+# Absolute loop.time() by which the current caller needs an answer (None = no deadline)
+_deadline: ContextVar[Optional[float]] = ContextVar('retry_deadline', default=None)
+
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+@contextmanager
+def retry_deadline(deadline: Optional[float]) -> Iterator[None]:
+    """Stop retries started in this context (and tasks created from it) near `deadline`"""
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def is_transient(error: BaseException) -> bool:
+    """Errors worth retrying: timeouts, connection failures, 408/425/429/5xx"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRYABLE_STATUS
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Server-requested delay from a Retry-After header (seconds or HTTP date)"""
+    headers = getattr(error, 'headers', None)
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """
+    Token bucket shared by all retry policies
+
+    Every first attempt deposits `ratio` tokens and every retry withdraws
+    one, so retries stay below roughly `ratio` of total traffic. The bucket
+    starts full with `max_tokens` to allow bursts of retries after a quiet
+    period.
+    """
+
+    def __init__(
+        self,
+        ratio: float = bot_config.RETRY_BUDGET_RATIO,
+        max_tokens: float = bot_config.RETRY_BUDGET_MAX_TOKENS
+    ):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+        # Statistics
+        self.withdrawn = 0
+        self.rejected = 0
+
+    def deposit(self):
+        self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+    def try_withdraw(self) -> bool:
+        if self.tokens >= 1:
+            self.tokens -= 1
+            self.withdrawn += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def get_stats(self) -> Dict:
+        return {
+            'tokens': round(self.tokens, 2),
+            'max_tokens': self.max_tokens,
+            'ratio': self.ratio,
+            'withdrawn': self.withdrawn,
+            'rejected': self.rejected,
+        }
+
+
+class RetryPolicy:
+    """
+    Retry an async call with full-jitter exponential backoff
+
+    A failed attempt is retried only when:
+    - `retryable(error)` says the error is transient,
+    - attempts remain,
+    - the delay fits before the caller's deadline (see retry_deadline),
+    - and the shared RetryBudget has a token.
+
+    The delay is uniform in [0, min(max_delay, base_delay * multiplier**n)]
+    (full jitter), raised to the server's Retry-After when one is sent; a
+    Retry-After beyond max_delay ends the retries.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_attempts: int = bot_config.MAX_RETRIES,
+        base_delay: float = bot_config.RETRY_BASE_DELAY,
+        max_delay: float = bot_config.RETRY_MAX_DELAY,
+        multiplier: float = 2.0,
+        retryable: Optional[Callable[[BaseException], bool]] = is_transient,
+        budget: Optional[RetryBudget] = None,
+        deadline_margin: float = bot_config.RETRY_DEADLINE_MARGIN,
+        rng: Optional[random.Random] = None
+    ):
+        self.name = name
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.retryable = retryable
+        self._budget = budget
+        self.deadline_margin = deadline_margin
+        self.rng = rng or random.Random()
+
+        # Statistics
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.recovered = 0  # calls that succeeded after at least one retry
+        self.failures = 0  # calls that ended with an error
+        self.not_retryable = 0
+        self.budget_stops = 0
+        self.deadline_stops = 0
+        self.retry_after_waits = 0
+        self.total_delay = 0.0
+
+    @property
+    def budget(self) -> RetryBudget:
+        return self._budget if self._budget is not None else get_retry_budget()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (0-based)"""
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * self.multiplier ** attempt))
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs) under this policy; re-raises the last error"""
+        loop = asyncio.get_running_loop()
+        self.calls += 1
+        self.budget.deposit()
+
+        attempt = 0
+        while True:
+            self.attempts += 1
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, loop.time())
+                if delay is None:
+                    self.failures += 1
+                    raise
+                logger.warning(
+                    f"{self.name}: attempt {attempt + 1}/{self.max_attempts} failed: {str(e)[:100]}. "
+                    f"Retrying in {delay:.1f}s"
+                )
+                self.retries += 1
+                self.total_delay += delay
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                if attempt:
+                    self.recovered += 1
+                return result
+
+    def _retry_delay(self, error: Exception, attempt: int, now: float) -> Optional[float]:
+        """Delay before the next attempt, or None to give up"""
+        if self.retryable is not None and not self.retryable(error):
+            self.not_retryable += 1
+            return None
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        delay = self.backoff(attempt)
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            delay = max(delay, retry_after)
+            self.retry_after_waits += 1
+
+        deadline = _deadline.get()
+        if deadline is not None and now + delay + self.deadline_margin > deadline:
+            self.deadline_stops += 1
+            return None
+
+        if not self.budget.try_withdraw():
+            self.budget_stops += 1
+            logger.warning(f"{self.name}: retry budget exhausted, not retrying: {str(error)[:100]}")
+            return None
+
+        return delay
+
+    def get_stats(self) -> Dict:
+        return {
+            'calls': self.calls,
+            'attempts': self.attempts,
+            'retries': self.retries,
+            'recovered': self.recovered,
+            'failures': self.failures,
+            'not_retryable': self.not_retryable,
+            'budget_stops': self.budget_stops,
+            'deadline_stops': self.deadline_stops,
+            'retry_after_waits': self.retry_after_waits,
+            'total_delay': round(self.total_delay, 1),
+        }
+
+
+# Global retry budget and named policies
+_retry_budget: Optional[RetryBudget] = None
+_retry_policies: Dict[str, RetryPolicy] = {}
+
+POLICY_DEFAULTS = {
+    'fetch': {'base_delay': 2},
+    # deep-translator raises its own exception types; retry any failure
+    'translate': {'base_delay': 1, 'retryable': None},
+}
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get global retry budget instance (singleton)"""
+    global _retry_budget
+
+    if _retry_budget is None:
+        _retry_budget = RetryBudget()
+
+    return _retry_budget
+
+
+def get_retry_policy(name: str, **kwargs) -> RetryPolicy:
+    """Get a named retry policy, created with POLICY_DEFAULTS/kwargs on first use"""
+    policy = _retry_policies.get(name)
+    if policy is None:
+        policy = _retry_policies[name] = RetryPolicy(name, **{**POLICY_DEFAULTS.get(name, {}), **kwargs})
+    return policy
+
+
+def get_retry_stats() -> Dict[str, Dict]:
+    """Metrics of every named policy and the shared budget"""
+    stats = {name: policy.get_stats() for name, policy in sorted(_retry_policies.items())}
+    stats['budget'] = get_retry_budget().get_stats()
+    return stats
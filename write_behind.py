@@ -0,0 +1,211 @@
+"""
+Write-behind buffer for Database
+Posted-article marks, translation cache saves and cache hit counters are
+collected in memory and written in one transaction per interval or batch,
+instead of a commit (and fsync) each
+"""
+
+import atexit
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from logger_config import get_logger
+
+logger = get_logger('write_behind')
+
+PostedRow = Tuple[int, str, str, Optional[str], Optional[str]]  # guild_id, article_id, source, title, url
+
+
+class WriteBehindBuffer:
+    """
+    Coalesce small writes into periodic batched transactions
+
+    - Rows are flushed when `max_rows` are buffered or `interval` seconds
+      after the first buffered row, always as a job on the database's writer
+      thread (db.aio), and at Database.close()/interpreter exit.
+    - Hit counters merge in memory: 50 hits on one translation become one
+      `use_count = use_count + 50` update.
+    - Buffered rows stay visible to reads (pending_posted(),
+      pending_translation()) until their flush commits, so reads never
+      flush or wait for the write lock.
+    - A failed flush puts its rows back for the next attempt.
+    """
+
+    def __init__(self, db, interval: float, max_rows: int):
+        self.db = db
+        self.interval = interval
+        self.max_rows = max_rows
+
+        self._lock = threading.Lock()  # guards the buffers
+        self._flush_lock = threading.Lock()  # one flush at a time
+        self._posted: List[PostedRow] = []
+        self._translations: Dict[str, Tuple[str, str]] = {}  # text_hash -> (original, translated)
+        self._uses: Dict[str, int] = {}  # text_hash -> cache hits not yet counted
+        # Rows of the flush in progress (still visible to reads until it commits)
+        self._flushing_posted: List[PostedRow] = []
+        self._flushing: Dict[str, Tuple[str, str]] = {}
+        self._flushing_uses: Dict[str, int] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._flush_queued = False
+        self._closed = False
+
+        # Statistics
+        self.buffered = 0  # writes accepted (each was a commit before)
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.failures = 0
+        self.last_flush_seconds = 0.0
+
+        ref = weakref.ref(self)
+        atexit.register(lambda: ref() and ref().flush())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._posted) + len(self._translations) + len(self._uses)
+
+    def add_posted(self, row: PostedRow):
+        with self._lock:
+            self._posted.append(row)
+            self.buffered += 1
+        self._added()
+
+    def add_translation(self, text_hash: str, original: str, translated: str):
+        with self._lock:
+            self._translations[text_hash] = (original, translated)
+            self.buffered += 1
+        self._added()
+
+    def add_use(self, text_hash: str):
+        with self._lock:
+            self._uses[text_hash] = self._uses.get(text_hash, 0) + 1
+            self.buffered += 1
+        self._added()
+
+    def pending_translation(self, text_hash: str) -> Optional[str]:
+        """Translated text saved but not yet committed"""
+        with self._lock:
+            entry = self._translations.get(text_hash) or self._flushing.get(text_hash)
+        return entry[1] if entry else None
+
+    def pending_posted(self) -> List[PostedRow]:
+        """Posted marks not yet committed, oldest first"""
+        with self._lock:
+            return self._flushing_posted + self._posted
+
+    def pending_cache_counts(self) -> Tuple[int, int]:
+        """(translations, cache hits) not yet committed"""
+        with self._lock:
+            translations = len(self._translations.keys() | self._flushing.keys())
+            uses = sum(self._uses.values()) + sum(self._flushing_uses.values())
+        return translations, uses
+
+    def _added(self):
+        if len(self) < self.max_rows:
+            self._schedule()
+        else:
+            self._request_flush()
+
+    def _schedule(self):
+        with self._lock:
+            if self._timer is None and not self._closed:
+                self._timer = threading.Timer(self.interval, self._timer_fired)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _timer_fired(self):
+        with self._lock:
+            self._timer = None
+        self._request_flush()
+
+    def _request_flush(self):
+        """Queue one flush on the writer thread (inline once closed)"""
+        with self._lock:
+            if self._flush_queued:
+                return
+            closed = self._closed
+            self._flush_queued = not closed
+        if closed:
+            self._queued_flush()
+        else:
+            self.db.aio.submit(self._queued_flush)
+
+    def _queued_flush(self):
+        with self._lock:
+            self._flush_queued = False
+        try:
+            self.flush()
+        except Exception:
+            pass  # logged by flush(); the rows stay buffered and the timer is rescheduled
+
+    def flush(self) -> int:
+        """Write everything buffered in one transaction; returns the rows written"""
+        with self._flush_lock:
+            with self._lock:
+                posted, self._posted = self._posted, []
+                translations, self._translations = self._translations, {}
+                uses, self._uses = self._uses, {}
+                self._flushing_posted, self._flushing, self._flushing_uses = posted, translations, uses
+            rows = len(posted) + len(translations) + len(uses)
+            if not rows:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                with self.db.connect() as conn:
+                    conn.executemany('''
+                        INSERT OR IGNORE INTO posted_articles (guild_id, article_id, source, title, url)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', posted)
+                    conn.executemany('''
+                        INSERT OR REPLACE INTO translation_cache (text_hash, original_text, translated_text)
+                        VALUES (?, ?, ?)
+                    ''', [(text_hash, original, translated) for text_hash, (original, translated) in translations.items()])
+                    conn.executemany('''
+                        UPDATE translation_cache
+                        SET last_used = CURRENT_TIMESTAMP, use_count = use_count + ?
+                        WHERE text_hash = ?
+                    ''', [(count, text_hash) for text_hash, count in uses.items()])
+            except Exception as e:
+                self.failures += 1
+                logger.error(f"Write-behind flush of {rows} rows failed, retrying later: {e}")
+                with self._lock:
+                    self._posted[:0] = posted
+                    self._translations = {**translations, **self._translations}
+                    for text_hash, count in uses.items():
+                        self._uses[text_hash] = self._uses.get(text_hash, 0) + count
+                    self._flushing_posted, self._flushing, self._flushing_uses = [], {}, {}
+                self._schedule()
+                raise
+            finally:
+                self.last_flush_seconds = time.perf_counter() - started
+
+            with self._lock:
+                self._flushing_posted, self._flushing, self._flushing_uses = [], {}, {}
+            self.flushes += 1
+            self.rows_flushed += rows
+            logger.debug(
+                f"Write-behind flush: {len(posted)} posted, {len(translations)} translations, "
+                f"{len(uses)} hit counters in {self.last_flush_seconds * 1000:.1f}ms"
+            )
+            return rows
+
+    def close(self):
+        """Stop the timer and flush what is left; later rows flush on the caller's thread"""
+        with self._lock:
+            self._closed = True
+            timer, self._timer = self._timer, None
+        if timer:
+            timer.cancel()
+        self.flush()
+
+    def get_stats(self) -> Dict:
+        return {
+            'pending': len(self),
+            'buffered': self.buffered,
+            'flushes': self.flushes,
+            'rows_flushed': self.rows_flushed,
+            'failures': self.failures,
+            'last_flush_ms': round(self.last_flush_seconds * 1000, 2),
+        }